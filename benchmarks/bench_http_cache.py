@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: repeated runs with and without the conditional request cache
+
+Seeds the mock GitHub server with projects and issues, then repeats the
+reads a weekly run makes (listing the projects and fetching issues) twice,
+once per client: one without the response cache and one with it. For the
+second pass it reports time and the rate limit charged; with the cache every
+read should come back as an uncharged 304 with the same result. On localhost
+the times are close: the mock does not model transfer time, so the saving
+to look at is the rate limit.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from github_client import GitHubClient  # noqa: E402
+from http_cache import ResponseCache  # noqa: E402
+from mock_github_server import MockGitHubServer, sample_issue_body  # noqa: E402
+from rate_limit import RateLimitScheduler  # noqa: E402
+
+OWNER, REPO = 'latinxinai', 'mentorship-2025'
+
+
+def weekly_reads(client, issues):
+    """The reads a run repeats: every project page, then each issue; returns what was read"""
+    projects = [project['id'] for project in client.paginate(f"/repos/{OWNER}/{REPO}/projects")]
+    titles = []
+    for number in range(1, issues + 1):
+        response = client.get(f"/repos/{OWNER}/{REPO}/issues/{number}")
+        response.raise_for_status()
+        titles.append(response.json()['title'])
+    return projects, titles
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the ETag response cache on repeated runs')
+    parser.add_argument('--projects', type=int, default=500, help='Projects to seed (listed 100 per page)')
+    parser.add_argument('--issues', type=int, default=300, help='Issues to seed and fetch')
+    parser.add_argument('--latency', type=float, default=0.005, help='Server latency per request (s)')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bench-http-cache-')
+    try:
+        with MockGitHubServer(latency=args.latency, rate_limit=10**6) as server:
+            for i in range(args.projects):
+                server.mock.add_project(OWNER, REPO, f"Project {i}")
+            for i in range(args.issues):
+                server.mock.add_issue(OWNER, REPO, f"New Mentorship Pair: Mentor {i} ↔ Mentee {i}",
+                                      sample_issue_body(i))
+            scheduler = RateLimitScheduler(points_per_minute=1e9, writes_per_minute=1e9)
+            print(f"🧪 {args.projects} projects and {args.issues} issues read twice, "
+                  f"{args.latency * 1000:.0f} ms latency")
+            for label, cache in (('no cache', None),
+                                 ('ETag cache', ResponseCache(os.path.join(workdir, 'http_cache.json')))):
+                client = GitHubClient(f"bench-{label}", base_url=server.url, scheduler=scheduler,
+                                      cache_responses=False)
+                client.response_cache = cache
+                first = weekly_reads(client, args.issues)
+                if cache is not None:
+                    cache.save()
+                    # A new run starts from the file the previous run left behind
+                    client.response_cache = ResponseCache(cache.path)
+                used = server.mock.used['core']
+                not_modified = server.mock.stats['not_modified']
+                start = time.perf_counter()
+                second = weekly_reads(client, args.issues)
+                elapsed = time.perf_counter() - start
+                if second != first:
+                    print(f"❌ {label}: the second run read different data")
+                    sys.exit(1)
+                print(f"{label:<11} second run {elapsed:6.2f}s   "
+                      f"rate limit charged {server.mock.used['core'] - used:5d}   "
+                      f"304s {server.mock.stats['not_modified'] - not_modified:5d}")
+                client.close()
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == '__main__':
+    main()
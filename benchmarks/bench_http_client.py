@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bare requests calls vs the shared pooled GitHub client
+
+Starts a local keep-alive HTTP server that mimics a GitHub REST endpoint and
+measures per-request latency for one-off `requests.get` calls (a new
+connection each time) against the shared `GitHubClient` session. The server
+can add an artificial delay to every new connection to stand in for the
+TCP+TLS handshake cost of talking to api.github.com.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from github_client import GitHubClient  # noqa: E402
+from rate_limit import RateLimitScheduler  # noqa: E402
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    connect_delay = 0.0
+    payload = json.dumps([{"id": 1, "name": "Mentorship 2025"}]).encode()
+
+    def setup(self):
+        # One handler instance per connection: charge the handshake once
+        time.sleep(self.connect_delay)
+        self.server.connections += 1
+        super().setup()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.payload)))
+        self.end_headers()
+        self.wfile.write(self.payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(connect_delay: float) -> ThreadingHTTPServer:
+    handler = type('Handler', (_Handler,), {'connect_delay': connect_delay})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    server.connections = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def time_calls(call, n: int):
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        response = call()
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def summarize(label: str, latencies, connections: int):
+    ordered = sorted(latencies)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    print(f"{label:<18} mean {statistics.mean(latencies):7.2f} ms   "
+          f"p50 {statistics.median(latencies):7.2f} ms   p95 {p95:7.2f} ms   "
+          f"connections {connections}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pooled vs unpooled GitHub HTTP calls')
+    parser.add_argument('--requests', type=int, default=200, help='Requests per mode')
+    parser.add_argument('--connect-delay-ms', type=float, default=20.0,
+                        help='Simulated handshake cost per new connection')
+    args = parser.parse_args()
+
+    server = start_server(args.connect_delay_ms / 1000)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    url = f"{base_url}/repos/demo/demo/projects"
+    print(f"🏁 {args.requests} requests per mode, {args.connect_delay_ms:.0f} ms simulated handshake")
+
+    before = time_calls(lambda: requests.get(url, headers={'Authorization': 'Bearer demo'}), args.requests)
+    summarize('bare requests', before, server.connections)
+
+    server.connections = 0
+    # Pacing is measured separately (bench_rate_limit.py); disable it here
+    unpaced = RateLimitScheduler(points_per_minute=1e9, writes_per_minute=1e9)
+    client = GitHubClient('demo', base_url=base_url, scheduler=unpaced)
+    after = time_calls(lambda: client.get('/repos/demo/demo/projects'), args.requests)
+    summarize('pooled client', after, server.connections)
+    client.close()
+
+    speedup = statistics.mean(before) / statistics.mean(after)
+    print(f"✅ Pooled client is {speedup:.1f}x faster per request")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
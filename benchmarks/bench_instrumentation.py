@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: overhead of the run instrumentation
+
+Times a phase-decorated function and GitHub API calls against the local mock
+server with instrumentation disabled (the default) and enabled, next to the
+undecorated function, so the cost of leaving the hooks in place is visible.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+import instrumentation  # noqa: E402
+from github_client import get_client  # noqa: E402
+from mock_github_server import MockGitHubServer  # noqa: E402
+from rate_limit import RateLimitScheduler  # noqa: E402
+
+
+def work(value):
+    return value + 1
+
+
+def per_call(func, count):
+    start = time.perf_counter()
+    for i in range(count):
+        func(i)
+    return (time.perf_counter() - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark instrumentation overhead')
+    parser.add_argument('--calls', type=int, default=1000000, help='Calls of the decorated function')
+    parser.add_argument('--requests', type=int, default=2000, help='API requests per mode')
+    args = parser.parse_args()
+
+    instrumentation.recorder = None
+    plain = per_call(work, args.calls)
+    disabled = per_call(instrumentation.timed('bench')(work), args.calls)
+    # Phase hooks are only installed when metrics are on as the scripts are imported
+    instrumentation.recorder = instrumentation.Recorder()
+    enabled = per_call(instrumentation.timed('bench')(work), args.calls)
+    print(f"⏱️  Phase hook: plain {plain * 1e9:.0f} ns, disabled {disabled * 1e9:.0f} ns, "
+          f"enabled {enabled * 1e9:.0f} ns per call")
+
+    # More requests than the hourly quota; only the client-side cost is measured
+    with MockGitHubServer(rate_limit=10**9) as server:
+        client = get_client('bench-instrumentation', base_url=server.url,
+                            scheduler=RateLimitScheduler(points_per_minute=1e9, writes_per_minute=1e9))
+        server.mock.add_issue('latinxinai', 'mentorship-2025', 'Issue', 'Body')
+
+        def fetch(_):
+            client.get('/repos/latinxinai/mentorship-2025/issues/1')
+
+        fetch(0)
+        timings = {}
+        # Alternate the modes so drift in the server affects both equally
+        for _ in range(3):
+            for mode in ('disabled', 'enabled'):
+                instrumentation.recorder = instrumentation.Recorder() if mode == 'enabled' else None
+                timings.setdefault(mode, []).append(per_call(fetch, args.requests))
+        recorded = len(instrumentation.recorder.calls)
+        instrumentation.recorder = None
+
+    disabled, enabled = min(timings['disabled']), min(timings['enabled'])
+    print(f"⏱️  API call: disabled {disabled * 1e6:.0f} µs, enabled {enabled * 1e6:.0f} µs per request "
+          f"({(enabled - disabled) / disabled:+.1%})")
+    if recorded != args.requests:
+        print(f"❌ Recorded {recorded} of {args.requests} requests")
+        sys.exit(1)
+    print("✅ Every request was recorded")
+
+
+if __name__ == '__main__':
+    main()
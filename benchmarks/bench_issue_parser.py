@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single-pass issue parser vs the previous multi-regex parser
+
+Parses synthetic "New Mentorship Pair" issue bodies of growing size with the
+previous approach (seven uncompiled `re.search` calls over the whole body)
+and with the precompiled single-pass `pair_parser`, then runs both over
+adversarial bodies (long runs of list markers, whitespace and labels) that
+stress the `((?:[-*]\\s*.+\\n?)+)` style patterns. The per-line cost of the
+single-pass parser should stay flat as bodies grow.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from pair_parser import parse_issue_body  # noqa: E402
+
+
+def legacy_parse(issue_body: str) -> dict:
+    """The parser previously inlined in MentorshipIssueProcessor"""
+    pair_data = {}
+    mentor_match = re.search(r'(?:\*\*mentor\*\*|mentor:)\s*(.+)', issue_body, re.IGNORECASE)
+    if mentor_match:
+        pair_data["mentor"] = mentor_match.group(1).strip()
+    mentee_match = re.search(r'(?:\*\*mentee\*\*|mentee:)\s*(.+)', issue_body, re.IGNORECASE)
+    if mentee_match:
+        pair_data["mentee"] = mentee_match.group(1).strip()
+    goals_match = re.search(r'(?:\*\*goals?\*\*|goals?:)\s*\n((?:[-*]\s*.+\n?)+)', issue_body, re.IGNORECASE)
+    if goals_match:
+        pair_data["goals"] = [line.strip('- *').strip() for line in goals_match.group(1).split('\n') if line.strip()]
+    track_match = re.search(r'(?:\*\*(?:track|focus|area)\*\*|(?:track|focus|area):)\s*(.+)', issue_body, re.IGNORECASE)
+    if track_match:
+        pair_data["program_track"] = track_match.group(1).strip()
+    deliverables_match = re.search(r'(?:\*\*deliverables?\*\*|deliverables?:)\s*\n((?:[-*]\s*.+\n?)+)',
+                                   issue_body, re.IGNORECASE)
+    if deliverables_match:
+        pair_data["deliverables"] = [line.strip('- *').strip()
+                                     for line in deliverables_match.group(1).split('\n') if line.strip()]
+    start_date_match = re.search(r'(?:\*\*start\s*date\*\*|start\s*date:)\s*(.+)', issue_body, re.IGNORECASE)
+    if start_date_match:
+        pair_data["start_date"] = start_date_match.group(1).strip()
+    end_date_match = re.search(r'(?:\*\*end\s*date\*\*|end\s*date:)\s*(.+)', issue_body, re.IGNORECASE)
+    if end_date_match:
+        pair_data["end_date"] = end_date_match.group(1).strip()
+    return pair_data
+
+
+def synthetic_body(lines: int) -> str:
+    """An issue body with the template's header and `lines` lines of notes/goals"""
+    header = ("**Mentor**: Jane Doe\n**Mentee**: John Smith\n**Track**: Machine Learning\n"
+              "**Start Date**: 2025-01-15\n**End Date**: 2025-06-30\n\n")
+    notes = ''.join(f"Note {i}: discussed topic {i} at length with some detail\n" for i in range(lines // 2))
+    goals = '**Goals**:\n' + ''.join(f"- Goal number {i} with a description\n" for i in range(lines // 2))
+    return header + notes + goals + "\n**Deliverables**:\n- Final project\n"
+
+
+def adversarial_bodies(size: int) -> dict:
+    return {
+        'dash run': "**Goals**:\n" + "- " * size + "x",
+        'blank lines': "goals:" + "\n" * size + "x",
+        'whitespace': "goals:" + " " * size + "\nx",
+        'many labels': "goal: goals: " * (size // 10) + "\n",
+        'star items': "**Goals**:\n" + "*\n" * size,
+    }
+
+
+def best_of(func, body: str, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(body)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark issue body parsing')
+    parser.add_argument('--sizes', default='100,1000,10000,100000', help='Comma-separated body sizes in lines')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetitions per measurement (best is kept)')
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    print("🏁 Synthetic issue bodies")
+    print(f"{'lines':>8} {'legacy ms':>11} {'single-pass ms':>15} {'µs/line':>9}")
+    for size in sizes:
+        body = synthetic_body(size)
+        legacy = best_of(legacy_parse, body, args.repeat)
+        single = best_of(parse_issue_body, body, args.repeat)
+        print(f"{size:>8} {legacy * 1000:>11.2f} {single * 1000:>15.2f} {single / size * 1e6:>9.2f}")
+
+    size = sizes[-1]
+    print(f"\n🧨 Adversarial bodies ({size} units)")
+    print(f"{'case':<14} {'legacy ms':>11} {'single-pass ms':>15}")
+    for name, body in adversarial_bodies(size).items():
+        legacy = best_of(legacy_parse, body, args.repeat)
+        single = best_of(parse_issue_body, body, args.repeat)
+        print(f"{name:<14} {legacy * 1000:>11.2f} {single * 1000:>15.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark: end-to-end API paths against the local mock GitHub server
+
+Runs the real scripts' code paths against scripts/mock_github_server.py with
+a fixed per-request latency (and optional injected errors or a secondary
+write limit), one fresh server per scenario:
+
+- REST cards:    migrate_pairs() creating a card per pair on a worker pool
+- issue backlog: the async issue processor draining seeded issues
+- GraphQL batch: add_items() with the server capping mutations per document,
+                 so oversized batches are split and retried; a failed
+                 request stops the import instead of being re-sent
+
+Reports throughput, requests served and rate-limit / error counts, and exits
+non-zero if work was lost without any injected errors to explain it.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from async_issue_processor import process_backlog  # noqa: E402
+from github_client import get_client  # noqa: E402
+from manage_mentorship_projects import MentorshipProjectManager  # noqa: E402
+from migrate_pairings_to_projects import migrate_pairs  # noqa: E402
+from migrate_pairings_to_projects_v2 import add_items  # noqa: E402
+from mock_github_server import MockGitHubServer, sample_issue_body  # noqa: E402
+from pair_model import ContactInfo, Pair  # noqa: E402
+from process_mentorship_issue import MentorshipIssueProcessor  # noqa: E402
+from rate_limit import RateLimitScheduler  # noqa: E402
+
+OWNER, REPO = 'latinxinai', 'mentorship-2025'
+
+
+def report(label, done, total, elapsed, stats):
+    print(f"{label:<14} {done:5d}/{total:<5d} {elapsed:7.2f}s {done / elapsed:8.1f}/s   "
+          f"requests {stats['requests']:5d}   limited {stats['rate_limited'] + stats['secondary_limited']:4d}   "
+          f"injected {stats['injected_errors']:4d}")
+    return total - done
+
+
+def rest_cards(args, options, scheduler):
+    pairs = [Pair(f"Mentor {i}", f"Mentee {i}", goals=["Learn", "Ship"],
+                  contact_info=ContactInfo(mentor_email=f"mentor{i}@example.com",
+                                           mentee_email=f"mentee{i}@example.com"))
+             for i in range(args.pairs)]
+    with MockGitHubServer(**options) as server:
+        token = f"bench-rest-{time.time()}"
+        get_client(token, base_url=server.url, scheduler=scheduler())
+        manager = MentorshipProjectManager(OWNER, REPO, token)
+        project_id = manager.create_mentorship_project("Mentorship Bench").get('id')
+        start = time.perf_counter()
+        results = migrate_pairs(manager, project_id, pairs, args.concurrency)
+        elapsed = time.perf_counter() - start
+        created = sum(1 for result in results if not result["error"])
+        return 'REST cards', created, len(pairs), elapsed, server.mock.stats
+
+
+def issue_backlog(args, options, scheduler):
+    with MockGitHubServer(**options) as server:
+        for i in range(args.issues):
+            server.mock.add_issue(OWNER, REPO, f"New Mentorship Pair: Mentor {i} ↔ Mentee {i}",
+                                  sample_issue_body(i))
+        token = f"bench-issues-{time.time()}"
+        get_client(token, base_url=server.url, scheduler=scheduler())
+        processor = MentorshipIssueProcessor(OWNER, REPO, token)
+        start = time.perf_counter()
+        summary = process_backlog(processor, concurrency=args.concurrency)
+        elapsed = time.perf_counter() - start
+        return 'issue backlog', summary['succeeded'], args.issues, elapsed, server.mock.stats
+
+
+def graphql_batch(args, options, scheduler):
+    with MockGitHubServer(graphql_max_mutations=args.max_mutations, **options) as server:
+        token = f"bench-graphql-{time.time()}"
+        get_client(token, base_url=server.url, scheduler=scheduler())
+        project = server.mock.add_project_v2(server.mock.repo(OWNER, REPO)['id'], "Mentorship Bench")
+        titles = [f"mentor{i}@example.com → mentee{i}@example.com" for i in range(args.pairs)]
+        start = time.perf_counter()
+        try:
+            results = add_items(project['id'], titles, token, batch_size=args.batch_size)
+            added = sum(1 for result in results if not result["error"])
+        except Exception:
+            added = len(titles)
+        elapsed = time.perf_counter() - start
+        # Items the client reported but the server never stored count as lost
+        added = min(added, len(project['item_ids']))
+        return 'GraphQL batch', added, len(titles), elapsed, server.mock.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark API paths against the mock GitHub server')
+    parser.add_argument('--pairs', type=int, default=200, help='Cards / project items to create')
+    parser.add_argument('--issues', type=int, default=50, help='Issues to seed and process')
+    parser.add_argument('--concurrency', type=int, default=8, help='Parallel requests')
+    parser.add_argument('--latency', type=float, default=0.02, help='Server latency per request (s)')
+    parser.add_argument('--error-every', type=int, default=0, help='Make every Nth request fail')
+    parser.add_argument('--writes-per-second', type=int, help='Secondary write limit on the server')
+    parser.add_argument('--batch-size', type=int, default=50, help='Mutations per GraphQL request')
+    parser.add_argument('--max-mutations', type=int, default=20, help='Server cap on mutations per request')
+    args = parser.parse_args()
+
+    options = {"latency": args.latency, "error_every": args.error_every,
+               "writes_per_second": args.writes_per_second}
+
+    def scheduler():
+        # Pacing is left to the server under test; retries stay quick so runs are short
+        return RateLimitScheduler(points_per_minute=1e9, writes_per_minute=1e9, base_delay=0.2, max_delay=2.0)
+
+    print(f"🧪 Mock GitHub API: {args.latency * 1000:.0f} ms latency, concurrency {args.concurrency}"
+          + (f", every {args.error_every}th request fails" if args.error_every else "")
+          + (f", {args.writes_per_second} writes/s" if args.writes_per_second else ""))
+    workdir = tempfile.mkdtemp(prefix='bench-mock-api-')
+    cwd = os.getcwd()
+    # The scripts write pair folders, caches and indexes relative to the working directory
+    os.chdir(workdir)
+    stdout = sys.stdout
+    lost = 0
+    try:
+        for scenario in (rest_cards, issue_backlog, graphql_batch):
+            # The scripts print a line per pair; only the summary is shown
+            sys.stdout = open(os.devnull, 'w')
+            try:
+                result = scenario(args, options, scheduler)
+            finally:
+                sys.stdout.close()
+                sys.stdout = stdout
+            lost += report(*result)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir)
+
+    if lost and not args.error_every:
+        print(f"❌ {lost} operations lost without injected errors")
+        sys.exit(1)
+    print("✅ All scenarios completed" + (f" ({lost} operations lost to injected errors)" if lost else ""))
+
+
+if __name__ == '__main__':
+    main()
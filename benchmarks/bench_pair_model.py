@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: in-memory pairs as dicts vs Pair objects
+
+Loads a synthetic cohort in the pair_template.json layout from JSON Lines
+both as plain dicts (as the scripts passed pairs around before) and as Pair
+objects, and reports the traced memory of each. Then times the JSON Lines
+round trip of the Pair codecs and checks that every pair survives it
+unchanged.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from pair_model import Pair, iter_jsonl, write_jsonl  # noqa: E402
+
+
+def synthetic_dict(i):
+    return {
+        "mentor": f"Mentor {i}",
+        "mentee": f"Mentee {i}",
+        "goals": [f"Goal {g} for pair {i}" for g in range(3)],
+        "progress": "Mid-program",
+        "meetings": [f"2025-0{m + 1}-15: Session {m}" for m in range(4)],
+        "deliverables": [f"Deliverable {d} for pair {i}" for d in range(2)],
+        "last_updated": "2025-01-10T10:00:00Z",
+        "contact_info": {
+            "mentor_email": f"mentor{i}@example.com",
+            "mentee_email": f"mentee{i}@example.com",
+            "preferred_meeting_platform": "Zoom",
+            "timezone": "UTC-5"
+        },
+        "program_info": {
+            "start_date": "2025-01-15",
+            "end_date": "2025-06-30",
+            "program_track": "Machine Learning"
+        }
+    }
+
+
+def traced(func):
+    """Result of func() and the memory still held by it"""
+    tracemalloc.start()
+    result = func()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dict pairs against Pair objects')
+    parser.add_argument('--pairs', type=int, default=100000, help='Number of synthetic pairs')
+    args = parser.parse_args()
+
+    # Decoding gives every pair its own strings, as loading real pair files does
+    lines = [json.dumps(synthetic_dict(i)) for i in range(args.pairs)]
+    dicts, dict_bytes = traced(lambda: [json.loads(line) for line in lines])
+    del dicts
+    pairs, pair_bytes = traced(lambda: [Pair.from_json(line) for line in lines])
+    del lines
+    print(f"💾 {args.pairs} pairs: dicts {dict_bytes / 2**20:.1f} MiB, "
+          f"Pair objects {pair_bytes / 2**20:.1f} MiB ({pair_bytes / dict_bytes:.0%})")
+
+    out = io.StringIO()
+    start = time.perf_counter()
+    write_jsonl(pairs, out)
+    encode = time.perf_counter() - start
+    out.seek(0)
+    start = time.perf_counter()
+    loaded = list(iter_jsonl(out))
+    decode = time.perf_counter() - start
+    print(f"⏱️  JSON Lines: encode {encode / args.pairs * 1e6:.1f} µs/pair, "
+          f"decode + validate {decode / args.pairs * 1e6:.1f} µs/pair")
+
+    if loaded != pairs:
+        print("❌ Pairs changed in the JSON Lines round trip")
+        sys.exit(1)
+    print("✅ JSON Lines round trip is lossless")
+
+
+if __name__ == '__main__':
+    main()
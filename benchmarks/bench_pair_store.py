@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pair store inserts and indexed queries
+
+Bulk-loads a synthetic cohort into the SQLite pair store in the batches
+create_pairs.py uses, reloads it to time the merge path, then answers the
+same questions (one mentor's pairs, one mentee's pair, a track's Not Started
+pairs, status counts) from the store and by re-reading the cohort's JSON
+Lines export, checking both give the same answers.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from itertools import islice
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from pair_model import ContactInfo, Pair, ProgramInfo, iter_jsonl, write_jsonl  # noqa: E402
+from pair_store import PairStore  # noqa: E402
+
+TRACKS = ("Machine Learning", "Data Science", "NLP", "Computer Vision")
+STATUSES = ("Not Started", "In Progress", "Completed")
+BATCH_SIZE = 500
+
+
+def synthetic_pairs(count):
+    for i in range(count):
+        yield Pair(f"Mentor {i // 4}", f"Mentee {i}", goals=[f"Goal {i}"], progress=STATUSES[i % 3],
+                   meetings=[f"2025-0{m + 1}-15: Session {m}" for m in range(3)],
+                   deliverables=[f"Deliverable for pair {i}"],
+                   contact_info=ContactInfo(mentor_email=f"mentor{i // 4}@example.com",
+                                            mentee_email=f"mentee{i}@example.com"),
+                   program_info=ProgramInfo(program_track=TRACKS[i % len(TRACKS)]))
+
+
+def load(store, count):
+    pairs = synthetic_pairs(count)
+    start = time.perf_counter()
+    while True:
+        batch = list(islice(pairs, BATCH_SIZE))
+        if not batch:
+            break
+        store.add_pairs(batch, "bench")
+    return time.perf_counter() - start
+
+
+def scan(path, keep):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [pair for pair in iter_jsonl(f) if keep(pair)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the SQLite pair store')
+    parser.add_argument('--pairs', type=int, default=100000, help='Number of synthetic pairs')
+    parser.add_argument('--repeat', type=int, default=20, help='Times each indexed query is run')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bench-pair-store-')
+    try:
+        jsonl = os.path.join(workdir, 'pairs.jsonl')
+        with open(jsonl, 'w', encoding='utf-8') as f:
+            write_jsonl(synthetic_pairs(args.pairs), f)
+
+        with PairStore(os.path.join(workdir, 'pairs.db')) as store:
+            insert = load(store, args.pairs)
+            merge = load(store, args.pairs)
+            print(f"💾 {args.pairs} pairs: insert {insert:.2f}s ({args.pairs / insert:,.0f}/s), "
+                  f"merge again {merge:.2f}s; {os.path.getsize(store.path) / 2**20:.1f} MiB")
+
+            mentor, mentee, track = f"mentor{args.pairs // 8}@example.com", f"Mentee {args.pairs // 2}", TRACKS[1]
+            queries = [
+                ("one mentor's pairs", lambda: store.find(mentor=mentor),
+                 lambda pair: pair.contact_info.mentor_email == mentor),
+                ("one mentee's pair", lambda: store.find(mentee=mentee), lambda pair: pair.mentee == mentee),
+                (f"{track} Not Started", lambda: store.find(track=track, status="Not Started"),
+                 lambda pair: pair.program_info.program_track == track and pair.progress == "Not Started"),
+            ]
+            print(f"{'query':<26} {'store':>10} {'JSONL scan':>12}")
+            for label, indexed, keep in queries:
+                start = time.perf_counter()
+                for _ in range(args.repeat):
+                    found = indexed()
+                indexed_time = (time.perf_counter() - start) / args.repeat
+                start = time.perf_counter()
+                expected = scan(jsonl, keep)
+                scan_time = time.perf_counter() - start
+                if sorted(pair.to_json() for pair in found) != sorted(pair.to_json() for pair in expected):
+                    print(f"❌ {label}: the store and the scan disagree")
+                    sys.exit(1)
+                print(f"{label:<26} {indexed_time * 1000:8.2f}ms {scan_time * 1000:10.0f}ms  ({len(found)} pairs)")
+
+            start = time.perf_counter()
+            counts = store.status_counts()
+            indexed_time = time.perf_counter() - start
+            start = time.perf_counter()
+            expected = Counter(pair.progress for pair in scan(jsonl, lambda pair: True))
+            scan_time = time.perf_counter() - start
+            if counts != dict(expected):
+                print("❌ status counts: the store and the scan disagree")
+                sys.exit(1)
+            print(f"{'status counts':<26} {indexed_time * 1000:8.2f}ms {scan_time * 1000:10.0f}ms")
+        print("✅ Store and scan agree on every query")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pairings/ folder scan
+
+Builds a synthetic pairings tree (mentor_mentee.md notes files and
+pair-N-* folders, flat or split into program-year folders) and scans it with:
+
+- the previous scanner: four overlapping glob patterns, no dedup, serial reads
+- the scandir walker: each pair source once, parsed on a thread pool
+
+Reports wall time and how many pair records each produced; the previous
+scanner returns every mentor_mentee.md twice. Folder READMEs use the
+create_pairs.py layout, and the run fails unless every one of them yields its
+mentor, mentee, goals and meetings.
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from migrate_pairings_to_projects import PairingsMigrator  # noqa: E402
+
+NOTES = """# Mentorship notes
+
+**Goals**:
+- Learn {topic}
+- Ship a portfolio project
+- Present at demo day
+
+**Progress**: Week {week} of 12
+
+**Meetings**:
+- Kickoff call
+- Weekly sync
+"""
+
+README = """# Pair {i}: mentor{i} & mentee{i}
+
+## Goals
+- Learn {topic}
+- Ship a portfolio project
+
+## Progress
+- Week {week} of 12
+
+## Meetings
+{meetings}
+## Deliverables
+- Final presentation
+"""
+
+
+def build_tree(root: str, pairs: int, years: int, meetings: int = 12):
+    """Write `pairs` pair sources, half as notes files and half as create_pairs.py folders"""
+    for i in range(pairs):
+        base = os.path.join(root, str(2020 + i % years)) if years > 1 else root
+        os.makedirs(base, exist_ok=True)
+        if i % 2:
+            with open(os.path.join(base, f"mentor-{i}_mentee-{i}.md"), 'w', encoding='utf-8') as f:
+                f.write(NOTES.format(topic=f"topic {i}", week=i % 12 + 1))
+        else:
+            folder = os.path.join(base, f"pair-{i}-mentor-{i}")
+            os.makedirs(folder, exist_ok=True)
+            with open(os.path.join(folder, 'README.md'), 'w', encoding='utf-8') as f:
+                f.write(README.format(i=i, topic=f"topic {i}", week=i % 12 + 1,
+                                      meetings=''.join(f"- Session {n}: notes\n" for n in range(meetings))))
+            open(os.path.join(folder, 'meeting-01.md'), 'w').close()
+
+
+def legacy_scan(migrator: PairingsMigrator) -> list:
+    """The scanner before the scandir walker"""
+    path = migrator.pairings_path
+    found_items = []
+    for pattern in (f"{path}/*_*", f"{path}/*/", f"{path}/*.md", f"{path}/*.txt"):
+        found_items.extend(glob.glob(pattern))
+    return [pair for pair in (migrator._extract_pair_data(item) for item in found_items) if pair]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the pairings folder scan')
+    parser.add_argument('--pairs', type=int, default=5000, help='Number of pair sources to generate')
+    parser.add_argument('--workers', type=int, default=8, help='Scanner thread pool size')
+    parser.add_argument('--meetings', type=int, default=12, help='Meeting entries per README')
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix='bench-pairings-')
+    try:
+        flat = os.path.join(root, 'flat')
+        nested = os.path.join(root, 'nested')
+        build_tree(flat, args.pairs, years=1, meetings=args.meetings)
+        build_tree(nested, args.pairs, years=5, meetings=args.meetings)
+
+        migrator = PairingsMigrator(flat, workers=args.workers)
+        legacy_time, legacy_pairs = timed(lambda: legacy_scan(migrator))
+        print(f"🐢 glob scanner:     {legacy_time:6.2f}s, {len(legacy_pairs)} records")
+        walker_time, walker_pairs = timed(migrator.scan_pairings_folder)
+        print(f"⚡ scandir walker:   {walker_time:6.2f}s, {len(walker_pairs)} records "
+              f"({legacy_time / walker_time:.1f}x the glob scanner's speed)")
+
+        nested_time, nested_pairs = timed(PairingsMigrator(nested, workers=args.workers).scan_pairings_folder)
+        print(f"📅 5 program years:  {nested_time:6.2f}s, {len(nested_pairs)} records")
+
+        if len(walker_pairs) != args.pairs or len(nested_pairs) != args.pairs:
+            print("❌ Walker did not return each pair exactly once")
+            sys.exit(1)
+
+        folders = [pair for pair in walker_pairs if os.path.isdir(pair.migration_source)]
+        parsed = [pair for pair in folders
+                  if pair.mentor.startswith('mentor') and pair.goals
+                  and len(pair.meetings) == args.meetings + 1]
+        print(f"📖 READMEs parsed:   {len(parsed)}/{len(folders)}")
+        if len(parsed) != len(folders):
+            print("❌ Some pair READMEs were not parsed")
+            sys.exit(1)
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
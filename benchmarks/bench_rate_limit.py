@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark: rate-limit scheduler against a fake, rate-limited GitHub API
+
+Starts a local server that enforces a secondary write limit (too many card
+creations per second returns 403 "secondary rate limit" with Retry-After)
+and a primary budget reported through X-RateLimit-* headers. The same bulk
+card-creation run is then replayed three ways:
+
+- unpaced, no retries: what the scripts did before (pairs are lost)
+- unpaced, with retries: backoff recovers every pair, but slowly
+- paced by the token-bucket scheduler: no limits tripped, no pairs lost
+
+Exits non-zero if the paced run loses any pair, so it can gate CI.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from github_client import GitHubClient  # noqa: E402
+from rate_limit import RateLimitScheduler  # noqa: E402
+
+
+class _LimitedHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        server = self.server
+        with server.lock:
+            now = time.monotonic()
+            while server.writes and now - server.writes[0] > 1.0:
+                server.writes.popleft()
+            limited = len(server.writes) >= server.writes_per_second
+            if not limited:
+                server.writes.append(now)
+                server.remaining -= 1
+                server.created += 1
+            else:
+                server.rejected += 1
+            remaining = server.remaining
+
+        if limited:
+            body = {"message": "You have exceeded a secondary rate limit. Please wait a few minutes."}
+            self._reply(403, body, {'Retry-After': '1', 'X-RateLimit-Remaining': str(remaining)})
+        else:
+            self._reply(201, {"id": server.created, "note": "card"}, {'X-RateLimit-Remaining': str(remaining)})
+
+    def _reply(self, status, body, headers):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('X-RateLimit-Reset', str(int(time.time()) + 3600))
+        self.send_header('X-RateLimit-Resource', 'core')
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(writes_per_second: int) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _LimitedHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.writes = deque()
+    server.writes_per_second = writes_per_second
+    server.remaining = 5000
+    server.created = server.rejected = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(label: str, base_url: str, server, scheduler: RateLimitScheduler, cards: int, workers: int):
+    time.sleep(1.0)  # let the previous run's writes age out of the server window
+    server.writes.clear()
+    server.created = server.rejected = 0
+    client = GitHubClient('demo', base_url=base_url, scheduler=scheduler, pool_size=workers)
+
+    def create(i):
+        return client.post('/projects/1/cards', json={"note": f"pair {i}"}).status_code == 201
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(create, range(cards)))
+    elapsed = time.perf_counter() - start
+    client.close()
+
+    lost = results.count(False)
+    print(f"{label:<24} created {results.count(True):4d}   lost {lost:4d}   "
+          f"403s {server.rejected:4d}   {elapsed:6.2f}s   {cards / elapsed:6.1f} cards/s")
+    return lost
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark rate-limit pacing and retries')
+    parser.add_argument('--cards', type=int, default=60, help='Cards to create per run')
+    parser.add_argument('--workers', type=int, default=8, help='Concurrent requests')
+    parser.add_argument('--server-writes-per-second', type=int, default=20,
+                        help='Secondary write limit enforced by the fake server')
+    args = parser.parse_args()
+
+    server = start_server(args.server_writes_per_second)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    limit = args.server_writes_per_second
+    print(f"🏁 {args.cards} cards, {args.workers} workers, server allows {limit} writes/s")
+
+    run('unpaced, no retries', base_url, server,
+        RateLimitScheduler(points_per_minute=1e9, writes_per_minute=1e9, max_retries=0),
+        args.cards, args.workers)
+    run('unpaced, with retries', base_url, server,
+        RateLimitScheduler(points_per_minute=1e9, writes_per_minute=1e9, base_delay=0.5),
+        args.cards, args.workers)
+    # Pace just under the server's limit: 90% of its writes/s
+    lost = run('paced scheduler', base_url, server,
+               RateLimitScheduler(points_per_minute=1e9, writes_per_minute=limit * 60 * 0.9,
+                                  burst_seconds=0.05),
+               args.cards, args.workers)
+
+    server.shutdown()
+    if lost:
+        print("❌ Paced run lost pairs")
+        sys.exit(1)
+    print("✅ Paced run created every card without tripping the limit")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: migration report rendering
+
+Renders the migration report for growing numbers of pairs with the previous
+inline f-string renderer (`report_content +=` in a loop) and with the
+streaming template writer, reporting time per pair so the scaling is
+visible, then the peak memory of each at the largest size. Both reports are
+compared byte for byte with the timestamp pinned.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+import migrate_pairings_to_projects  # noqa: E402
+from migrate_pairings_to_projects import PairingsMigrator  # noqa: E402
+from pair_model import Pair  # noqa: E402
+
+
+class _PinnedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return datetime(2025, 1, 1, 12, 0, 0)
+
+
+def legacy_report(pairings_path, pairs, output_file):
+    """The report renderer before templates"""
+    report_content = f"""# Pairings Migration Report
+
+**Generated**: {_PinnedDatetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Source**: {pairings_path}
+**Pairs Found**: {len(pairs)}
+
+## Migration Summary
+
+| Mentor | Mentee | Goals | Meetings | Status |
+|--------|--------|-------|----------|--------|
+"""
+    for pair in pairs:
+        mentor = pair.get('mentor', 'Unknown')
+        mentee = pair.get('mentee', 'Unknown')
+        goals_count = len(pair.get('goals', []))
+        meetings_count = len(pair.get('meetings', []))
+        progress = pair.get('progress', 'Unknown')
+        report_content += f"| {mentor} | {mentee} | {goals_count} | {meetings_count} | {progress} |\n"
+
+    report_content += """
+## Detailed Information
+
+"""
+    for i, pair in enumerate(pairs, 1):
+        report_content += f"""### Pair {i}: {pair.get('mentor', 'Unknown')} ↔ {pair.get('mentee', 'Unknown')}
+
+**Source**: `{pair.get('migration_source', 'Unknown')}`
+**Goals**: {len(pair.get('goals', []))} found
+**Meetings**: {len(pair.get('meetings', []))} found
+**Progress**: {pair.get('progress', 'Unknown')}
+
+#### Goals
+{chr(10).join([f"- {goal}" for goal in pair.get('goals', ['No goals found'])])}
+
+#### Meetings
+{chr(10).join([f"- {meeting}" for meeting in pair.get('meetings', ['No meetings found'])])}
+
+---
+
+"""
+    with open(output_file, 'w') as f:
+        f.write(report_content)
+
+
+def synthetic_pairs(count):
+    return [{
+        "mentor": f"Mentor {i}",
+        "mentee": f"Mentee {i}",
+        "goals": [f"Goal {g} for pair {i}" for g in range(4)],
+        "progress": "Mid-program",
+        "meetings": [f"2025-0{m + 1}-15: Session {m}" for m in range(6)],
+        "migration_source": f"pairings/pair-{i}-mentor-mentee"
+    } for i in range(count)]
+
+
+def best_of(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark migration report rendering')
+    parser.add_argument('--sizes', default='1000,10000,50000', help='Comma-separated pair counts')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetitions per measurement (best is kept)')
+    args = parser.parse_args()
+
+    migrate_pairings_to_projects.datetime = _PinnedDatetime
+    migrator = PairingsMigrator('pairings')
+    devnull = open(os.devnull, 'w')
+    stdout = sys.stdout
+
+    print(f"{'pairs':>8} {'f-string ms':>12} {'streaming ms':>12} {'µs/pair':>9}")
+    with tempfile.TemporaryDirectory() as root:
+        legacy_file = os.path.join(root, 'legacy.md')
+        template_file = os.path.join(root, 'template.md')
+        for size in (int(size) for size in args.sizes.split(',')):
+            dicts = synthetic_pairs(size)
+            pairs = [Pair.from_dict(pair) for pair in dicts]
+            legacy = best_of(lambda: legacy_report('pairings', dicts, legacy_file), args.repeat)
+            sys.stdout = devnull
+            try:
+                rendered = best_of(lambda: migrator.create_migration_report(pairs, template_file), args.repeat)
+            finally:
+                sys.stdout = stdout
+            print(f"{size:>8} {legacy * 1000:>12.1f} {rendered * 1000:>12.1f} {rendered / size * 1e6:>9.1f}")
+
+            with open(legacy_file, 'rb') as a, open(template_file, 'rb') as b:
+                if a.read() != b.read():
+                    print("❌ Reports differ")
+                    sys.exit(1)
+
+        # Pairs are built before tracing starts, so only the renderers' own memory counts
+        legacy_peak = peak_memory(lambda: legacy_report('pairings', dicts, legacy_file))
+        sys.stdout = devnull
+        try:
+            stream_peak = peak_memory(lambda: migrator.create_migration_report(iter(pairs), template_file))
+        finally:
+            sys.stdout = stdout
+        print(f"\n💾 Peak memory for {size} pairs: f-string {legacy_peak / 2**20:.1f} MiB, "
+              f"streaming {stream_peak / 2**20:.1f} MiB")
+    devnull.close()
+    print("✅ Template reports are byte-identical")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+
+Times the hot paths at several cohort sizes (10, 1k and 10k pairs by default)
+and records the results as JSON, one file per commit, so a regression shows
+up as a diff between two result files:
+
+- parse_issue:   MentorshipIssueProcessor.parse_mentorship_issue per issue body
+- render_card:   MentorshipProjectManager._format_card_content per pair
+- scan_pairings: PairingsMigrator.scan_pairings_folder on a synthetic tree
+- create_pairs:  create_pairs.py folders, card CSV and JSON for a roster
+- migrate_e2e:   migrate_pairings_to_projects.py main(): scan, report, export,
+                 project and card creation and folder generation against the
+                 mock GitHub API (scripts/mock_github_server.py)
+
+Pass --compare with an earlier result file to print the change per benchmark;
+--fail-on-regression makes any slowdown past --threshold exit non-zero.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+sys.path.insert(0, ROOT)
+
+from bench_create_pairs import write_roster  # noqa: E402
+from bench_pairings_scan import build_tree  # noqa: E402
+from create_pairs import create_pairs  # noqa: E402
+from github_client import get_client  # noqa: E402
+import migrate_pairings_to_projects  # noqa: E402
+from manage_mentorship_projects import MentorshipProjectManager  # noqa: E402
+from migrate_pairings_to_projects import PairingsMigrator  # noqa: E402
+from mock_github_server import MockGitHubServer, sample_issue_body  # noqa: E402
+from pair_model import ContactInfo, Pair  # noqa: E402
+from process_mentorship_issue import MentorshipIssueProcessor  # noqa: E402
+from rate_limit import RateLimitScheduler  # noqa: E402
+
+DEFAULT_SIZES = '10,1000,10000'
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+
+def best_of(func, repeat):
+    """Best wall time of `repeat` calls; `func` returns its own setup-free duration"""
+    return min(func() for _ in range(max(1, repeat)))
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def synthetic_pairs(count):
+    return [Pair(f"Mentor {i}", f"Mentee {i}", goals=[f"Goal {g} for pair {i}" for g in range(4)],
+                 progress="Mid-program", meetings=[f"2025-0{m + 1}-15: Session {m}" for m in range(6)],
+                 deliverables=["Development plan", "Final presentation"],
+                 last_updated="2025-01-10T10:00:00Z",
+                 contact_info=ContactInfo(mentor_email=f"mentor{i}@example.com",
+                                          mentee_email=f"mentee{i}@example.com"))
+            for i in range(count)]
+
+
+# -- benchmarks: each returns seconds for `size` pairs ---------------------
+
+def bench_parse_issue(size, workdir, repeat):
+    bodies = [sample_issue_body(i) for i in range(size)]
+    processor = MentorshipIssueProcessor('bench', 'bench', 'bench-token')
+    parse = processor.parse_mentorship_issue
+    return best_of(lambda: timed(lambda: [parse(body) for body in bodies]), repeat)
+
+
+def bench_render_card(size, workdir, repeat):
+    pairs = synthetic_pairs(size)
+    render = MentorshipProjectManager('bench', 'bench', 'bench-token')._format_card_content
+    return best_of(lambda: timed(lambda: [render(pair) for pair in pairs]), repeat)
+
+
+def bench_scan_pairings(size, workdir, repeat):
+    tree = os.path.join(workdir, 'pairings')
+    build_tree(tree, size, years=1)
+    migrator = PairingsMigrator(tree)
+    return best_of(lambda: timed(migrator.scan_pairings_folder), repeat)
+
+
+def bench_create_pairs(size, workdir, repeat):
+    roster = os.path.join(workdir, 'roster.csv')
+    write_roster(roster, size)
+    runs = []
+    for run in range(max(1, repeat)):
+        out = os.path.join(workdir, f"run{run}")
+        os.makedirs(out)
+        runs.append(timed(create_pairs, roster, os.path.join(out, 'pairings'), os.path.join(out, 'cards.csv'),
+                          os.path.join(out, 'pairs.json'), index_file=os.path.join(out, 'index.json'),
+                          store_file=os.path.join(out, 'pairs.db')))
+        shutil.rmtree(out)
+    return min(runs)
+
+
+def bench_migrate_e2e(size, workdir, repeat):
+    tree = os.path.join(workdir, 'pairings')
+    build_tree(tree, size, years=1, meetings=4)
+    runs = []
+    for run in range(max(1, repeat)):
+        # 10k pairs take more requests than the hourly quota; throughput is what is measured here
+        with MockGitHubServer(rate_limit=10**9) as server:
+            token = f"bench-migrate-{size}-{run}"
+            # Pacing is the server's job here; the scripts' own pacing would dominate the timing
+            get_client(token, base_url=server.url,
+                       scheduler=RateLimitScheduler(points_per_minute=1e9, writes_per_minute=1e9))
+            argv = sys.argv
+            sys.argv = ['migrate_pairings_to_projects.py', '--pairings-path', tree, '--owner', 'bench',
+                        '--repo', 'bench', '--token', token, '--create-project', '--generate-folders',
+                        '--concurrency', '8']
+            try:
+                runs.append(timed(migrate_pairings_to_projects.main))
+            finally:
+                sys.argv = argv
+            cards = sum(len(project['cards']) for project in server.mock.projects.values())
+        if cards != size:
+            raise RuntimeError(f"migration created {cards} cards for {size} pairs")
+        for generated in ('pairs', '.mentorship', 'migration_report.md', 'migrated_pairs.jsonl'):
+            path = os.path.join(workdir, generated)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            elif os.path.exists(path):
+                os.remove(path)
+    return min(runs)
+
+
+BENCHMARKS = {
+    'parse_issue': bench_parse_issue,
+    'render_card': bench_render_card,
+    'scan_pairings': bench_scan_pairings,
+    'create_pairs': bench_create_pairs,
+    'migrate_e2e': bench_migrate_e2e,
+}
+
+
+# -- results ---------------------------------------------------------------
+
+def git_commit():
+    """(short commit id, whether the tree has uncommitted changes)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown', False
+
+
+def compare(results, baseline_file, threshold):
+    """Print the change against a baseline; return the regressions past `threshold`"""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    print(f"\n📋 Compared with {baseline.get('commit', 'unknown')} ({baseline_file})")
+    regressions = []
+    for name, sizes in results.items():
+        for size, result in sizes.items():
+            before = baseline.get('results', {}).get(name, {}).get(size)
+            if not before:
+                continue
+            ratio = result['seconds'] / before['seconds'] if before['seconds'] else 1.0
+            marker = '⚠️ ' if ratio > threshold else '  '
+            print(f"{marker}{name:<14} {size:>6} pairs  {before['seconds']:9.4f}s → {result['seconds']:9.4f}s  "
+                  f"({ratio:.2f}x)")
+            if ratio > threshold:
+                regressions.append((name, size, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the benchmark suite and record results as JSON')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='Comma-separated pair counts')
+    parser.add_argument('--only', help=f"Comma-separated benchmarks to run ({', '.join(BENCHMARKS)})")
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement (best is kept)')
+    parser.add_argument('--output', help='Result file (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', help='Earlier result file to compare against')
+    parser.add_argument('--threshold', type=float, default=1.25, help='Slowdown ratio reported as a regression')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit non-zero on any regression')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    names = args.only.split(',') if args.only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    commit, dirty = git_commit()
+
+    print(f"🏁 Benchmarks at {commit}{' (uncommitted changes)' if dirty else ''}: "
+          f"{', '.join(names)} for {args.sizes} pairs")
+    print(f"{'benchmark':<14} {'pairs':>6} {'seconds':>10} {'µs/pair':>10}")
+    results = {}
+    cwd = os.getcwd()
+    for name in names:
+        results[name] = {}
+        for size in sizes:
+            workdir = tempfile.mkdtemp(prefix=f"bench-{name}-")
+            # The scripts write caches, indexes and pair folders relative to the working directory
+            os.chdir(workdir)
+            try:
+                with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                    seconds = BENCHMARKS[name](size, workdir, args.repeat)
+            finally:
+                os.chdir(cwd)
+                shutil.rmtree(workdir)
+            results[name][str(size)] = {"seconds": round(seconds, 6),
+                                        "per_pair_us": round(seconds / size * 1e6, 3)}
+            print(f"{name:<14} {size:>6} {seconds:>10.4f} {seconds / size * 1e6:>10.1f}")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}{'-dirty' if dirty else ''}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({
+            "commit": commit,
+            "dirty": dirty,
+            "created": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "results": results
+        }, f, indent=2)
+        f.write('\n')
+    print(f"💾 Results written to {output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions and args.fail_on_regression:
+            print(f"❌ {len(regressions)} benchmark(s) slower than {args.threshold:.2f}x the baseline")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
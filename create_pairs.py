@@ -1,33 +1,195 @@
 import os
+import sys
 import csv
+import argparse
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import islice
 
-csv_file = "../mentors_mentees.csv"
-pairs_folder = "pairings"
-project_csv_file = "project_cards.csv"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
 
-os.makedirs(pairs_folder, exist_ok=True)
+from instrumentation import timed  # noqa: E402
+from pair_identity import DEFAULT_INDEX_FILE, PairIndex, pair_key  # noqa: E402
+from pair_model import ContactInfo, Pair  # noqa: E402
+from pair_store import DEFAULT_STORE_FILE, PairStore  # noqa: E402
 
-with open(project_csv_file, "w", newline='') as project_csv:
-    writer = csv.writer(project_csv)
-    writer.writerow(["Pair", "Mentor", "Mentee", "Goals", "Progress", "Meetings", "Deliverables"])
+CSV_FILE = "../mentors_mentees.csv"
+PAIRS_FOLDER = "pairings"
+PROJECT_CSV_FILE = "project_cards.csv"
+BATCH_SIZE = 500
+WRITE_BUFFER = 1 << 20
 
+CARD_HEADER = ["Pair", "Mentor", "Mentee", "Goals", "Progress", "Meetings", "Deliverables"]
+README_SECTIONS = "## Goals\n- \n\n## Progress\n- \n\n## Meetings\n- \n\n## Deliverables\n- \n"
+
+# A roster row: its 1-based number, the folder it is written to and the pair itself
+RosterPair = namedtuple("RosterPair", ["number", "folder", "pair"])
+
+
+def read_pairs(csv_file):
+    """Stream pairs from the roster CSV, one row at a time"""
+    # encoding='utf-8-sig' removes BOM automatically
     with open(csv_file, newline='', encoding='utf-8-sig') as f:
-        # encoding='utf-8-sig' removes BOM automatically
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader, start=1):
+        for i, row in enumerate(csv.DictReader(f), start=1):
             mentor_email = row['mentor_email']
             mentee_email = row['mentee_email']
-
             mentor_name = mentor_email.split('@')[0]
             mentee_name = mentee_email.split('@')[0]
-            pair_folder = os.path.join(pairs_folder, f"pair-{i}-{mentor_name}-{mentee_name}")
-            os.makedirs(pair_folder, exist_ok=True)
+            pair = Pair(mentor_name, mentee_name,
+                        contact_info=ContactInfo(mentor_email=mentor_email, mentee_email=mentee_email))
+            yield RosterPair(i, f"pair-{i}-{mentor_name}-{mentee_name}", pair)
+
+
+@timed('parse')
+def find_roster_duplicates(csv_file):
+    """Pair key -> row numbers for every pair listed more than once"""
+    rows = {}
+    for row in read_pairs(csv_file):
+        rows.setdefault(pair_key(row.pair), []).append(row.number)
+    return {key: numbers for key, numbers in rows.items() if len(numbers) > 1}
+
+
+def readme_content(row):
+    return f"# Pair {row.number}: {row.pair.mentor} & {row.pair.mentee}\n\n" + README_SECTIONS
+
+
+def card_row(row):
+    contact_info = row.pair.contact_info
+    return [f"Pair {row.number}", contact_info.mentor_email, contact_info.mentee_email, "", "Not Started", "", ""]
+
+
+def write_file(path, content):
+    with open(path, "w") as f:
+        f.write(content)
+
+
+class FolderWriter:
+    """Creates pair folders and READMEs in batches on a thread pool"""
+
+    def __init__(self, pairs_folder, workers=8):
+        self.pairs_folder = pairs_folder
+        os.makedirs(pairs_folder, exist_ok=True)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.pending = []
+
+    def write_batch(self, rows):
+        # Wait for the previous batch so at most two batches are held in memory
+        self.flush()
+        # The parent exists, so a single mkdir() per folder replaces makedirs()' path walk
+        for row in rows:
+            try:
+                os.mkdir(os.path.join(self.pairs_folder, row.folder))
+            except FileExistsError:
+                pass
+        self.pending = [
+            self.executor.submit(write_file, os.path.join(self.pairs_folder, row.folder, "README.md"),
+                                 readme_content(row))
+            for row in rows
+        ]
+
+    def flush(self):
+        wait(self.pending)
+        for future in self.pending:
+            future.result()
+        self.pending = []
+
+    def close(self):
+        self.flush()
+        self.executor.shutdown()
+
+
+@timed('write')
+def create_pairs(csv_file=CSV_FILE, pairs_folder=PAIRS_FOLDER, project_csv_file=PROJECT_CSV_FILE,
+                 json_file=None, workers=8, batch_size=BATCH_SIZE, index_file=DEFAULT_INDEX_FILE,
+                 allow_duplicates=False, store_file=None):
+    """Generate pair folders, the project card CSV and optionally a JSON pair list and pair store"""
+    # Check the whole roster before writing anything
+    duplicates = find_roster_duplicates(csv_file)
+    for numbers in duplicates.values():
+        action = "keeping all" if allow_duplicates else f"skipping {', '.join(map(str, numbers[1:]))}"
+        print(f"Warning: rows {', '.join(map(str, numbers))} are the same pair ({action}).")
+
+    index = PairIndex(index_file) if index_file else None
+    store = PairStore(store_file) if store_file else None
+    folders = FolderWriter(pairs_folder, workers)
+    seen = set()
+    count = 0
+    json_out = open(json_file, "w", buffering=WRITE_BUFFER) if json_file else None
+    try:
+        with open(project_csv_file, "w", newline='', buffering=WRITE_BUFFER) as project_csv:
+            writer = csv.writer(project_csv)
+            writer.writerow(CARD_HEADER)
+            if json_out:
+                json_out.write("[")
+
+            pairs = read_pairs(csv_file)
+            while True:
+                rows = list(islice(pairs, batch_size))
+                if not rows:
+                    break
+                batch = []
+                for row in rows:
+                    key = pair_key(row.pair)
+                    if key in seen and not allow_duplicates:
+                        continue
+                    seen.add(key)
+                    if index:
+                        # Keep the folder a pair already has, even if the roster was reordered
+                        entry = index.get(key)
+                        if entry and entry.get('folder'):
+                            row = row._replace(folder=os.path.basename(entry['folder']))
+                        elif index.folder_owner(os.path.join(pairs_folder, row.folder)) not in (None, key):
+                            row = row._replace(folder=f"{row.folder}-{key[:8]}")
+                        index.record(row.pair, key, folder=os.path.join(pairs_folder, row.folder))
+                    batch.append(row)
+                folders.write_batch(batch)
+                writer.writerows(card_row(row) for row in batch)
+                if store:
+                    store.add_pairs((row.pair for row in batch), "roster", index)
+                if json_out:
+                    for row in batch:
+                        # The pair JSON layout scripts/migrate_pairings_to_projects_v2.py reads from --pair-data
+                        json_out.write(("\n  " if count == 0 else ",\n  ") + row.pair.to_json())
+                        count += 1
+                else:
+                    count += len(batch)
+
+            if json_out:
+                json_out.write("\n]\n")
+    finally:
+        folders.close()
+        if store:
+            store.close()
+        if json_out:
+            json_out.close()
+    if index:
+        index.save()
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate pair folders and project cards from a roster CSV')
+    parser.add_argument('--csv', default=CSV_FILE, help='Roster CSV with mentor_email and mentee_email columns')
+    parser.add_argument('--pairs-folder', default=PAIRS_FOLDER, help='Folder to create pair folders in')
+    parser.add_argument('--project-csv', default=PROJECT_CSV_FILE, help='Project cards CSV to write')
+    parser.add_argument('--json', help='Also export the pairs as JSON (for migrate_pairings_to_projects_v2.py)')
+    parser.add_argument('--workers', type=int, default=8, help='Threads writing README files')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='Rows processed per batch')
+    parser.add_argument('--index-file', default=DEFAULT_INDEX_FILE, help='Pair index (pair key -> folder, card)')
+    parser.add_argument('--allow-duplicates', action='store_true', help='Create folders for repeated pairs too')
+    parser.add_argument('--store-file',
+                        help=f'SQLite pair store to add the pairs to, e.g. {DEFAULT_STORE_FILE} (default: none)')
+    args = parser.parse_args()
+
+    count = create_pairs(args.csv, args.pairs_folder, args.project_csv, args.json,
+                         max(1, args.workers), max(1, args.batch_size), args.index_file, args.allow_duplicates,
+                         args.store_file)
 
-            with open(os.path.join(pair_folder, "README.md"), "w") as readme:
-                readme.write(f"# Pair {i}: {mentor_name} & {mentee_name}\n\n")
-                readme.write("## Goals\n- \n\n## Progress\n- \n\n## Meetings\n- \n\n## Deliverables\n- \n")
+    print(f"Created {args.pairs_folder} folder with {count} pair placeholders.")
+    print(f"Generated {args.project_csv} for GitHub Project import.")
+    if args.json:
+        print(f"Exported pairs to {args.json}.")
 
-            writer.writerow([f"Pair {i}", mentor_email, mentee_email, "", "Not Started", "", ""])
 
-print(f"Created {pairs_folder} folder with pair placeholders.")
-print(f"Generated {project_csv_file} for GitHub Project import.")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Async Mentorship Issue Processing
+
+Runs the steps of MentorshipIssueProcessor.process_issue as a dependency graph
+on an asyncio event loop so that independent API calls overlap:
+
+    get_issue ─┐                         ┌─ generate folders
+               ├─ parse ─ create card ───┼─ add comment
+    project ───┘                         └─ close issue
+
+HTTP calls are dispatched to a bounded thread pool over the shared pooled
+client, so the async path keeps the same connection reuse, rate limiting and
+retries as the synchronous scripts without adding an async HTTP dependency.
+"""
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from process_mentorship_issue import MentorshipIssueProcessor
+
+DEFAULT_WORKERS = 8
+
+
+class AsyncTransport:
+    """Awaitable wrapper that runs blocking client calls on a bounded thread pool"""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='github')
+
+    async def call(self, func: Callable, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+class AsyncMentorshipIssueProcessor:
+    """Processes mentorship issues with independent API calls running concurrently"""
+
+    def __init__(self, processor: MentorshipIssueProcessor, workers: int = DEFAULT_WORKERS):
+        self.processor = processor
+        self.transport = AsyncTransport(workers)
+        processor.client.ensure_pool_size(workers)
+
+    async def process_issue(self, issue_number: int, issue: Optional[Dict] = None,
+                            project_id: Optional[int] = None) -> bool:
+        """Process a mentorship issue; pass `issue` / `project_id` to skip looking them up"""
+        processor = self.processor
+        call = self.transport.call
+
+        # The issue fetch and the project lookup do not depend on each other
+        fetch = call(processor.get_issue, issue_number) if issue is None else _value(issue)
+        lookup = call(processor.find_mentorship_project) if project_id is None else _value(project_id)
+        issue, project_id = await asyncio.gather(fetch, lookup)
+        if not issue:
+            return False
+
+        pair = processor.extract_pair(issue_number, issue)
+        if not pair:
+            return False
+
+        project_id = await call(processor.ensure_project, project_id)
+        if not project_id:
+            return False
+
+        card_result = await call(processor.create_card, project_id, pair)
+        if not card_result:
+            return False
+
+        # Folders, comment and close only need the card to exist
+        await asyncio.gather(
+            call(processor.generate_folders, pair),
+            call(processor.add_processing_comment, issue_number, pair, project_id, card_result.get('id')),
+            call(processor.close_issue, issue_number)
+        )
+        # Stored last, with the folder and card the index now holds
+        await call(processor.store_pair, issue_number, pair)
+        return True
+
+    async def process_backlog(self, issues: List[Dict], concurrency: int = 4) -> Dict:
+        """Drain many issues through a bounded concurrent pipeline and summarize the run"""
+        processor = self.processor
+        # Resolve (or create) the project once so parallel issues don't race to create it
+        project_id = await self.transport.call(
+            lambda: processor.ensure_project(processor.find_mentorship_project()))
+        if not project_id:
+            return {"processed": 0, "succeeded": 0, "failed": [], "elapsed": 0.0}
+
+        limit = asyncio.Semaphore(max(1, concurrency))
+        results: List[Tuple[int, bool]] = []
+
+        async def run(issue: Dict):
+            number = issue['number']
+            try:
+                ok = await self.process_issue(number, issue, project_id)
+            except Exception as e:
+                print(f"❌ Issue #{number} failed: {e}")
+                ok = False
+            finally:
+                limit.release()
+            results.append((number, ok))
+
+        start = time.perf_counter()
+        # Start each issue as soon as a slot frees up
+        tasks = []
+        for issue in issues:
+            await limit.acquire()
+            tasks.append(asyncio.create_task(run(issue)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+
+        failed = sorted(number for number, ok in results if not ok)
+        summary = {
+            "processed": len(results),
+            "succeeded": len(results) - len(failed),
+            "failed": failed,
+            "elapsed": elapsed
+        }
+        rate = len(results) / elapsed * 60 if elapsed else 0.0
+        print(f"📊 Backlog: {summary['succeeded']}/{summary['processed']} issues processed "
+              f"in {elapsed:.1f}s ({rate:.1f} issues/min)")
+        if failed:
+            print(f"❌ Failed issues: {', '.join(f'#{number}' for number in failed)}")
+        return summary
+
+    def close(self):
+        self.transport.close()
+
+
+async def _value(value):
+    return value
+
+
+def process_backlog(processor: MentorshipIssueProcessor, since: Optional[str] = None,
+                    concurrency: int = 4) -> Dict:
+    """Process every open mentorship issue (optionally created since a date)
+
+    Processed issues are closed, which shifts the pages of an is:open search,
+    so each pass collects the whole search result before processing any of
+    it. Passes repeat until the search holds no issue this run hasn't tried
+    (it returns at most 1000 results).
+    """
+    engine = AsyncMentorshipIssueProcessor(processor, workers=max(DEFAULT_WORKERS, concurrency * 3))
+    summary = {"processed": 0, "succeeded": 0, "failed": [], "elapsed": 0.0}
+    tried = set()
+    passes = 0
+    try:
+        while True:
+            issues = [issue for issue in processor.search_mentorship_issues(since) if issue['number'] not in tried]
+            if not issues:
+                break
+            tried.update(issue['number'] for issue in issues)
+            result = asyncio.run(engine.process_backlog(issues, concurrency))
+            passes += 1
+            for key in ('processed', 'succeeded', 'failed', 'elapsed'):
+                summary[key] += result[key]
+    finally:
+        engine.close()
+    if passes > 1:
+        print(f"📊 Total over {passes} searches: {summary['succeeded']}/{summary['processed']} issues processed")
+    return summary
+
+
+def process_issue_async(processor: MentorshipIssueProcessor, issue_number: int,
+                        issue: Optional[Dict] = None) -> bool:
+    """Run the async processor for a single issue from synchronous code"""
+    engine = AsyncMentorshipIssueProcessor(processor)
+    try:
+        return asyncio.run(engine.process_issue(issue_number, issue))
+    finally:
+        engine.close()
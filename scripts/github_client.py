@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Shared GitHub HTTP Client
+
+This module provides a single pooled, keep-alive HTTP transport for every
+GitHub REST and GraphQL call made by the mentorship scripts. Reusing one
+requests.Session per token means repeated calls share TCP/TLS connections
+instead of paying a fresh handshake on each request. GET responses are
+revalidated with ETags through the persistent cache in http_cache.py.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import instrumentation
+from http_cache import ResponseCache, get_response_cache, token_scope
+from rate_limit import READ_METHODS, RateLimitScheduler
+
+DEFAULT_API_URL = 'https://api.github.com'
+DEFAULT_TIMEOUT = (10, 30)  # (connect, read) seconds
+DEFAULT_POOL_SIZE = 16
+PER_PAGE = 100  # GitHub's maximum page size
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class GitHubClient:
+    """Session-backed GitHub client with a tuned connection pool"""
+
+    def __init__(self, token: str, base_url: Optional[str] = None,
+                 graphql_url: Optional[str] = None,
+                 timeout: Timeout = DEFAULT_TIMEOUT,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 scheduler: Optional[RateLimitScheduler] = None,
+                 cache_responses: bool = True):
+        self.token = token
+        self.scope = token_scope(token)
+        # GITHUB_API_URL / GITHUB_GRAPHQL_URL are set by GitHub Actions and
+        # also let the scripts be pointed at a local server.
+        self.base_url = (base_url or os.getenv('GITHUB_API_URL') or DEFAULT_API_URL).rstrip('/')
+        self.graphql_url = graphql_url or os.getenv('GITHUB_GRAPHQL_URL') or f"{self.base_url}/graphql"
+        self.timeout = timeout
+        self.pool_size = 0
+        self.scheduler = scheduler or RateLimitScheduler()
+        self.response_cache: Optional[ResponseCache] = get_response_cache() if cache_responses else None
+
+        self.session = requests.Session()
+        self.ensure_pool_size(pool_size)
+        self.session.headers.update({
+            'Authorization': f'Bearer {token}',
+            'Accept': 'application/vnd.github+json',
+            'X-GitHub-Api-Version': '2022-11-28',
+            'User-Agent': 'latinxinai-mentorship-scripts'
+        })
+
+    def ensure_pool_size(self, pool_size: int):
+        """Grow the per-host connection pool to at least pool_size"""
+        if pool_size <= self.pool_size:
+            return
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.pool_size = pool_size
+
+    def url(self, path: str) -> str:
+        """Resolve an API path (or pass through an absolute URL)"""
+        if path.startswith(('http://', 'https://')):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send a request through the pooled session, pacing and retrying on rate limits"""
+        kwargs.setdefault('timeout', self.timeout)
+        url = self.url(path)
+        resource, mutation = self._classify(url, kwargs.get('json'))
+        scheduler = self.scheduler
+
+        # Send the validators of a cached copy; a 304 then costs no rate limit
+        cache_key = cached = None
+        if self.response_cache is not None and method.upper() == 'GET':
+            cache_key = self.response_cache.key(self.scope, url, kwargs.get('params'))
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                kwargs['headers'] = dict(kwargs.get('headers') or {},
+                                         **self.response_cache.conditional_headers(cached))
+
+        attempt = 0
+        idle_since = time.perf_counter()
+        while True:
+            scheduler.acquire(method, resource, mutation)
+            try:
+                response = self._send(method, url, kwargs, resource, idle_since)
+            except (requests.ConnectionError, requests.Timeout):
+                if method.upper() not in READ_METHODS or attempt >= scheduler.max_retries:
+                    raise
+                response = None
+            else:
+                scheduler.observe(response)
+                if attempt >= scheduler.max_retries or not scheduler.should_retry(method, response):
+                    if cache_key is not None:
+                        return self._through_cache(cache_key, cached, response)
+                    return response
+
+            delay = scheduler.retry_delay(response, attempt)
+            status = response.status_code if response is not None else 'connection error'
+            print(f"⏳ {method} {url} hit {status}; retrying in {delay:.1f}s "
+                  f"(attempt {attempt + 1}/{scheduler.max_retries})")
+            idle_since = time.perf_counter()
+            time.sleep(delay)
+            attempt += 1
+
+    def _send(self, method: str, url: str, kwargs: Dict, resource: str, idle_since: float) -> requests.Response:
+        """One HTTP attempt, recorded when instrumentation is enabled"""
+        recorder = instrumentation.recorder
+        if recorder is None:
+            return self.session.request(method, url, **kwargs)
+        # Time since the previous attempt (or the call) is rate-limit pacing and backoff
+        start = time.perf_counter()
+        response = None
+        try:
+            response = self.session.request(method, url, **kwargs)
+            return response
+        finally:
+            recorder.record_call(method, url, kwargs.get('json'), response, time.perf_counter() - start,
+                                 start - idle_since, graphql=resource == 'graphql')
+
+    def _through_cache(self, key: str, cached: Optional[Dict], response: requests.Response) -> requests.Response:
+        """Answer a 304 from the cache, or remember a fresh response"""
+        if response.status_code == 304 and cached is not None:
+            return self.response_cache.revalidated(cached, response)
+        self.response_cache.store(key, response)
+        return response
+
+    def _classify(self, url: str, payload) -> Tuple[str, bool]:
+        """Return the rate-limit resource for a URL and whether it is a GraphQL mutation"""
+        if url == self.graphql_url:
+            query = payload.get('query', '') if isinstance(payload, dict) else ''
+            return 'graphql', query.lstrip().startswith('mutation')
+        if '/search/' in url:
+            return 'search', False
+        return 'core', False
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request('POST', path, **kwargs)
+
+    def patch(self, path: str, **kwargs) -> requests.Response:
+        return self.request('PATCH', path, **kwargs)
+
+    def graphql(self, query: str, variables: Optional[Dict] = None) -> requests.Response:
+        """POST a GraphQL document to the GraphQL endpoint"""
+        payload = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        response = self.request('POST', self.graphql_url, json=payload)
+        if b'"rateLimit"' in response.content:
+            data = response.json().get('data') or {}
+            self.scheduler.observe_graphql(data.get('rateLimit'))
+        return response
+
+    def paginate(self, path: str, params: Optional[Dict] = None,
+                 items_key: Optional[str] = None) -> Iterator[Dict]:
+        """Lazily yield items from a paginated REST endpoint, following Link headers
+
+        Stop iterating early to skip the remaining pages. Raises
+        requests.HTTPError if a page cannot be fetched.
+        """
+        params = dict(params or {})
+        params.setdefault('per_page', PER_PAGE)
+        url = self.url(path)
+        while url:
+            response = self.get(url, params=params)
+            response.raise_for_status()
+            page = response.json()
+            yield from (page.get(items_key, []) if items_key else page)
+            # The next link already carries the query string
+            url = response.links.get('next', {}).get('url')
+            params = None
+
+    def paginate_graphql(self, query: str, variables: Optional[Dict],
+                         connection_path: Sequence[str]) -> Iterator[Dict]:
+        """Lazily yield nodes from a cursor-paginated GraphQL connection
+
+        The query must accept a `$cursor: String` variable and select
+        `pageInfo { hasNextPage endCursor }` and `nodes` on the connection
+        found at `connection_path` under `data`.
+        """
+        variables = dict(variables or {})
+        variables['cursor'] = None
+        while True:
+            response = self.graphql(query, variables)
+            response.raise_for_status()
+            result = response.json()
+            if result.get('errors'):
+                raise requests.HTTPError(f"GraphQL errors: {result['errors']}", response=response)
+            connection = result.get('data') or {}
+            for key in connection_path:
+                connection = (connection or {}).get(key)
+            if not connection:
+                return
+            yield from connection.get('nodes', [])
+            page_info = connection.get('pageInfo', {})
+            if not page_info.get('hasNextPage'):
+                return
+            variables['cursor'] = page_info['endCursor']
+
+    def close(self):
+        self.session.close()
+
+
+_clients: Dict[str, GitHubClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(token: str, **kwargs) -> GitHubClient:
+    """Return the shared client for a token, creating it on first use"""
+    with _clients_lock:
+        client = _clients.get(token)
+        if client is None:
+            client = GitHubClient(token, **kwargs)
+            _clients[token] = client
+        return client
+
+
+def close_clients():
+    """Close every shared client (mainly for tests and benchmarks)"""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
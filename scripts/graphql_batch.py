@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Batched GraphQL Mutations
+
+Packs many mutations into a single GraphQL document using aliases
+(`m0: addProjectV2DraftIssue(...)`, `m1: ...`) so a bulk import costs a
+handful of round trips instead of one per pair. Per-alias results and errors
+are mapped back to the operation that produced them, and a batch that GitHub
+rejects for being too large or too expensive is split in half and retried.
+Any other failure (auth, timeouts, 5xx) is raised without re-sending, since
+the server may already have applied the batch.
+"""
+
+import json
+from typing import Callable, Dict, List, Optional
+
+# Error types / message fragments GitHub uses when it refuses a document
+# before running it because it is too big or too complex
+LIMIT_ERROR_TYPES = {'MAX_NODE_LIMIT_EXCEEDED', 'RESOURCE_LIMITS_EXCEEDED', 'EXCESSIVE_PAGINATION'}
+LIMIT_ERROR_HINTS = ('complexity', 'node limit', 'exceeds the limit', 'too large')
+
+DEFAULT_BATCH_SIZE = 50
+
+
+class BatchTooLarge(Exception):
+    """Raised when GitHub rejects a whole batch because of its size or cost"""
+
+
+class Mutation:
+    """A single mutation call to be packed into a batch"""
+
+    def __init__(self, name: str, input: Dict, selection: str, key: Optional[str] = None):
+        self.name = name
+        self.input = input
+        self.selection = selection
+        self.key = key  # caller's identifier, e.g. the pair title
+
+    def render(self, alias: str) -> str:
+        return f"{alias}: {self.name}(input: {graphql_literal(self.input)}) {{ {self.selection} }}"
+
+
+def graphql_literal(value) -> str:
+    """Render a Python value as an inline GraphQL input literal"""
+    if isinstance(value, dict):
+        fields = ', '.join(f"{key}: {graphql_literal(item)}" for key, item in value.items())
+        return f"{{{fields}}}"
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(graphql_literal(item) for item in value)}]"
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if value is None:
+        return 'null'
+    if isinstance(value, (int, float)):
+        return str(value)
+    # JSON string escapes are valid GraphQL string escapes
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+def add_item_mutation(project_id: str, title: str, body: str = '') -> Mutation:
+    """Build an addProjectV2DraftIssue mutation adding one pair as a draft item"""
+    return Mutation('addProjectV2DraftIssue',
+                    {"projectId": project_id, "title": title, "body": body},
+                    'projectItem { id }', key=title)
+
+
+def field_update_mutation(project_id: str, item_id: str, field_id: str, value: Dict,
+                          key: Optional[str] = None) -> Mutation:
+    """Build an updateProjectV2ItemFieldValue mutation (value e.g. {"text": "..."})"""
+    return Mutation('updateProjectV2ItemFieldValue',
+                    {"projectId": project_id, "itemId": item_id, "fieldId": field_id, "value": value},
+                    'projectV2Item { id }', key=key or item_id)
+
+
+def build_document(mutations: List[Mutation]) -> str:
+    """Pack mutations into one aliased GraphQL document"""
+    body = '\n  '.join(mutation.render(f"m{i}") for i, mutation in enumerate(mutations))
+    return f"mutation {{\n  {body}\n}}"
+
+
+def _is_limit_error(error: Dict) -> bool:
+    if error.get('type') in LIMIT_ERROR_TYPES:
+        return True
+    message = str(error.get('message', '')).lower()
+    return any(hint in message for hint in LIMIT_ERROR_HINTS)
+
+
+class GraphQLMutationBatcher:
+    """Executes mutations in aliased batches, splitting batches that are too large"""
+
+    def __init__(self, run: Callable[[str], Dict], batch_size: int = DEFAULT_BATCH_SIZE):
+        self.run = run
+        self.batch_size = max(1, batch_size)
+        self.requests = 0
+
+    def execute(self, mutations: List[Mutation]) -> List[Dict]:
+        """Run all mutations; returns one {"key", "data", "error"} dict per mutation, in order"""
+        results = []
+        start = 0
+        while start < len(mutations):
+            batch = mutations[start:start + self.batch_size]
+            results.extend(self._execute_batch(batch))
+            start += len(batch)
+        return results
+
+    def _execute_batch(self, batch: List[Mutation]) -> List[Dict]:
+        try:
+            return self._send(batch)
+        except BatchTooLarge as e:
+            if len(batch) == 1:
+                return [{"key": batch[0].key, "data": None, "error": str(e)}]
+            middle = len(batch) // 2
+            # Later batches start at the size that is known to fit
+            self.batch_size = min(self.batch_size, middle)
+            print(f"[INFO] Batch of {len(batch)} rejected ({e}); splitting")
+            return self._execute_batch(batch[:middle]) + self._execute_batch(batch[middle:])
+
+    def _send(self, batch: List[Mutation]) -> List[Dict]:
+        self.requests += 1
+        # Request failures propagate: the batch may have been applied already
+        response = self.run(build_document(batch))
+
+        data = response.get('data') or {}
+        aliases = [f"m{i}" for i in range(len(batch))]
+        alias_errors: Dict[str, str] = {}
+        for error in response.get('errors', []):
+            path = error.get('path') or []
+            if path and path[0] in aliases:
+                alias_errors[path[0]] = error.get('message', 'Unknown error')
+            elif _is_limit_error(error):
+                raise BatchTooLarge(error.get('message', 'GraphQL limit exceeded'))
+            else:
+                # Document-level error with no alias: it applies to every mutation
+                message = error.get('message', 'Unknown error')
+                for alias in aliases:
+                    alias_errors.setdefault(alias, message)
+
+        results = []
+        for alias, mutation in zip(aliases, batch):
+            results.append({
+                "key": mutation.key,
+                "data": data.get(alias),
+                "error": alias_errors.get(alias) or (None if data.get(alias) else "No data returned")
+            })
+        return results
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Conditional Request Cache
+
+Keeps the ETag / Last-Modified validators and bodies of GitHub GET responses
+on disk, so the next run can send If-None-Match / If-Modified-Since and get a
+304 Not Modified back. GitHub does not charge 304s against the rate limit,
+and the cached body is handed to the caller as if the request had returned
+200. Entries are keyed by token scope and URL and evicted least recently used
+once the bodies exceed a size budget.
+
+Only REST reads benefit: GraphQL is always a POST, and the GraphQL ID lookups
+are cached separately by id_cache.py.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from id_cache import CACHE_DIR
+
+DEFAULT_MAX_BYTES = int(float(os.getenv('MENTORSHIP_HTTP_CACHE_MB', '32')) * 2**20)
+CACHE_VERSION = 1
+# Headers replayed with a cached body; rate-limit headers come from the 304 itself
+STORED_HEADERS = ('Content-Type', 'Link', 'ETag', 'Last-Modified')
+
+
+class ResponseCache:
+    """Persistent, size-bounded LRU cache of validated GET responses"""
+
+    def __init__(self, path: str = os.path.join(CACHE_DIR, 'http_cache.json'),
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        # Resolved now so a later chdir() doesn't move the file
+        self.path = os.path.abspath(path)
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.dirty = False
+        self.lock = threading.Lock()
+        self.entries: 'OrderedDict[str, Dict]' = self._load()
+
+    def _load(self) -> 'OrderedDict[str, Dict]':
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return OrderedDict()
+        if data.get('version') != CACHE_VERSION:
+            return OrderedDict()
+        # Stored least recently used first
+        entries = OrderedDict(data.get('entries', {}))
+        self.size = sum(len(entry['body']) for entry in entries.values())
+        return entries
+
+    def save(self):
+        """Write the cache back if anything changed"""
+        with self.lock:
+            if not self.dirty:
+                return
+            try:
+                # Only the cache directory itself is created, never its parents
+                os.mkdir(os.path.dirname(self.path))
+            except FileExistsError:
+                pass
+            except OSError:
+                return
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": CACHE_VERSION, "entries": self.entries}, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+
+    @staticmethod
+    def key(scope: str, url: str, params: Optional[Dict] = None) -> str:
+        """Cache key for a GET: the token scope plus the full URL with its query string"""
+        if params:
+            url = requests.Request('GET', url, params=params).prepare().url
+        return f"{scope} {url}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def conditional_headers(self, entry: Dict) -> Dict[str, str]:
+        """Validators to send with a request for a cached URL"""
+        headers = {}
+        if entry['headers'].get('ETag'):
+            headers['If-None-Match'] = entry['headers']['ETag']
+        if entry['headers'].get('Last-Modified'):
+            headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+        return headers
+
+    def store(self, key: str, response: requests.Response):
+        """Remember a 200 response that carries a validator"""
+        headers = response.headers
+        if response.status_code != 200 or not (headers.get('ETag') or headers.get('Last-Modified')):
+            return
+        try:
+            body = response.content.decode('utf-8')
+        except UnicodeDecodeError:
+            return
+        if len(body) > self.max_bytes:
+            return
+        entry = {"headers": {name: headers[name] for name in STORED_HEADERS if name in headers},
+                 "body": body, "stored_at": time.time()}
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous['body'])
+            self.entries[key] = entry
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted['body'])
+            self.dirty = True
+
+    def revalidated(self, entry: Dict, response: requests.Response) -> requests.Response:
+        """Turn a 304 into the 200 response it stands for, using the cached body"""
+        cached = requests.Response()
+        cached.status_code = 200
+        cached.reason = 'OK'
+        cached.headers = CaseInsensitiveDict(entry['headers'])
+        cached.headers.update(response.headers)
+        cached._content = entry['body'].encode('utf-8')
+        cached.encoding = 'utf-8'
+        cached.url = response.url
+        cached.request = response.request
+        cached.elapsed = response.elapsed
+        cached.from_cache = True
+        return cached
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+            self.dirty = True
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """The shared response cache, saved at exit (None when MENTORSHIP_HTTP_CACHE_MB=0)"""
+    global _cache
+    if DEFAULT_MAX_BYTES <= 0:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+            atexit.register(_cache.save)
+        return _cache
+
+
+def token_scope(token: str) -> str:
+    """Short hash identifying a token, so cached responses are never shared across tokens"""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Node ID Cache
+
+GitHub node IDs for owners, repositories and projects (and the login behind a
+token) never change, yet every script used to resolve them on each run. This
+module keeps them in a small on-disk JSON cache with a TTL, scoped per token,
+so warm runs skip those lookups entirely.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+CACHE_DIR = os.getenv('MENTORSHIP_CACHE_DIR', '.mentorship_cache')
+DEFAULT_TTL = 7 * 24 * 3600  # one week
+
+
+class IdCache:
+    """Persistent key/value cache for GitHub node IDs with expiry"""
+
+    def __init__(self, path: str = os.path.join(CACHE_DIR, 'ids.json'), ttl: float = DEFAULT_TTL,
+                 scope: str = ''):
+        self.path = path
+        self.ttl = ttl
+        self.scope = scope
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def _key(self, kind: str, name: str) -> str:
+        return f"{self.scope}:{kind}:{name}"
+
+    def get(self, kind: str, name: str):
+        """Return a cached value, or None if missing or expired"""
+        with self.lock:
+            entry = self.entries.get(self._key(kind, name))
+            if not entry or time.time() - entry['stored_at'] > self.ttl:
+                return None
+            return entry['value']
+
+    def set(self, kind: str, name: str, value):
+        """Store a value and persist the cache"""
+        with self.lock:
+            self.entries[self._key(kind, name)] = {"value": value, "stored_at": time.time()}
+            self._save()
+
+    def invalidate(self, kind: Optional[str] = None, name: Optional[str] = None):
+        """Drop one entry, every entry of a kind, or (no arguments) this scope's entries"""
+        prefix = f"{self.scope}:"
+        if kind:
+            prefix += f"{kind}:"
+            if name is not None:
+                prefix += name
+        with self.lock:
+            stale = [key for key in self.entries
+                     if key.startswith(prefix) and (name is None or key == prefix)]
+            for key in stale:
+                del self.entries[key]
+            if stale:
+                self._save()
+
+    def cached(self, kind: str, name: str, resolve: Callable[[], Optional[str]]):
+        """Return the cached value, resolving and storing it on a miss"""
+        value = self.get(kind, name)
+        if value is None:
+            value = resolve()
+            if value is not None:
+                self.set(kind, name, value)
+        return value
+
+
+_caches: Dict[str, IdCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_id_cache(token: str) -> IdCache:
+    """Return the shared ID cache for a token (entries are scoped per token)"""
+    scope = hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]
+    with _caches_lock:
+        if scope not in _caches:
+            _caches[scope] = IdCache(scope=scope)
+        return _caches[scope]
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Run Instrumentation
+
+Records every GitHub API call (method, endpoint template, status, latency,
+time spent waiting on rate limits, bytes, remaining budget and GraphQL cost)
+and the time spent in local phases (scan, parse, render, write), so a slow
+run can be pinned on the network, the API budget or the disk.
+
+Set MENTORSHIP_METRICS to a file path to enable it for any script. When the
+script exits the summary is written there as JSON, printed, and added as a
+table to the GitHub Actions step summary if GITHUB_STEP_SUMMARY is set. When
+it is not enabled, phase hooks are left out entirely and each API call costs
+a single check of the module-level `recorder`.
+"""
+
+import atexit
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+METRICS_ENV = 'MENTORSHIP_METRICS'
+STEP_SUMMARY_ENV = 'GITHUB_STEP_SUMMARY'
+
+# Path segments that are followed by names rather than fixed resources
+_NAMED_SEGMENTS = {'repos': ('{owner}', '{repo}'), 'users': ('{owner}',), 'orgs': ('{owner}',)}
+_GRAPHQL_FIELD = re.compile(r'\{\s*(?:\w+\s*:\s*)?(\w+)')
+
+
+def endpoint_template(url: str) -> str:
+    """REST path with names and ids replaced, e.g. /repos/{owner}/{repo}/issues/{id}"""
+    segments = urlsplit(url).path.strip('/').split('/')
+    template = []
+    names = ()
+    for segment in segments:
+        if names:
+            template.append(names[0])
+            names = names[1:]
+        elif segment.isdigit():
+            template.append('{id}')
+        else:
+            template.append(segment)
+            names = _NAMED_SEGMENTS.get(segment, ())
+    return '/' + '/'.join(template)
+
+
+def graphql_operation(payload) -> str:
+    """`graphql query <field>` / `graphql mutation <field>` for a GraphQL request body"""
+    query = payload.get('query', '') if isinstance(payload, dict) else ''
+    kind = 'mutation' if query.lstrip().startswith('mutation') else 'query'
+    match = _GRAPHQL_FIELD.search(query)
+    return f"graphql {kind} {match.group(1) if match else '?'}"
+
+
+class _Phase:
+    """Context manager adding its duration to a phase"""
+
+    __slots__ = ('recorder', 'name', 'start')
+
+    def __init__(self, recorder: 'Recorder', name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.recorder.record_phase(self.name, time.perf_counter() - self.start)
+
+
+class Recorder:
+    """Thread-safe collector of API calls and phase timings"""
+
+    def __init__(self, output: Optional[str] = None):
+        self.output = output
+        self.started = time.perf_counter()
+        # (method, endpoint, status, seconds, wait, sent, received, resource, remaining, cost)
+        self.calls: List[tuple] = []
+        self.phases: Dict[str, List[float]] = defaultdict(list)
+        self.graphql_used: Optional[int] = None
+        self.lock = threading.Lock()
+
+    def record_call(self, method: str, url: str, payload, response, seconds: float, wait: float,
+                    graphql: bool = False):
+        """Record one HTTP attempt; `response` is None when the request raised"""
+        endpoint = graphql_operation(payload) if graphql else endpoint_template(url)
+        sent = received = 0
+        resource = remaining = cost = None
+        status = 'error'
+        if response is not None:
+            status = response.status_code
+            body = response.request.body if response.request is not None else None
+            sent = len(body or b'')
+            received = len(response.content)
+            headers = response.headers
+            resource = headers.get('X-RateLimit-Resource', 'graphql' if graphql else 'core')
+            if headers.get('X-RateLimit-Remaining', '').isdigit():
+                remaining = int(headers['X-RateLimit-Remaining'])
+            used = headers.get('X-RateLimit-Used', '')
+            if graphql and used.isdigit():
+                with self.lock:
+                    # Budget used since the previous GraphQL response; with
+                    # concurrent calls the points can land on a neighbour, but
+                    # the total is exact
+                    if self.graphql_used is not None:
+                        cost = max(0, int(used) - self.graphql_used)
+                    self.graphql_used = max(int(used), self.graphql_used or 0)
+            if graphql and b'"rateLimit"' in response.content:
+                # Queries that select rateLimit { cost } report it exactly
+                rate_limit = ((response.json().get('data') or {}).get('rateLimit') or {})
+                cost = rate_limit.get('cost', cost)
+        call = (method.upper(), endpoint, status, seconds, wait, sent, received, resource, remaining, cost)
+        with self.lock:
+            self.calls.append(call)
+
+    def record_phase(self, name: str, seconds: float):
+        with self.lock:
+            self.phases[name].append(seconds)
+
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self, name)
+
+    def summary(self) -> Dict:
+        """Totals for the run, per endpoint and per phase"""
+        with self.lock:
+            calls = list(self.calls)
+            phases = {name: list(durations) for name, durations in self.phases.items()}
+
+        endpoints: Dict[tuple, Dict] = {}
+        remaining: Dict[str, int] = {}
+        for method, endpoint, status, seconds, wait, sent, received, resource, left, cost in calls:
+            entry = endpoints.get((method, endpoint))
+            if entry is None:
+                entry = endpoints[(method, endpoint)] = {
+                    "method": method, "endpoint": endpoint, "calls": 0, "errors": 0, "statuses": {},
+                    "latencies": [], "wait_seconds": 0.0, "bytes_sent": 0, "bytes_received": 0,
+                    "graphql_cost": 0
+                }
+            entry["calls"] += 1
+            entry["statuses"][str(status)] = entry["statuses"].get(str(status), 0) + 1
+            if status == 'error' or status >= 400:
+                entry["errors"] += 1
+            entry["latencies"].append(seconds)
+            entry["wait_seconds"] += wait
+            entry["bytes_sent"] += sent
+            entry["bytes_received"] += received
+            entry["graphql_cost"] += cost or 0
+            if left is not None:
+                remaining[resource] = min(left, remaining.get(resource, left))
+
+        rows = []
+        for entry in endpoints.values():
+            latencies = sorted(entry.pop("latencies"))
+            entry["seconds"] = round(sum(latencies), 6)
+            entry["mean_ms"] = round(entry["seconds"] / len(latencies) * 1000, 3)
+            entry["p95_ms"] = round(_percentile(latencies, 0.95) * 1000, 3)
+            entry["max_ms"] = round(latencies[-1] * 1000, 3)
+            entry["wait_seconds"] = round(entry["wait_seconds"], 6)
+            rows.append(entry)
+        rows.sort(key=lambda entry: entry["seconds"], reverse=True)
+
+        return {
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "api": {
+                "calls": len(calls),
+                "errors": sum(entry["errors"] for entry in rows),
+                "seconds": round(sum(entry["seconds"] for entry in rows), 6),
+                "wait_seconds": round(sum(entry["wait_seconds"] for entry in rows), 6),
+                "bytes_sent": sum(entry["bytes_sent"] for entry in rows),
+                "bytes_received": sum(entry["bytes_received"] for entry in rows),
+                "graphql_cost": sum(entry["graphql_cost"] for entry in rows),
+                "rate_limit_remaining": remaining
+            },
+            "endpoints": rows,
+            "phases": [
+                {"phase": name, "count": len(durations), "seconds": round(sum(durations), 6),
+                 "max_ms": round(max(durations) * 1000, 3)}
+                for name, durations in sorted(phases.items(), key=lambda item: -sum(item[1]))
+            ]
+        }
+
+    def report(self):
+        """Write the JSON summary and the step summary table, and print the totals"""
+        summary = self.summary()
+        if not summary["api"]["calls"] and not summary["phases"]:
+            # Nothing ran (e.g. a usage error); don't leave an empty report behind
+            return
+        if self.output:
+            with open(self.output, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, indent=2)
+                f.write('\n')
+        step_summary = os.getenv(STEP_SUMMARY_ENV)
+        if step_summary:
+            with open(step_summary, 'a', encoding='utf-8') as f:
+                f.write(markdown_summary(summary))
+        api = summary["api"]
+        print(f"📊 {api['calls']} API calls: {api['seconds']:.2f}s in requests, "
+              f"{api['wait_seconds']:.2f}s waiting on rate limits, {api['graphql_cost']} GraphQL points; "
+              f"{summary['wall_seconds']:.2f}s total"
+              + (f" (metrics written to {self.output})" if self.output else ""))
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(round(fraction * (len(values) - 1))))]
+
+
+def markdown_summary(summary: Dict) -> str:
+    """GitHub-flavoured markdown tables for the step summary"""
+    api = summary["api"]
+    lines = [
+        "### 📊 Mentorship script timings",
+        "",
+        f"{api['calls']} API calls ({api['errors']} failed) took {api['seconds']:.2f}s, plus "
+        f"{api['wait_seconds']:.2f}s waiting on rate limits; {api['bytes_received'] / 1024:.1f} KiB received, "
+        f"{api['graphql_cost']} GraphQL points used. Wall time {summary['wall_seconds']:.2f}s.",
+        ""
+    ]
+    if api["rate_limit_remaining"]:
+        lines += ["Rate limit remaining: " + ", ".join(
+            f"{resource} {left}" for resource, left in sorted(api["rate_limit_remaining"].items())), ""]
+    if summary["endpoints"]:
+        lines += ["| Endpoint | Calls | Errors | Total s | Mean ms | p95 ms | Wait s | KiB | GraphQL cost |",
+                  "| --- | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: |"]
+        lines += [f"| `{row['method']} {row['endpoint']}` | {row['calls']} | {row['errors']} | "
+                  f"{row['seconds']:.2f} | {row['mean_ms']:.1f} | {row['p95_ms']:.1f} | "
+                  f"{row['wait_seconds']:.2f} | {row['bytes_received'] / 1024:.1f} | {row['graphql_cost']} |"
+                  for row in summary["endpoints"]]
+        lines.append("")
+    if summary["phases"]:
+        lines += ["| Phase | Count | Total s | Max ms |", "| --- | ---: | ---: | ---: |"]
+        lines += [f"| {row['phase']} | {row['count']} | {row['seconds']:.2f} | {row['max_ms']:.1f} |"
+                  for row in summary["phases"]]
+        lines.append("")
+    return '\n'.join(lines) + '\n'
+
+
+recorder: Optional[Recorder] = None
+
+
+def enable(output: Optional[str] = None) -> Recorder:
+    """Start recording for the rest of the process; the summary is reported at exit"""
+    global recorder
+    if recorder is None:
+        recorder = Recorder(output)
+        atexit.register(recorder.report)
+    return recorder
+
+
+def timed(name: str) -> Callable:
+    """Decorator that times every call of a function as phase `name`
+
+    Without MENTORSHIP_METRICS the function is returned undecorated, so phase
+    hooks cost nothing unless metrics were enabled when the scripts started.
+    """
+    def decorate(func: Callable) -> Callable:
+        if recorder is None:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with recorder.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+if os.getenv(METRICS_ENV):
+    enable(os.environ[METRICS_ENV])
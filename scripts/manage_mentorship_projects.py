@@ -8,11 +8,16 @@ mentorship pairs with all required information.
 """
 
 import os
-import json
-import requests
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import argparse
+import requests
+from github_client import get_client
+from id_cache import get_id_cache
+from instrumentation import timed
+from pair_identity import PairIndex, pair_key
+from pair_model import Pair, load_pairs
+from template_engine import bullet_list, render
 
 
 class MentorshipProjectManager:
@@ -22,12 +27,11 @@ class MentorshipProjectManager:
         self.owner = owner
         self.repo = repo
         self.token = token
-        self.headers = {
-            'Authorization': f'Bearer {token}',
-            'Accept': 'application/vnd.github+json',
-            'X-GitHub-Api-Version': '2022-11-28'
-        }
-        self.base_url = 'https://api.github.com'
+        self.client = get_client(token)
+        self.id_cache = get_id_cache(token)
+        self.base_url = self.client.base_url
+        # Pair key -> folder / card id; callers save() it when they are done
+        self.pair_index = PairIndex()
         
     def create_mentorship_project(self, title: str = "Mentorship 2025") -> Dict:
         """Create a new GitHub Project for mentorship tracking"""
@@ -39,7 +43,7 @@ class MentorshipProjectManager:
             "state": "open"
         }
         
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self.client.post(url, json=data)
         if response.status_code == 201:
             print(f"✅ Created project: {title}")
             return response.json()
@@ -48,100 +52,107 @@ class MentorshipProjectManager:
             print(response.text)
             return {}
     
-    def create_mentorship_card(self, project_id: int, pair_data: Dict) -> Dict:
+    def create_mentorship_card(self, project_id: int, pair: Pair) -> Dict:
         """Create a project card for a mentor-mentee pair"""
         url = f"{self.base_url}/projects/{project_id}/cards"
         
         # Format card content with all required fields
-        card_content = self._format_card_content(pair_data)
+        card_content = self._format_card_content(pair)
         
         data = {
             "note": card_content
         }
         
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self.client.post(url, json=data)
         if response.status_code == 201:
-            print(f"✅ Created card for {pair_data.get('mentor', 'Unknown')} - {pair_data.get('mentee', 'Unknown')}")
-            return response.json()
+            print(f"✅ Created card for {pair.mentor or 'Unknown'} - {pair.mentee or 'Unknown'}")
+            card = response.json()
+            self.pair_index.record(pair, card_id=card.get('id'))
+            return card
         else:
             print(f"❌ Failed to create card: {response.status_code}")
             return {}
     
-    def _format_card_content(self, pair_data: Dict) -> str:
+    @timed('render')
+    def _format_card_content(self, pair: Pair, last_updated: Optional[str] = None) -> str:
         """Format the content for a mentorship pair card"""
-        mentor = pair_data.get('mentor', 'TBD')
-        mentee = pair_data.get('mentee', 'TBD')
-        goals = pair_data.get('goals', [])
-        progress = pair_data.get('progress', 'Not started')
-        meetings = pair_data.get('meetings', [])
-        deliverables = pair_data.get('deliverables', [])
-        last_updated = pair_data.get('last_updated', datetime.now().isoformat())
-        
-        # Format goals
-        goals_text = '\n'.join([f"- {goal}" for goal in goals]) if goals else "- TBD"
-        
-        # Format meetings
-        meetings_text = '\n'.join([f"- {meeting}" for meeting in meetings]) if meetings else "- No meetings scheduled"
-        
-        # Format deliverables
-        deliverables_text = '\n'.join([f"- {deliverable}" for deliverable in deliverables]) if deliverables else "- TBD"
-        
-        return f"""# {mentor} ↔ {mentee}
-
-## 📋 Goals
-{goals_text}
-
-## 📊 Progress
-{progress}
-
-## 🤝 Meetings
-{meetings_text}
-
-## 📦 Deliverables
-{deliverables_text}
-
-## 🕒 Last Updated
-{last_updated}
-
----
-*This card tracks the mentorship pair progress. Update regularly to maintain current status.*
-"""
+        if last_updated is None:
+            last_updated = pair.last_updated or datetime.now().isoformat()
+        
+        return render('card.md',
+                      mentor=pair.mentor or 'TBD',
+                      mentee=pair.mentee or 'TBD',
+                      goals=bullet_list(pair.goals) if pair.goals else "- TBD",
+                      progress=pair.progress or 'Not started',
+                      meetings=bullet_list(pair.meetings) if pair.meetings else "- No meetings scheduled",
+                      deliverables=bullet_list(pair.deliverables) if pair.deliverables else "- TBD",
+                      last_updated=last_updated)
     
-    def update_card(self, card_id: int, pair_data: Dict) -> Dict:
+    def update_card(self, card_id: int, pair: Pair) -> Dict:
         """Update an existing mentorship card"""
         url = f"{self.base_url}/projects/cards/{card_id}"
         
-        card_content = self._format_card_content(pair_data)
+        card_content = self._format_card_content(pair)
         
         data = {
             "note": card_content
         }
         
-        response = requests.patch(url, headers=self.headers, json=data)
+        response = self.client.patch(url, json=data)
         if response.status_code == 200:
-            print(f"✅ Updated card for {pair_data.get('mentor', 'Unknown')} - {pair_data.get('mentee', 'Unknown')}")
+            print(f"✅ Updated card for {pair.mentor or 'Unknown'} - {pair.mentee or 'Unknown'}")
             return response.json()
         else:
             print(f"❌ Failed to update card: {response.status_code}")
             return {}
     
-    def list_projects(self) -> List[Dict]:
-        """List all projects in the repository"""
+    def iter_projects(self) -> Iterator[Dict]:
+        """Stream all projects in the repository, 100 per page"""
         url = f"{self.base_url}/repos/{self.owner}/{self.repo}/projects"
         
-        response = requests.get(url, headers=self.headers)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(f"❌ Failed to list projects: {response.status_code}")
-            return []
+        try:
+            yield from self.client.paginate(url)
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else 'error'
+            print(f"❌ Failed to list projects: {status}")
+    
+    def list_projects(self) -> List[Dict]:
+        """List all projects in the repository"""
+        return list(self.iter_projects())
+    
+    def find_mentorship_project(self) -> Optional[int]:
+        """Find the repository's mentorship project, using the on-disk ID cache"""
+        return self.id_cache.cached('project', f"{self.owner}/{self.repo}", self._search_mentorship_project)
+    
+    def _search_mentorship_project(self) -> Optional[int]:
+        # Stream pages and stop at the first match
+        for project in self.iter_projects():
+            if 'mentorship' in project['name'].lower():
+                return project['id']
+        return None
+    
+    def remember_project(self, project_id: int):
+        """Cache a project id (e.g. one just created) for later runs"""
+        self.id_cache.set('project', f"{self.owner}/{self.repo}", project_id)
     
-    def generate_pair_folders(self, pair_data: Dict, base_path: str = "pairs") -> str:
+    def forget_project(self):
+        """Invalidate the cached project id (e.g. after the project was deleted)"""
+        self.id_cache.invalidate('project', f"{self.owner}/{self.repo}")
+    
+    @timed('write')
+    def generate_pair_folders(self, pair: Pair, base_path: str = "pairs") -> str:
         """Generate folder structure for a mentor-mentee pair"""
-        mentor = pair_data.get('mentor', 'unknown_mentor').replace(' ', '_').lower()
-        mentee = pair_data.get('mentee', 'unknown_mentee').replace(' ', '_').lower()
-        
-        pair_folder = f"{base_path}/{mentor}_{mentee}"
+        pair_folder = self.pair_index.folder_for(pair)
+        if not pair_folder:
+            mentor = (pair.mentor or 'unknown_mentor').replace(' ', '_').lower()
+            mentee = (pair.mentee or 'unknown_mentee').replace(' ', '_').lower()
+            
+            pair_folder = f"{base_path}/{mentor}_{mentee}"
+            # Another pair with the same names already owns this folder
+            key = pair_key(pair)
+            if self.pair_index.folder_owner(pair_folder) not in (None, key):
+                pair_folder = f"{pair_folder}_{key[:8]}"
+            self.pair_index.record(pair, folder=pair_folder)
         
         # Create directory structure
         os.makedirs(f"{pair_folder}/meetings", exist_ok=True)
@@ -149,87 +160,34 @@ class MentorshipProjectManager:
         os.makedirs(f"{pair_folder}/resources", exist_ok=True)
         
         # Create placeholder files
-        self._create_pair_files(pair_folder, pair_data)
+        self._create_pair_files(pair_folder, pair)
         
         print(f"✅ Generated folder structure: {pair_folder}")
         return pair_folder
     
-    def _create_pair_files(self, pair_folder: str, pair_data: Dict):
+    def _create_pair_files(self, pair_folder: str, pair: Pair):
         """Create placeholder files for the pair"""
         # README.md
-        readme_content = f"""# {pair_data.get('mentor', 'TBD')} ↔ {pair_data.get('mentee', 'TBD')} Mentorship
-
-## Overview
-This folder contains all materials and documentation for the mentorship relationship between {pair_data.get('mentor', 'TBD')} (mentor) and {pair_data.get('mentee', 'TBD')} (mentee).
-
-## Folder Structure
-- `meetings/` - Meeting notes and recordings
-- `deliverables/` - Project deliverables and milestones
-- `resources/` - Shared resources and references
-
-## Goals
-{chr(10).join([f"- {goal}" for goal in pair_data.get('goals', ['TBD'])])}
-
-## Contact Information
-- **Mentor**: {pair_data.get('mentor', 'TBD')}
-- **Mentee**: {pair_data.get('mentee', 'TBD')}
-
-## Progress Tracking
-Track progress in the GitHub Project card for this pair.
-"""
-        
         with open(f"{pair_folder}/README.md", 'w') as f:
-            f.write(readme_content)
+            f.write(render('pair_readme.md', mentor=pair.mentor or 'TBD', mentee=pair.mentee or 'TBD',
+                           goals=bullet_list(pair.goals or ['TBD'])))
         
         # Meeting template
-        meeting_template = """# Meeting Notes Template
-
-**Date**: 
-**Duration**: 
-**Attendees**: 
-- Mentor: 
-- Mentee: 
-
-## Agenda
-- [ ] Item 1
-- [ ] Item 2
-
-## Discussion Points
-
-
-## Action Items
-- [ ] Action for mentor:
-- [ ] Action for mentee:
-
-## Next Meeting
-**Date**: 
-**Time**: 
-**Agenda Preview**: 
-"""
-        
         with open(f"{pair_folder}/meetings/meeting_template.md", 'w') as f:
-            f.write(meeting_template)
+            f.write(render('meeting_notes.md'))
         
         # Goals tracker
-        goals_content = f"""# Goals and Milestones
-
-## Primary Goals
-{chr(10).join([f"- [ ] {goal}" for goal in pair_data.get('goals', ['Define specific goals'])])}
-
-## Milestones
-- [ ] Initial meeting completed
-- [ ] Goals defined and agreed upon
-- [ ] Mid-program check-in
-- [ ] Final deliverable completed
-- [ ] Program completion
+        with open(f"{pair_folder}/goals.md", 'w') as f:
+            f.write(render('goals.md', goals=bullet_list(pair.goals or ['Define specific goals'], '- [ ] ')))
 
-## Progress Notes
-*Update this section regularly with progress notes*
 
-"""
-        
-        with open(f"{pair_folder}/goals.md", 'w') as f:
-            f.write(goals_content)
+def _load_pair_data(path: str) -> List[Pair]:
+    """Load and validate --pair-data (a pair, a list of pairs, or JSON Lines)"""
+    try:
+        return load_pairs(path)
+    except ValueError as e:
+        print(f"❌ Invalid pair data in {path}: {e}")
+        return []
 
 
 def main():
@@ -269,20 +227,20 @@ def main():
             print("❌ --project-id and --pair-data required for create-card action")
             return
         
-        with open(args.pair_data, 'r') as f:
-            pair_data = json.load(f)
-        
-        manager.create_mentorship_card(args.project_id, pair_data)
+        pairs = _load_pair_data(args.pair_data)
+        for pair in pairs:
+            manager.create_mentorship_card(args.project_id, pair)
+        manager.pair_index.save()
     
     elif args.action == 'generate-folders':
         if not args.pair_data:
             print("❌ --pair-data required for generate-folders action")
             return
         
-        with open(args.pair_data, 'r') as f:
-            pair_data = json.load(f)
-        
-        manager.generate_pair_folders(pair_data)
+        pairs = _load_pair_data(args.pair_data)
+        for pair in pairs:
+            manager.generate_pair_folders(pair)
+        manager.pair_index.save()
 
 
 if __name__ == '__main__':
@@ -1,20 +1,23 @@
 import argparse
 import json
+import os
 import requests
+from github_client import get_client
+from id_cache import get_id_cache
+from pair_model import load_pairs
+from project_snapshot import DEFAULT_SNAPSHOT_FILE, ProjectSnapshot
 
 def run_query(query, token, variables=None):
-    url = "https://api.github.com/graphql"
-    headers = {"Authorization": f"bearer {token}"}
-    payload = {"query": query}
-    if variables:
-        payload["variables"] = variables
-    response = requests.post(url, json=payload, headers=headers)
+    response = get_client(token).graphql(query, variables)
     response.raise_for_status()
     result = response.json()
     print("[DEBUG] GraphQL response:", json.dumps(result, indent=2))
     return result
 
 def get_authenticated_user(token):
+    return get_id_cache(token).cached("viewer", "login", lambda: _query_authenticated_user(token))
+
+def _query_authenticated_user(token):
     query = """
     query {
       viewer {
@@ -26,6 +29,9 @@ def get_authenticated_user(token):
     return data.get("data", {}).get("viewer", {}).get("login")
 
 def get_repo_id(owner, repo, token):
+    return get_id_cache(token).cached("repo", f"{owner}/{repo}", lambda: _query_repo_id(owner, repo, token))
+
+def _query_repo_id(owner, repo, token):
     query = """
     query($owner: String!, $name: String!) {
       repository(owner: $owner, name: $name) {
@@ -53,6 +59,9 @@ def get_repo_id(owner, repo, token):
         raise Exception(f"Repository not found under owner '{owner}' or user '{user}'. Errors: {errors}")
 
 def get_owner_id(owner, token):
+    return get_id_cache(token).cached("owner", owner, lambda: _query_owner_id(owner, token))
+
+def _query_owner_id(owner, token):
     query = """
     query($login: String!) {
       user(login: $login) { id }
@@ -105,21 +114,151 @@ def create_project(owner, title, token):
     print(f"[INFO] Created project '{project_v2['title']}' with ID {project_v2['id']}")
     return project_v2
 
+def iter_repo_projects(owner, repo, token):
+    """Stream the ProjectV2 boards linked to a repository, 100 per request"""
+    query = """
+    query($owner: String!, $name: String!, $cursor: String) {
+      repository(owner: $owner, name: $name) {
+        projectsV2(first: 100, after: $cursor) {
+          pageInfo { hasNextPage endCursor }
+          nodes { id number title }
+        }
+      }
+    }
+    """
+    variables = {"owner": owner, "name": repo}
+    yield from get_client(token).paginate_graphql(query, variables, ("repository", "projectsV2"))
+
+def iter_project_items(project_id, token):
+    """Stream the items of a ProjectV2 board, 100 per request"""
+    query = """
+    query($project: ID!, $cursor: String) {
+      node(id: $project) {
+        ... on ProjectV2 {
+          items(first: 100, after: $cursor) {
+            pageInfo { hasNextPage endCursor }
+            nodes {
+              id
+              updatedAt
+              content {
+                ... on DraftIssue { title }
+                ... on Issue { title number }
+                ... on PullRequest { title number }
+              }
+            }
+          }
+        }
+      }
+    }
+    """
+    variables = {"project": project_id}
+    yield from get_client(token).paginate_graphql(query, variables, ("node", "items"))
+
+def find_project(owner, repo, title, token, snapshot=None):
+    """ID of the repo's board whose title contains `title`, answered from the snapshot when it can be"""
+    if snapshot is not None:
+        project_id = snapshot.find_project(owner, repo, title)
+        if project_id:
+            return project_id
+    for project in iter_repo_projects(owner, repo, token):
+        if title.lower() in project["title"].lower():
+            return project["id"]
+    return None
+
+def pull_snapshot(snapshot, owner, repo, project_id, token):
+    try:
+        stats = snapshot.pull(project_id, token, owner, repo)
+    except requests.RequestException as e:
+        print(f"❌ Could not pull project {project_id}: {e}")
+        return
+    snapshot.save()
+    print(f"📸 Snapshot of '{snapshot.project['title']}' saved to {snapshot.path}: "
+          f"{len(snapshot.items)} items ({stats['fetched']} fetched, {stats['unchanged']} unchanged, "
+          f"{stats['removed']} removed)")
+
+def report_snapshot(snapshot, field, value=None):
+    if not snapshot.project:
+        print(f"❌ No snapshot at {snapshot.path}; run --action snapshot first")
+        return
+    print(f"📋 '{snapshot.project['title']}' as of {snapshot.data['pulled_at']}")
+    if value is None:
+        for name, count in sorted(snapshot.field_counts(field).items(), key=lambda entry: -entry[1]):
+            print(f"- {field} {name}: {count}")
+        return
+    items = snapshot.items_where(field, value)
+    print(f"{len(items)} items with {field} '{value}':")
+    for item in items:
+        print(f"- {item['title']}")
+
+def diff_snapshot(snapshot, pair_data):
+    if not snapshot.project:
+        print(f"❌ No snapshot at {snapshot.path}; run --action snapshot first")
+        return
+    try:
+        pairs = load_pairs(pair_data)
+    except ValueError as e:
+        print(f"❌ Invalid pair data in {pair_data}: {e}")
+        return
+    diff = snapshot.diff(pairs)
+    print(f"📋 {len(diff['matched'])} pairs on the board as of {snapshot.data['pulled_at']}")
+    for pair in diff["missing"]:
+        print(f"- missing from the board: {pair.mentor} ↔ {pair.mentee}")
+    for item in diff["extra"]:
+        print(f"- not in {pair_data}: {item['title']}")
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--owner", required=False, help="Owner (user/org) of the repo/project")
     parser.add_argument("--repo", required=True)
-    parser.add_argument("--token", required=True)
-    parser.add_argument("--project-title", required=True)
-    parser.add_argument("--action", choices=["create-project"], required=True)
+    parser.add_argument("--token", default=os.getenv("GITHUB_TOKEN"),
+                        help="GitHub token (default: $GITHUB_TOKEN; not needed for report/diff)")
+    parser.add_argument("--project-title", help="Title for create-project, or of the board to snapshot")
+    parser.add_argument("--project-id", help="ProjectV2 node ID to snapshot (instead of --project-title)")
+    parser.add_argument("--action", choices=["create-project", "list-projects", "snapshot", "report", "diff"],
+                        required=True)
+    parser.add_argument("--snapshot-file", default=DEFAULT_SNAPSHOT_FILE, help="Local board snapshot")
+    parser.add_argument("--field", default="Status", help="Field to report on")
+    parser.add_argument("--value", help="List the items whose --field has this value")
+    parser.add_argument("--pair-data", help="JSON file with mentor-mentee pairs to diff against the board")
+    parser.add_argument("--refresh-cache", action="store_true", help="Ignore and rebuild cached node IDs")
     args = parser.parse_args()
 
+    # Reports and diffs are answered from the snapshot alone
+    snapshot = ProjectSnapshot(args.snapshot_file)
+    if args.action == "report":
+        report_snapshot(snapshot, args.field, args.value)
+        return
+    if args.action == "diff":
+        if not args.pair_data:
+            parser.error("--pair-data is required for diff")
+        diff_snapshot(snapshot, args.pair_data)
+        return
+
     token = args.token
+    if not token:
+        parser.error(f"--token or GITHUB_TOKEN is required for {args.action}")
+    if args.refresh_cache:
+        get_id_cache(token).invalidate()
     owner = args.owner or get_authenticated_user(token)
-    repo_id = get_repo_id(owner, args.repo, token)
 
     if args.action == "create-project":
+        if not args.project_title:
+            parser.error("--project-title is required for create-project")
+        repo_id = get_repo_id(owner, args.repo, token)
         project = create_project(owner, args.project_title, token)
 
+    elif args.action == "list-projects":
+        for project in iter_repo_projects(owner, args.repo, token):
+            print(f"- {project['title']} (#{project['number']}, ID: {project['id']})")
+
+    elif args.action == "snapshot":
+        if not (args.project_id or args.project_title):
+            parser.error("--project-id or --project-title is required for snapshot")
+        project_id = args.project_id or find_project(owner, args.repo, args.project_title, token, snapshot)
+        if not project_id:
+            print(f"❌ No project titled '{args.project_title}' in {owner}/{args.repo}")
+            return
+        pull_snapshot(snapshot, owner, args.repo, project_id, token)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Mentor-Mentee Matching
+
+Reads mentor and mentee profiles (markdown files following
+mentors/mentor-template.md and mentees/mentee-template.md, or a CSV export of
+the application forms), scores every mentor against every mentee in one NumPy
+matrix, and assigns mentees to mentors without exceeding each mentor's
+capacity. The result is the mentor_email,mentee_email CSV create_pairs.py
+reads.
+
+A score combines three parts, each between 0 and 1:
+- expertise: overlap of the mentor's areas of expertise with the mentee's
+  areas of interest (cosine of the two topic sets)
+- timezone: 1 for the same UTC offset, falling to 0 twelve hours apart
+- track: 1 when the program tracks match, 0 when they differ
+
+Unknown timezones and tracks score 0.5, so a missing field neither helps nor
+rules out a match. With SciPy installed, small and medium cohorts are solved
+optimally (maximum total score); otherwise, and for cohorts too large for
+that, a greedy pass takes the best remaining (mentor, mentee) scores first.
+"""
+
+import argparse
+import csv
+import os
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pair_parser import FieldParser, iter_content_lines, normalize_label
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:
+    linear_sum_assignment = None
+
+# The input file create_pairs.py reads by default
+DEFAULT_OUTPUT = "../mentors_mentees.csv"
+DEFAULT_WEIGHTS = {"expertise": 0.6, "timezone": 0.25, "track": 0.15}
+DEFAULT_CAPACITY = 1
+# Mentor places x mentees up to which auto uses the optimal solver; SciPy
+# copies the matrix as float64, so this caps its memory at about 200 MB
+OPTIMAL_MAX_CELLS = 25_000_000
+# Candidates per mentee the greedy pass sorts before widening the search
+GREEDY_CANDIDATES = 32
+
+PROFILE_FIELDS = {
+    "name": (("name",), False),
+    "email": (("email",), False),
+    "location": (("location", "location/time zone", "time zone", "timezone"), False),
+    "track": (("track", "program track", "focus area", "track/focus area"), False),
+    "capacity": (("capacity", "max mentees", "mentee capacity"), False),
+    "expertise": (("areas of expertise", "expertise"), True),
+    "interests": (("areas of interest", "interests"), True),
+}
+PROFILE_PARSER = FieldParser(PROFILE_FIELDS)
+
+# `- **Name**: value` lines are list items to the field parser; unwrap them
+_LABELLED_ITEM_RE = re.compile(r'^[ \t]*[-+*][ \t]+(?=\*\*[^*\n]+\*\*)')
+_PLACEHOLDER_RE = re.compile(r'^\[.*\]$')
+_EXAMPLE_RE = re.compile(r'\s*[(\[]?e\.g\.,?.*$', re.IGNORECASE)
+_UTC_OFFSET_RE = re.compile(r'\b(?:UTC|GMT)\s*([+\-−])\s*(\d{1,2})(?::?(\d{2}))?', re.IGNORECASE)
+_UTC_RE = re.compile(r'\b(?:UTC|GMT)\b', re.IGNORECASE)
+_ZONE_RE = re.compile(r'\b([A-Z]{3,4})\b')
+
+TIMEZONE_OFFSETS = {
+    "EST": -5, "EDT": -4, "CST": -6, "CDT": -5, "MST": -7, "MDT": -6, "PST": -8, "PDT": -7,
+    "BRT": -3, "ART": -3, "CLT": -4, "COT": -5, "PET": -5, "VET": -4, "BOT": -4, "UYT": -3,
+    "WET": 0, "CET": 1, "CEST": 2, "BST": 1, "EET": 2, "IST": 5.5, "JST": 9,
+}
+TOPIC_ALIASES = {
+    "nlp": "natural language processing",
+    "cv": "computer vision",
+    "ml": "machine learning",
+    "dl": "deep learning",
+    "rl": "reinforcement learning",
+    "mlops": "machine learning engineering",
+    "ai ethics": "responsible ai",
+}
+
+
+def normalize_topic(text: str) -> str:
+    """Canonical form of an expertise or interest, e.g. 'NLP' -> 'natural language processing'"""
+    topic = normalize_label(_EXAMPLE_RE.sub('', text))
+    return TOPIC_ALIASES.get(topic, topic)
+
+
+def parse_utc_offset(location: str) -> Optional[float]:
+    """UTC offset in hours from text such as 'Bogotá (UTC-5)', 'GMT+1' or 'EST'"""
+    match = _UTC_OFFSET_RE.search(location)
+    if match:
+        sign = -1 if match.group(1) in '-−' else 1
+        return sign * (int(match.group(2)) + int(match.group(3) or 0) / 60)
+    for zone in _ZONE_RE.findall(location):
+        if zone in TIMEZONE_OFFSETS:
+            return float(TIMEZONE_OFFSETS[zone])
+    if _UTC_RE.search(location):
+        return 0.0
+    return None
+
+
+def _filled(value: str) -> str:
+    """A template value, or '' while it still holds the [placeholder]"""
+    value = (value or '').strip()
+    return '' if _PLACEHOLDER_RE.match(value) else value
+
+
+class Profile:
+    """A mentor or mentee applicant"""
+
+    __slots__ = ('name', 'email', 'utc_offset', 'topics', 'track', 'capacity', 'source')
+
+    def __init__(self, name: str = '', email: str = '', location: str = '', topics: Iterable[str] = (),
+                 track: str = '', capacity: int = DEFAULT_CAPACITY, source: str = ''):
+        topics = [topic for topic in topics if _filled(topic)]
+        self.name = _filled(name)
+        self.email = _filled(email)
+        self.utc_offset = parse_utc_offset(_filled(location))
+        self.topics = sorted({normalize_topic(topic) for topic in topics} - {''})
+        # Without a stated track, a profile's first listed topic stands in for it
+        self.track = normalize_topic(_filled(track) or (topics[0] if topics else ''))
+        self.capacity = capacity
+        self.source = source
+
+    def __repr__(self) -> str:
+        return f"Profile(name={self.name!r}, email={self.email!r})"
+
+
+def parse_profile(lines: Iterable[str], source: str = '', default_capacity: int = DEFAULT_CAPACITY) -> Profile:
+    """Build a profile from a markdown profile, streaming its lines once"""
+    fields = PROFILE_PARSER.parse(_LABELLED_ITEM_RE.sub('', line) for line in iter_content_lines(lines))
+    topics = fields.get('expertise') or fields.get('interests') or []
+    capacity = _filled(fields.get('capacity', ''))
+    return Profile(fields.get('name', ''), fields.get('email', ''), fields.get('location', ''), topics,
+                   fields.get('track', ''), int(capacity) if capacity.isdigit() else default_capacity, source)
+
+
+def load_profiles(path: str, default_capacity: int = DEFAULT_CAPACITY) -> List[Profile]:
+    """Profiles from a folder of markdown profiles or from a CSV file
+
+    CSV columns: name, email, location, topics (separated by ';'), track and
+    capacity; only email is required. Templates, READMEs and profiles without
+    an email are skipped.
+    """
+    profiles = []
+    if os.path.isdir(path):
+        for entry in sorted(os.scandir(path), key=lambda entry: entry.name):
+            if not entry.name.endswith('.md') or entry.name == 'README.md' or 'template' in entry.name:
+                continue
+            with open(entry.path, 'r', encoding='utf-8') as f:
+                profiles.append(parse_profile(f, entry.path, default_capacity))
+    else:
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            for i, row in enumerate(csv.DictReader(f), start=2):
+                capacity = (row.get('capacity') or '').strip()
+                profiles.append(Profile(row.get('name', ''), row.get('email', ''), row.get('location', ''),
+                                        (row.get('topics') or '').split(';'), row.get('track', ''),
+                                        int(capacity) if capacity.isdigit() else default_capacity,
+                                        f"{path}:{i}"))
+    missing = [profile.source for profile in profiles if not profile.email]
+    if missing:
+        print(f"⚠️  Skipping {len(missing)} profiles without an email: {', '.join(missing[:5])}"
+              + (" ..." if len(missing) > 5 else ""))
+    return [profile for profile in profiles if profile.email]
+
+
+def _topic_matrix(profiles: Sequence[Profile], vocabulary: Dict[str, int]) -> np.ndarray:
+    """Rows of unit-length multi-hot topic vectors"""
+    matrix = np.zeros((len(profiles), len(vocabulary)), dtype=np.float32)
+    rows = [i for i, profile in enumerate(profiles) for _ in profile.topics]
+    columns = [vocabulary[topic] for profile in profiles for topic in profile.topics]
+    matrix[rows, columns] = 1.0
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+
+def score_matrix(mentors: Sequence[Profile], mentees: Sequence[Profile],
+                 weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """Compatibility of every mentor (rows) with every mentee (columns), from 0 to 1"""
+    weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+    total = sum(weights.values()) or 1.0
+
+    vocabulary: Dict[str, int] = {}
+    for profile in list(mentors) + list(mentees):
+        for topic in profile.topics:
+            vocabulary.setdefault(topic, len(vocabulary))
+    scores = _topic_matrix(mentors, vocabulary) @ _topic_matrix(mentees, vocabulary).T
+    scores *= weights['expertise'] / total
+
+    mentor_offsets = np.array([np.nan if p.utc_offset is None else p.utc_offset for p in mentors], np.float32)
+    mentee_offsets = np.array([np.nan if p.utc_offset is None else p.utc_offset for p in mentees], np.float32)
+    distance = np.abs(mentor_offsets[:, None] - mentee_offsets[None, :])
+    distance = np.minimum(distance, 24 - distance)
+    timezone = np.nan_to_num(1 - distance / 12, nan=0.5)
+    scores += timezone * (weights['timezone'] / total)
+
+    tracks: Dict[str, int] = {'': -1}
+    mentor_tracks = np.array([tracks.setdefault(p.track, len(tracks)) for p in mentors])
+    mentee_tracks = np.array([tracks.setdefault(p.track, len(tracks)) for p in mentees])
+    same = mentor_tracks[:, None] == mentee_tracks[None, :]
+    unknown = (mentor_tracks[:, None] < 0) | (mentee_tracks[None, :] < 0)
+    scores += np.where(unknown, 0.5, same.astype(np.float32)) * (weights['track'] / total)
+    return scores
+
+
+def greedy_assign(scores: np.ndarray, capacities: np.ndarray, min_score: float = 0.0) -> np.ndarray:
+    """Mentor index for each mentee (-1 if unmatched), best remaining score first
+
+    Each round sorts only the top GREEDY_CANDIDATES mentors of every waiting
+    mentee among mentors with free capacity, so the sort stays small; mentees
+    whose candidates all filled up are retried in the next round.
+    """
+    remaining = capacities.astype(np.int64)
+    assignment = np.full(scores.shape[1], -1, dtype=np.int64)
+    waiting = np.arange(scores.shape[1])
+    while waiting.size:
+        available = np.flatnonzero(remaining > 0)
+        if not available.size:
+            break
+        candidates = scores[np.ix_(available, waiting)]
+        k = min(GREEDY_CANDIDATES, available.size)
+        if k < available.size:
+            top = np.argpartition(-candidates, k - 1, axis=0)[:k]
+            candidates = np.take_along_axis(candidates, top, axis=0)
+        else:
+            top = np.broadcast_to(np.arange(available.size)[:, None], candidates.shape)
+        order = np.argsort(-candidates, axis=None, kind='stable')
+        rows, columns = np.unravel_index(order, candidates.shape)
+        mentors = available[top[rows, columns]]
+        best = candidates[rows, columns]
+        assigned = 0
+        for mentor, column, score in zip(mentors.tolist(), columns.tolist(), best.tolist()):
+            if score < min_score:
+                break
+            mentee = waiting[column]
+            if assignment[mentee] < 0 and remaining[mentor]:
+                assignment[mentee] = mentor
+                remaining[mentor] -= 1
+                assigned += 1
+        if not assigned:
+            break
+        waiting = waiting[assignment[waiting] < 0]
+    return assignment
+
+
+def optimal_assign(scores: np.ndarray, capacities: np.ndarray, min_score: float = 0.0) -> np.ndarray:
+    """Mentor index for each mentee (-1 if unmatched) maximizing the total score (needs SciPy)"""
+    # One column per mentor slot turns the capacities into a plain assignment problem
+    slots = np.repeat(np.arange(scores.shape[0]), capacities)
+    mentees, columns = linear_sum_assignment(scores[slots].T, maximize=True)
+    keep = scores[slots[columns], mentees] >= min_score
+    assignment = np.full(scores.shape[1], -1, dtype=np.int64)
+    assignment[mentees[keep]] = slots[columns[keep]]
+    return assignment
+
+
+def assign(scores: np.ndarray, capacities: np.ndarray, min_score: float = 0.0,
+           method: str = 'auto') -> Tuple[np.ndarray, str]:
+    """Assign mentees to mentors; returns the assignment and the method used"""
+    if method == 'auto':
+        cells = int(capacities.sum()) * scores.shape[1]
+        method = 'optimal' if linear_sum_assignment is not None and cells <= OPTIMAL_MAX_CELLS else 'greedy'
+    if method == 'optimal':
+        if linear_sum_assignment is None:
+            raise ValueError("the optimal solver needs SciPy (pip install scipy)")
+        return optimal_assign(scores, capacities, min_score), method
+    return greedy_assign(scores, capacities, min_score), method
+
+
+def write_pairs_csv(path: str, mentors: Sequence[Profile], mentees: Sequence[Profile],
+                    assignment: np.ndarray, scores: np.ndarray) -> int:
+    """Write the matched pairs as the roster CSV create_pairs.py reads; returns the pair count"""
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['mentor_email', 'mentee_email', 'score'])
+        # Grouped by mentor so a mentor's mentees sit next to each other, as in hand-made rosters
+        for mentee in np.lexsort((np.arange(len(mentees)), assignment)).tolist():
+            mentor = int(assignment[mentee])
+            if mentor < 0:
+                continue
+            writer.writerow([mentors[mentor].email, mentees[mentee].email, f"{scores[mentor, mentee]:.3f}"])
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Match mentees to mentors and write the create_pairs.py roster')
+    parser.add_argument('--mentors', default='mentors', help='Folder of mentor profiles or a CSV file')
+    parser.add_argument('--mentees', default='mentees', help='Folder of mentee profiles or a CSV file')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='Roster CSV to write')
+    parser.add_argument('--capacity', type=int, default=DEFAULT_CAPACITY,
+                        help='Mentees per mentor when a profile does not give a capacity')
+    parser.add_argument('--method', choices=['auto', 'optimal', 'greedy'], default='auto',
+                        help='Assignment solver (optimal needs SciPy; auto picks it for cohorts it can solve quickly)')
+    parser.add_argument('--min-score', type=float, default=0.0, help='Leave pairs scoring below this unmatched')
+    for name, weight in DEFAULT_WEIGHTS.items():
+        parser.add_argument(f'--{name}-weight', type=float, default=weight, help=f'Weight of the {name} score')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    mentors = load_profiles(args.mentors, args.capacity)
+    mentees = load_profiles(args.mentees, args.capacity)
+    if not mentors or not mentees:
+        print(f"❌ Need at least one mentor and one mentee (found {len(mentors)} and {len(mentees)})")
+        return
+    capacities = np.array([max(0, mentor.capacity) for mentor in mentors])
+    print(f"📋 {len(mentors)} mentors ({capacities.sum()} places) and {len(mentees)} mentees")
+
+    weights = {name: getattr(args, f'{name}_weight') for name in DEFAULT_WEIGHTS}
+    scores = score_matrix(mentors, mentees, weights)
+    try:
+        assignment, method = assign(scores, capacities, args.min_score, args.method)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    count = write_pairs_csv(args.output, mentors, mentees, assignment, scores)
+
+    matched = assignment >= 0
+    mean = scores[assignment[matched], np.flatnonzero(matched)].mean() if count else 0.0
+    print(f"✅ Matched {count}/{len(mentees)} mentees ({method}, mean score {mean:.3f}) "
+          f"in {time.perf_counter() - start:.2f}s")
+    for mentee in np.flatnonzero(~matched).tolist()[:10]:
+        print(f"⚠️  Unmatched: {mentees[mentee].name or mentees[mentee].email}")
+    print(f"💾 Roster written to {args.output} (python create_pairs.py --csv {args.output})")
+
+
+if __name__ == '__main__':
+    main()
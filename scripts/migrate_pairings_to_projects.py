@@ -7,61 +7,78 @@ GitHub Projects-based mentorship tracking system.
 """
 
 import os
-import json
-import glob
-import re
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Sized, Tuple
 import argparse
+from instrumentation import timed
 from manage_mentorship_projects import MentorshipProjectManager
+from pair_identity import PairIndex, find_duplicates, pair_key
+from pair_model import Pair, write_jsonl
+from pair_parser import parse_notes
+from pair_store import DEFAULT_STORE_FILE, PairStore
+from sync_pairs import DEFAULT_STATE_FILE, PairSyncEngine
+from template_engine import bullet_list, get_template, render
+
+PAIR_FILE_SUFFIXES = ('.md', '.txt')
+REPORT_SPOOL_SIZE = 4 << 20  # detailed sections stay in memory up to 4 MiB, then spill to disk
+REPORT_CHUNK = 512
+COUNT_MARKER = '\0pair_count\0'
+COUNT_WIDTH = 10
 
 
 class PairingsMigrator:
     """Migrates from pairings/ folder structure to GitHub Projects"""
     
-    def __init__(self, pairings_path: str = "pairings"):
+    def __init__(self, pairings_path: str = "pairings", workers: int = 8):
         self.pairings_path = pairings_path
+        self.workers = max(1, workers)
         
-    def scan_pairings_folder(self) -> List[Dict]:
-        """Scan the pairings/ folder and extract mentorship data"""
-        pairs = []
+    def iter_pair_sources(self, path: Optional[str] = None) -> Iterator[Tuple[str, bool]]:
+        """Yield (path, is_dir) once for every pair file or folder, in name order
+        
+        Pair sources are folders, .md/.txt files and mentor_mentee named entries.
+        Folders named after a program year (e.g. pairings/2024/) hold a cohort of
+        pairs and are walked instead of being treated as a pair themselves.
+        """
+        try:
+            with os.scandir(path or self.pairings_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            print(f"⚠️  Could not scan {path or self.pairings_path}: {e}")
+            return
+        
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            is_dir = entry.is_dir()
+            if is_dir and entry.name.isdigit():
+                yield from self.iter_pair_sources(entry.path)
+            elif is_dir or entry.name.endswith(PAIR_FILE_SUFFIXES) or '_' in entry.name:
+                yield entry.path, is_dir
         
+    @timed('scan')
+    def scan_pairings_folder(self) -> List[Pair]:
+        """Scan the pairings/ folder and extract mentorship data"""
         if not os.path.exists(self.pairings_path):
             print(f"⚠️  Pairings folder not found: {self.pairings_path}")
-            return pairs
-        
-        # Look for pair folders or files
-        pair_patterns = [
-            f"{self.pairings_path}/*_*",  # mentor_mentee format
-            f"{self.pairings_path}/*/",   # subdirectories
-            f"{self.pairings_path}/*.md", # markdown files
-            f"{self.pairings_path}/*.txt" # text files
-        ]
-        
-        found_items = []
-        for pattern in pair_patterns:
-            found_items.extend(glob.glob(pattern))
-        
-        for item in found_items:
-            pair_data = self._extract_pair_data(item)
-            if pair_data:
-                pairs.append(pair_data)
+            return []
+        
+        # Reading and parsing is I/O bound, so spread it across a thread pool
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = executor.map(lambda source: self._extract_pair_data(*source),
+                                   self.iter_pair_sources())
+            pairs = [pair for pair in results if pair]
                 
         print(f"📁 Found {len(pairs)} mentor-mentee pairs")
         return pairs
     
-    def _extract_pair_data(self, path: str) -> Dict:
+    def _extract_pair_data(self, path: str, is_dir: Optional[bool] = None) -> Pair:
         """Extract mentorship data from a file or folder"""
-        pair_data = {
-            "mentor": "Unknown",
-            "mentee": "Unknown", 
-            "goals": [],
-            "progress": "Migrated from pairings folder",
-            "meetings": [],
-            "deliverables": [],
-            "last_updated": datetime.now().isoformat(),
-            "migration_source": path
-        }
+        pair = Pair(mentor="Unknown", mentee="Unknown", progress="Migrated from pairings folder",
+                    last_updated=datetime.now().isoformat(), migration_source=path)
         
         # Extract names from path
         basename = os.path.basename(path.rstrip('/'))
@@ -70,114 +87,155 @@ class PairingsMigrator:
         if '_' in basename:
             parts = basename.replace('.md', '').replace('.txt', '').split('_')
             if len(parts) >= 2:
-                pair_data["mentor"] = parts[0].replace('-', ' ').title()
-                pair_data["mentee"] = parts[1].replace('-', ' ').title()
+                pair.mentor = parts[0].replace('-', ' ').title()
+                pair.mentee = parts[1].replace('-', ' ').title()
+        
+        if is_dir is None:
+            is_dir = os.path.isdir(path)
         
         # If it's a file, try to extract more information
-        if os.path.isfile(path):
+        if not is_dir:
             try:
+                # Stream the file through the single-pass parser
                 with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                # Extract goals
-                goals_match = re.search(r'(?:goals?|objectives?):?\s*\n((?:[-*]\s*.+\n?)+)', content, re.IGNORECASE)
-                if goals_match:
-                    goals_text = goals_match.group(1)
-                    goals = [line.strip('- *').strip() for line in goals_text.split('\n') if line.strip()]
-                    pair_data["goals"] = [goal for goal in goals if goal]
+                    fields = parse_notes(f)
+                pair.update(fields)
                 
-                # Extract progress information
-                progress_match = re.search(r'(?:progress|status):?\s*(.+)', content, re.IGNORECASE)
-                if progress_match:
-                    pair_data["progress"] = progress_match.group(1).strip()
-                
-                # Extract meetings
-                meetings_match = re.search(r'(?:meetings?|sessions?):?\s*\n((?:[-*]\s*.+\n?)+)', content, re.IGNORECASE)
-                if meetings_match:
-                    meetings_text = meetings_match.group(1)
-                    meetings = [line.strip('- *').strip() for line in meetings_text.split('\n') if line.strip()]
-                    pair_data["meetings"] = [meeting for meeting in meetings if meeting]
-                    
             except Exception as e:
                 print(f"⚠️  Could not read file {path}: {e}")
         
         # If it's a directory, scan for additional files
-        elif os.path.isdir(path):
+        else:
             try:
                 files = os.listdir(path)
                 if 'README.md' in files:
+                    # Same parser as notes files; also reads the "# Pair N: a & b" title
                     readme_path = os.path.join(path, 'README.md')
                     with open(readme_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        # Similar extraction logic as above
+                        pair.update(parse_notes(f))
                         
                 # Look for meeting notes
-                meeting_files = [f for f in files if 'meeting' in f.lower() or 'session' in f.lower()]
+                meeting_files = sorted(f for f in files if 'meeting' in f.lower() or 'session' in f.lower())
                 if meeting_files:
-                    pair_data["meetings"] = [f"Meeting file: {f}" for f in meeting_files]
+                    pair.meetings = pair.meetings + [f"Meeting file: {f}" for f in meeting_files]
                     
             except Exception as e:
                 print(f"⚠️  Could not scan directory {path}: {e}")
         
-        return pair_data
+        return pair
     
-    def create_migration_report(self, pairs: List[Dict], output_file: str = "migration_report.md"):
-        """Create a migration report"""
-        report_content = f"""# Pairings Migration Report
-
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-**Source**: {self.pairings_path}
-**Pairs Found**: {len(pairs)}
-
-## Migration Summary
-
-| Mentor | Mentee | Goals | Meetings | Status |
-|--------|--------|-------|----------|--------|
-"""
+    @timed('write')
+    def create_migration_report(self, pairs: Iterable[Pair], output_file: str = "migration_report.md") -> int:
+        """Create a migration report in a single streaming pass over the pairs
         
-        for pair in pairs:
-            mentor = pair.get('mentor', 'Unknown')
-            mentee = pair.get('mentee', 'Unknown') 
-            goals_count = len(pair.get('goals', []))
-            meetings_count = len(pair.get('meetings', []))
-            progress = pair.get('progress', 'Unknown')
+        Summary rows go straight to the file while the detailed sections are
+        spooled (to disk once large) and appended after the table. When `pairs`
+        has no length, the pair count is filled into the header at the end.
+        """
+        row = get_template('migration_report/row.md')
+        detail = get_template('migration_report/pair.md')
+        known_count = len(pairs) if isinstance(pairs, Sized) else None
+        count = 0
+        
+        with open(output_file, 'w') as f, \
+                tempfile.SpooledTemporaryFile(max_size=REPORT_SPOOL_SIZE, mode='w+', encoding='utf-8') as details:
+            header = get_template('migration_report/header.md').render({
+                "generated": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                "source": self.pairings_path,
+                "pair_count": known_count if known_count is not None else COUNT_MARKER
+            })
+            count_offset = None
+            if known_count is None:
+                head, tail = header.split(COUNT_MARKER, 1)
+                f.write(head)
+                count_offset = f.tell()
+                f.write(' ' * COUNT_WIDTH + tail)
+            else:
+                f.write(header)
+            
+            rows, sections = [], []
+            for i, pair in enumerate(pairs, 1):
+                values = {
+                    "number": i,
+                    "mentor": pair.mentor or 'Unknown',
+                    "mentee": pair.mentee or 'Unknown',
+                    "source": pair.migration_source or 'Unknown',
+                    "goal_count": len(pair.goals),
+                    "meeting_count": len(pair.meetings),
+                    "progress": pair.progress or 'Unknown',
+                    "goals": bullet_list(pair.goals or ['No goals found']),
+                    "meetings": bullet_list(pair.meetings or ['No meetings found'])
+                }
+                rows.append(row.render(values))
+                sections.append(detail.render(values))
+                count = i
+                # Write in chunks: far fewer write calls, memory still bounded
+                if len(rows) == REPORT_CHUNK:
+                    f.writelines(rows)
+                    details.writelines(sections)
+                    rows, sections = [], []
+            f.writelines(rows)
+            details.writelines(sections)
+            
+            f.write(render('migration_report/details.md'))
+            details.seek(0)
+            shutil.copyfileobj(details, f)
             
-            report_content += f"| {mentor} | {mentee} | {goals_count} | {meetings_count} | {progress} |\n"
+            if count_offset is not None:
+                # Same width as the reserved blanks, so nothing after it moves
+                f.seek(count_offset)
+                f.write(str(count).ljust(COUNT_WIDTH))
         
-        report_content += f"""
-## Detailed Information
-
-"""
+        print(f"📄 Migration report created: {output_file}")
+        return count
+    
+    @timed('write')
+    def export_pairs_json(self, pairs: Iterable[Pair], output_file: str = "migrated_pairs.jsonl") -> int:
+        """Export pairs data as JSON Lines (one pair per line) for further processing"""
+        with open(output_file, 'w', encoding='utf-8') as f:
+            count = write_jsonl(pairs, f)
         
-        for i, pair in enumerate(pairs, 1):
-            report_content += f"""### Pair {i}: {pair.get('mentor', 'Unknown')} ↔ {pair.get('mentee', 'Unknown')}
-
-**Source**: `{pair.get('migration_source', 'Unknown')}`
-**Goals**: {len(pair.get('goals', []))} found
-**Meetings**: {len(pair.get('meetings', []))} found
-**Progress**: {pair.get('progress', 'Unknown')}
-
-#### Goals
-{chr(10).join([f"- {goal}" for goal in pair.get('goals', ['No goals found'])])}
-
-#### Meetings
-{chr(10).join([f"- {meeting}" for meeting in pair.get('meetings', ['No meetings found'])])}
+        print(f"💾 Pairs data exported: {output_file}")
+        return count
 
----
 
-"""
+def migrate_pairs(manager: MentorshipProjectManager, project_id: Optional[int], pairs: List[Pair],
+                  concurrency: int = 1, generate_folders: bool = False) -> List[Dict]:
+    """Create a card per pair on a bounded worker pool, overlapping folder generation"""
+    concurrency = max(1, concurrency)
+    manager.client.ensure_pool_size(concurrency)
+    results = []
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # At most `concurrency` requests are in flight; the rest wait in the queue
+        futures = [executor.submit(manager.create_mentorship_card, project_id, pair)
+                   for pair in pairs] if project_id else []
         
-        with open(output_file, 'w') as f:
-            f.write(report_content)
+        # Local disk work runs on this thread while the cards are being created
+        if generate_folders:
+            for pair in pairs:
+                try:
+                    manager.generate_pair_folders(pair)
+                except OSError as e:
+                    print(f"⚠️  Failed to generate folders for {pair.mentor} - {pair.mentee}: {e}")
         
-        print(f"📄 Migration report created: {output_file}")
+        # Collect card results in input order
+        for pair, future in zip(pairs, futures):
+            try:
+                card = future.result()
+                error = None if card else "API request failed"
+            except Exception as e:
+                card, error = {}, str(e)
+            results.append({"pair": pair, "card": card, "error": error})
     
-    def export_pairs_json(self, pairs: List[Dict], output_file: str = "migrated_pairs.json"):
-        """Export pairs data as JSON for further processing"""
-        with open(output_file, 'w') as f:
-            json.dump(pairs, f, indent=2)
-        
-        print(f"💾 Pairs data exported: {output_file}")
+    failures = [result for result in results if result["error"]]
+    if futures:
+        print(f"📋 Created {len(results) - len(failures)}/{len(results)} cards")
+    for failure in failures:
+        pair = failure["pair"]
+        print(f"❌ {pair.mentor} - {pair.mentee}: {failure['error']}")
+    
+    return results
 
 
 def main():
@@ -191,11 +249,21 @@ def main():
     parser.add_argument('--project-title', default='Mentorship 2025 - Migrated', help='Title for new project')
     parser.add_argument('--scan-only', action='store_true', help='Only scan and report, do not migrate')
     parser.add_argument('--generate-folders', action='store_true', help='Generate new folder structure')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='Number of cards to create in parallel (default: 1)')
+    parser.add_argument('--sync', action='store_true',
+                        help='Only create new cards and update changed ones (uses --state-file)')
+    parser.add_argument('--state-file', default=DEFAULT_STATE_FILE, help='Sync state file')
+    parser.add_argument('--scan-workers', type=int, default=8,
+                        help='Number of pair files to read in parallel (default: 8)')
+    parser.add_argument('--store-file',
+                        help=f'SQLite pair store to add the scanned pairs to, e.g. {DEFAULT_STORE_FILE} '
+                             '(default: none; not used with --scan-only)')
     
     args = parser.parse_args()
     
     # Initialize migrator
-    migrator = PairingsMigrator(args.pairings_path)
+    migrator = PairingsMigrator(args.pairings_path, args.scan_workers)
     
     # Scan pairings folder
     pairs = migrator.scan_pairings_folder()
@@ -204,14 +272,31 @@ def main():
         print("❌ No pairs found to migrate")
         return
     
-    # Create migration report
-    migrator.create_migration_report(pairs)
-    migrator.export_pairs_json(pairs)
+    # Report pairs found more than once and keep only the first copy of each
+    duplicates = find_duplicates(pairs)
+    if duplicates:
+        for group in duplicates.values():
+            sources = ', '.join(pair.migration_source for pair in group)
+            print(f"⚠️  Duplicate pair {group[0].mentor} - {group[0].mentee}: {sources}")
+        unique = {}
+        for pair in pairs:
+            unique.setdefault(pair_key(pair), pair)
+        pairs = list(unique.values())
+        print(f"📁 {len(pairs)} unique pairs after removing duplicates")
+    
+    # Create migration report (the incremental sync reports its own summary)
+    if not args.sync:
+        migrator.create_migration_report(pairs)
+        migrator.export_pairs_json(pairs)
     
     if args.scan_only:
         print("✅ Scan complete. Use migration report to review findings.")
         return
     
+    store = PairStore(args.store_file) if args.store_file else None
+    if store:
+        print(f"💾 {store.add_pairs(pairs, 'pairings', PairIndex())} pairs saved to {args.store_file}")
+    
     # If GitHub integration is requested
     if args.owner and args.repo:
         token = args.token or os.getenv('GITHUB_TOKEN')
@@ -229,15 +314,22 @@ def main():
                 project_id = result.get('id')
                 print(f"📋 Created project with ID: {project_id}")
         
-        # Create cards for each pair
-        if project_id:
-            for pair in pairs:
-                manager.create_mentorship_card(project_id, pair)
-        
-        # Generate folder structure if requested
-        if args.generate_folders:
-            for pair in pairs:
-                manager.generate_pair_folders(pair)
+        if args.sync:
+            engine = PairSyncEngine(manager, args.state_file)
+            project_id = project_id or engine.known_project_id() or manager.find_mentorship_project()
+            if not project_id:
+                print("❌ No project to sync into. Use --project-id or --create-project")
+                return
+            engine.sync(project_id, pairs, args.concurrency)
+            if args.generate_folders:
+                for pair in pairs:
+                    manager.generate_pair_folders(pair)
+        else:
+            # Create cards for each pair, generating folders while requests are in flight
+            migrate_pairs(manager, project_id, pairs, args.concurrency, args.generate_folders)
+        manager.pair_index.save()
+        if store:
+            store.sync_locations(manager.pair_index)
     
     print("✅ Migration complete!")
 
@@ -1,18 +1,22 @@
 import os
 import json
 import argparse
-import requests
-
-GITHUB_API = "https://api.github.com/graphql"
+from github_client import get_client
+from id_cache import get_id_cache
+from graphql_batch import DEFAULT_BATCH_SIZE, GraphQLMutationBatcher, add_item_mutation, field_update_mutation
+from pair_model import load_pairs
+from project_snapshot import item_title
 
 def run_query(query, token):
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.post(GITHUB_API, json={"query": query}, headers=headers)
+    response = get_client(token).graphql(query)
     if response.status_code != 200:
         raise Exception(f"Query failed: {response.status_code}, {response.text}")
     return response.json()
 
 def get_repo_id(owner, repo, token):
+    return get_id_cache(token).cached("repo", f"{owner}/{repo}", lambda: _query_repo_id(owner, repo, token))
+
+def _query_repo_id(owner, repo, token):
     query = f"""
     {{
       repository(owner: "{owner}", name: "{repo}") {{
@@ -42,21 +46,21 @@ def create_project(repo_id, title, token):
 
 def add_item(project_id, title, token):
     """Add a single item to a project"""
-    mutation = f"""
-    mutation {{
-      addProjectV2ItemById(input: {{
-        projectId: "{project_id}",
-        content: {{
-          title: "{title}"
-        }}
-      }}) {{
-        item {{
-          id
-        }}
-      }}
-    }}
-    """
-    run_query(mutation, token)
+    return add_items(project_id, [title], token)[0]
+
+def add_items(project_id, titles, token, batch_size=DEFAULT_BATCH_SIZE):
+    """Add many items to a project using aliased, batched mutations"""
+    batcher = GraphQLMutationBatcher(lambda query: run_query(query, token), batch_size)
+    results = batcher.execute([add_item_mutation(project_id, title) for title in titles])
+    print(f"[INFO] Sent {len(titles)} item mutations in {batcher.requests} request(s)")
+    return results
+
+def update_item_fields(project_id, updates, token, batch_size=DEFAULT_BATCH_SIZE):
+    """Batch-set field values; updates is a list of (item_id, field_id, value) tuples"""
+    batcher = GraphQLMutationBatcher(lambda query: run_query(query, token), batch_size)
+    mutations = [field_update_mutation(project_id, item_id, field_id, value)
+                 for item_id, field_id, value in updates]
+    return batcher.execute(mutations)
 
 def main():
     parser = argparse.ArgumentParser()
@@ -65,25 +69,37 @@ def main():
     parser.add_argument("--token", required=True)
     parser.add_argument("--project-title", required=True)
     parser.add_argument("--pair-data", required=True, help="JSON file with mentor-mentee pairs")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Mutations per GraphQL request")
+    parser.add_argument("--refresh-cache", action="store_true", help="Ignore and rebuild cached node IDs")
     args = parser.parse_args()
 
+    # Load and validate mentor-mentee pairs before touching the project
+    try:
+        pairs = load_pairs(args.pair_data)
+    except ValueError as e:
+        print(f"❌ Invalid pair data in {args.pair_data}: {e}")
+        return
+
     token = args.token
+    if args.refresh_cache:
+        get_id_cache(token).invalidate()
     repo_id = get_repo_id(args.owner, args.repo, token)
     project = create_project(repo_id, args.project_title, token)
     project_id = project["id"]
     print(f"✅ Created project: {project['title']} (ID: {project_id})")
 
-    # Load mentor-mentee pairs
-    with open(args.pair_data, "r") as f:
-        pairs = json.load(f)
-
-    for pair in pairs:
-        mentor = pair["mentor_email"]
-        mentee = pair["mentee_email"]
-        title = f"{mentor} → {mentee}"
-        add_item(project_id, title, token)
+    titles = [item_title(pair) for pair in pairs]
+    try:
+        results = add_items(project_id, titles, token, args.batch_size)
+    except Exception as e:
+        print(f"❌ Failed to add items (check the project before re-running): {e}")
+        return
 
-    print(f"💾 Added {len(pairs)} mentor-mentee pairs to project.")
+    failures = [result for result in results if result["error"]]
+    for failure in failures:
+        print(f"❌ Failed to add {failure['key']}: {failure['error']}")
+    print(f"💾 Added {len(pairs) - len(failures)} mentor-mentee pairs to project.")
 
 if __name__ == "__main__":
     main()
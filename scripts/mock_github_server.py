@@ -0,0 +1,854 @@
+#!/usr/bin/env python3
+"""
+Mock GitHub API Server
+
+A local stand-in for the parts of the GitHub API these scripts use, so the
+project manager, the issue processor and the ProjectV2 GraphQL paths can be
+run, benchmarked and tested without a token or network access:
+
+- REST: /user, repository projects, project cards, issues, issue comments
+  and issue search, paginated with Link headers like api.github.com; GETs
+  carry an ETag and answer If-None-Match with an uncharged 304
+- GraphQL: viewer, repository, user/organization, node, nodes, rateLimit,
+  createProjectV2, addProjectV2ItemById, addProjectV2DraftIssue and
+  updateProjectV2ItemFieldValue, including aliased mutation batches, with
+  ProjectV2 fields and typed item field values; mutation inputs are
+  validated against GitHub's input types, so a document GitHub would
+  reject is rejected here too
+
+Latency, primary and secondary rate limits, GraphQL node limits and error
+injection are configurable, and every response carries X-RateLimit-*
+headers, so throughput and retry behavior can be measured repeatably in CI.
+Point the scripts at it with GITHUB_API_URL:
+
+    python scripts/mock_github_server.py --port 8765 --latency 0.05
+    GITHUB_API_URL=http://127.0.0.1:8765 python scripts/process_mentorship_issue.py ...
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import random
+import re
+import shlex
+import signal
+import threading
+import time
+from collections import Counter, deque, namedtuple
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+MAX_PER_PAGE = 100
+WRITE_METHODS = {'POST', 'PATCH', 'PUT', 'DELETE'}
+
+Reply = Tuple[int, object, Dict[str, str]]
+
+# Interfaces used in inline fragments, and the object types implementing them
+INTERFACES = {
+    'ProjectV2FieldCommon': {'ProjectV2Field', 'ProjectV2SingleSelectField'},
+    'ProjectV2ItemFieldValueCommon': {'ProjectV2ItemFieldTextValue', 'ProjectV2ItemFieldSingleSelectValue',
+                                      'ProjectV2ItemFieldDateValue', 'ProjectV2ItemFieldNumberValue'}
+}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+# -- GraphQL documents -------------------------------------------------
+# Mutation input objects: (GitHub type name, required fields, optional fields)
+MUTATION_INPUTS = {
+    "createProjectV2": ("CreateProjectV2Input", ("ownerId", "title"),
+                        ("repositoryId", "teamId", "clientMutationId")),
+    "addProjectV2ItemById": ("AddProjectV2ItemByIdInput", ("projectId", "contentId"), ("clientMutationId",)),
+    "addProjectV2DraftIssue": ("AddProjectV2DraftIssueInput", ("projectId", "title"),
+                               ("body", "assigneeIds", "clientMutationId")),
+    "updateProjectV2ItemFieldValue": ("UpdateProjectV2ItemFieldValueInput",
+                                      ("projectId", "itemId", "fieldId", "value"), ("clientMutationId",))
+}
+
+
+class GraphQLError(Exception):
+    """An error reported in the `errors` list of a GraphQL response"""
+
+    def __init__(self, message: str, error_type: str = 'UNPROCESSABLE'):
+        super().__init__(message)
+        self.type = error_type
+
+
+Field = namedtuple('Field', ['alias', 'name', 'args', 'selections'])
+Fragment = namedtuple('Fragment', ['type_condition', 'selections'])
+
+_TOKEN_RE = re.compile(r'''
+    (?P<skip>[\s,]+|\#[^\n]*)
+  | (?P<spread>\.\.\.)
+  | (?P<punct>[{}()\[\]:!$=@])
+  | (?P<string>"(?:\\.|[^"\\])*")
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+''', re.VERBOSE)
+
+
+class GraphQLParser:
+    """Parses the subset of GraphQL the scripts send: one operation with
+    aliases, arguments, variables, nested selections and inline fragments"""
+
+    def __init__(self, text: str, variables: Optional[Dict] = None):
+        self.variables = variables or {}
+        self.tokens: List[Tuple[str, str]] = []
+        position = 0
+        while position < len(text):
+            match = _TOKEN_RE.match(text, position)
+            if not match:
+                raise GraphQLError(f"Syntax Error: Unexpected character {text[position]!r}", 'SYNTAX_ERROR')
+            position = match.end()
+            if match.lastgroup != 'skip':
+                self.tokens.append((match.lastgroup, match.group()))
+        self.position = 0
+
+    def peek(self) -> Tuple[str, str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else ('eof', '')
+
+    def take(self, text: Optional[str] = None, kind: Optional[str] = None) -> str:
+        token_kind, token = self.peek()
+        if (text is not None and token != text) or (kind is not None and token_kind != kind):
+            raise GraphQLError(f"Syntax Error: Expected {text or kind}, found {token or 'end of document'}",
+                               'SYNTAX_ERROR')
+        self.position += 1
+        return token
+
+    def document(self) -> Tuple[str, List]:
+        """Return (operation type, top-level selections)"""
+        operation = 'query'
+        kind, token = self.peek()
+        if kind == 'name' and token in ('query', 'mutation', 'subscription'):
+            operation = self.take()
+            if self.peek()[0] == 'name':
+                self.take()
+            if self.peek()[1] == '(':
+                # Variable definitions: values arrive in `variables`
+                depth = 0
+                while True:
+                    token = self.take()
+                    depth += {'(': 1, ')': -1}.get(token, 0)
+                    if depth == 0:
+                        break
+        return operation, self.selection_set()
+
+    def selection_set(self) -> List:
+        self.take('{')
+        selections = []
+        while self.peek()[1] != '}':
+            selections.append(self.selection())
+        self.take('}')
+        return selections
+
+    def selection(self):
+        if self.peek()[0] == 'spread':
+            self.take()
+            type_condition = None
+            if self.peek()[1] == 'on':
+                self.take()
+                type_condition = self.take(kind='name')
+            return Fragment(type_condition, self.selection_set())
+        alias = name = self.take(kind='name')
+        if self.peek()[1] == ':':
+            self.take()
+            name = self.take(kind='name')
+        args = self.arguments() if self.peek()[1] == '(' else {}
+        while self.peek()[1] == '@':
+            self.take()
+            self.take(kind='name')
+            if self.peek()[1] == '(':
+                self.arguments()
+        selections = self.selection_set() if self.peek()[1] == '{' else None
+        return Field(alias, name, args, selections)
+
+    def arguments(self) -> Dict:
+        self.take('(')
+        args = {}
+        while self.peek()[1] != ')':
+            name = self.take(kind='name')
+            self.take(':')
+            args[name] = self.value()
+        self.take(')')
+        return args
+
+    def value(self):
+        kind, token = self.peek()
+        if token == '$':
+            self.take()
+            return self.variables.get(self.take(kind='name'))
+        if kind == 'string':
+            self.take()
+            return json.loads(token)
+        if kind == 'number':
+            self.take()
+            return float(token) if any(c in token for c in '.eE') else int(token)
+        if token == '[':
+            self.take()
+            items = []
+            while self.peek()[1] != ']':
+                items.append(self.value())
+            self.take(']')
+            return items
+        if token == '{':
+            self.take()
+            fields = {}
+            while self.peek()[1] != '}':
+                name = self.take(kind='name')
+                self.take(':')
+                fields[name] = self.value()
+            self.take('}')
+            return fields
+        self.take(kind='name')
+        # Enum values are passed through as their names
+        return {'true': True, 'false': False, 'null': None}.get(token, token)
+
+
+def select(value, selections: Optional[List]):
+    """Shape resolved data to the requested selection set
+
+    Object fields may be callables taking the field's arguments, which is
+    how connections (`items(first: 100, after: $cursor)`) are resolved.
+    """
+    if selections is None:
+        return value
+    if isinstance(value, list):
+        return [select(item, selections) for item in value]
+    if not isinstance(value, dict):
+        return value
+    result = {}
+    for selection in selections:
+        if isinstance(selection, Fragment):
+            typename = value.get('__typename')
+            if selection.type_condition in (None, typename) or \
+                    typename in INTERFACES.get(selection.type_condition, ()):
+                result.update(select(value, selection.selections))
+            continue
+        field = value.get(selection.name)
+        if callable(field):
+            field = field(selection.args)
+        result[selection.alias] = select(field, selection.selections)
+    return result
+
+
+def validate_input(field: Field) -> List[Dict]:
+    """Errors GitHub reports for a mutation's input object, in GitHub's wording"""
+    if field.name not in MUTATION_INPUTS:
+        return []
+    type_name, required, optional = MUTATION_INPUTS[field.name]
+    data = field.args.get('input')
+    path = ['mutation', field.alias, 'input']
+    if not isinstance(data, dict):
+        return [{"type": "missingRequiredArguments", "path": path[:2],
+                 "message": f"Field '{field.name}' is missing required arguments: input"}]
+    errors = [{"type": "argumentNotAccepted", "path": path + [key],
+               "message": f"InputObject '{type_name}' doesn't accept argument '{key}'"}
+              for key in data if key not in required and key not in optional]
+    errors += [{"type": "missingRequiredInputObjectAttribute", "path": path + [key],
+                "message": f"Argument '{key}' on InputObject '{type_name}' is required"}
+               for key in required if data.get(key) is None]
+    return errors
+
+
+def connection(nodes: List, args: Dict) -> Dict:
+    """A cursor-paginated GraphQL connection over `nodes`"""
+    first = min(int(args.get('first') or MAX_PER_PAGE), MAX_PER_PAGE)
+    start = 0
+    if args.get('after'):
+        start = int(base64.b64decode(args['after']).decode().split(':', 1)[1]) + 1
+    page = nodes[start:start + first]
+
+    def cursor(index: int) -> str:
+        return base64.b64encode(f"cursor:{index}".encode()).decode()
+
+    end = start + len(page)
+    return {
+        "totalCount": len(nodes),
+        "nodes": page,
+        "edges": [{"cursor": cursor(start + i), "node": node} for i, node in enumerate(page)],
+        "pageInfo": {
+            "hasNextPage": end < len(nodes),
+            "endCursor": cursor(end - 1) if page else None,
+            "hasPreviousPage": start > 0,
+            "startCursor": cursor(start) if page else None
+        }
+    }
+
+
+# -- API state and behavior --------------------------------------------
+
+class MockGitHub:
+    """In-memory GitHub data plus the rate limits and faults to apply"""
+
+    def __init__(self, latency: float = 0.0, rate_limit: int = 5000, search_rate_limit: int = 30,
+                 graphql_rate_limit: int = 5000, rate_limit_window: float = 3600.0,
+                 writes_per_second: Optional[int] = None, graphql_max_mutations: Optional[int] = None,
+                 error_rate: float = 0.0, error_every: int = 0, error_status: int = 502,
+                 seed: int = 0, viewer: str = 'mock-user'):
+        self.latency = latency
+        self.limits = {'core': rate_limit, 'search': search_rate_limit, 'graphql': graphql_rate_limit}
+        self.rate_limit_window = rate_limit_window
+        self.writes_per_second = writes_per_second
+        self.graphql_max_mutations = graphql_max_mutations
+        self.error_rate = error_rate
+        self.error_every = error_every
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.viewer = viewer
+
+        self.lock = threading.Lock()
+        self.stats: Counter = Counter()
+        self.used: Counter = Counter()
+        self.window_reset = time.time() + rate_limit_window
+        self.writes: deque = deque()
+
+        self.next_id = 1
+        self.repos: Dict[Tuple[str, str], Dict] = {}
+        self.projects: Dict[int, Dict] = {}
+        self.cards: Dict[int, Dict] = {}
+        self.issues: Dict[Tuple[str, str], Dict[int, Dict]] = {}
+        self.nodes: Dict[str, Dict] = {}
+        self.projects_v2: List[str] = []
+
+    # -- seeding --------------------------------------------------------
+
+    def _new_id(self) -> int:
+        value = self.next_id
+        self.next_id += 1
+        return value
+
+    def repo(self, owner: str, name: str) -> Dict:
+        """The repository owner/name, created on first use"""
+        key = (owner.lower(), name.lower())
+        repo = self.repos.get(key)
+        if repo is None:
+            node_id = f"R_{self._new_id()}"
+            repo = self.repos[key] = {
+                "__typename": "Repository", "id": node_id, "name": name, "owner": owner,
+                "projects": [], "projects_v2": [], "issues": {}
+            }
+            repo["projectsV2"] = lambda args, repo=repo: connection(
+                [self.nodes[node_id] for node_id in repo["projects_v2"]], args)
+            self.nodes[node_id] = repo
+        return repo
+
+    def add_project(self, owner: str, repo: str, name: str, body: str = '') -> Dict:
+        """Create a classic repository project"""
+        project_id = self._new_id()
+        project = self.projects[project_id] = {
+            "id": project_id, "name": name, "body": body, "state": "open", "number": len(self.projects) + 1,
+            "created_at": _now(), "updated_at": _now(), "cards": []
+        }
+        self.repo(owner, repo)["projects"].append(project_id)
+        return project
+
+    def add_issue(self, owner: str, repo: str, title: str, body: str = '',
+                  created_at: Optional[str] = None) -> Dict:
+        """Open an issue in owner/repo"""
+        issues = self.repo(owner, repo)["issues"]
+        number = len(issues) + 1
+        issue_id = self._new_id()
+        issue = issues[number] = {
+            "id": issue_id, "node_id": f"I_{issue_id}", "number": number, "title": title, "body": body,
+            "state": "open", "state_reason": None, "comments": 0,
+            "created_at": created_at or _now(), "updated_at": _now(),
+            "user": {"login": self.viewer},
+            "html_url": f"https://github.com/{owner}/{repo}/issues/{number}",
+            "repository": f"{owner}/{repo}"
+        }
+        # GraphQL view of the issue, so it can be added to a ProjectV2 board by contentId
+        self.nodes[issue["node_id"]] = {
+            "__typename": "Issue", "id": issue["node_id"], "number": number, "url": issue["html_url"],
+            "title": lambda args, issue=issue: issue["title"], "body": lambda args, issue=issue: issue["body"],
+            "state": lambda args, issue=issue: issue["state"].upper()
+        }
+        return issue
+
+    def add_project_v2(self, owner_id: str, title: str) -> Dict:
+        """Create a ProjectV2 board; it is linked to the repository when owned by one"""
+        node_id = f"PVT_{self._new_id()}"
+        project = self.nodes[node_id] = {
+            "__typename": "ProjectV2", "id": node_id, "title": title, "number": len(self.projects_v2) + 1,
+            "owner_id": owner_id, "item_ids": [], "field_ids": [], "createdAt": _now(), "updatedAt": _now(),
+            "closed": False
+        }
+        project["items"] = lambda args, project=project: connection(
+            [self.nodes[item_id] for item_id in project["item_ids"]], args)
+        project["fields"] = lambda args, project=project: connection(
+            [self.nodes[field_id] for field_id in project["field_ids"]], args)
+        self.projects_v2.append(node_id)
+        owner = self.nodes.get(owner_id)
+        if owner and owner["__typename"] == "Repository":
+            owner["projects_v2"].append(node_id)
+        return project
+
+    def add_project_v2_field(self, project_id: str, name: str, options: Optional[List[str]] = None) -> Dict:
+        """Add a text field, or a single-select field when `options` are given, to a ProjectV2 board"""
+        project = self.nodes[project_id]
+        node_id = f"PVTF_{self._new_id()}"
+        field = self.nodes[node_id] = {
+            "__typename": "ProjectV2SingleSelectField" if options else "ProjectV2Field",
+            "id": node_id, "name": name, "dataType": "SINGLE_SELECT" if options else "TEXT",
+            "options": [{"id": f"{node_id}_{i}", "name": option} for i, option in enumerate(options or [])]
+        }
+        project["field_ids"].append(node_id)
+        return field
+
+    def set_field_value(self, item: Dict, field_id: str, value: Dict):
+        """Store an updateProjectV2ItemFieldValue `value` as the typed node GitHub returns"""
+        field = self.nodes.get(field_id) or {"__typename": "ProjectV2Field", "id": field_id, "name": field_id}
+        reference = {"__typename": field["__typename"], "id": field["id"], "name": field["name"]}
+        if 'singleSelectOptionId' in value:
+            option = next((option for option in field.get("options", [])
+                           if option["id"] == value['singleSelectOptionId']), None)
+            if option is None:
+                raise GraphQLError(f"Invalid option id '{value['singleSelectOptionId']}'", 'INVALID_INPUT')
+            node = {"__typename": "ProjectV2ItemFieldSingleSelectValue", "name": option["name"],
+                    "optionId": option["id"]}
+        elif 'date' in value:
+            node = {"__typename": "ProjectV2ItemFieldDateValue", "date": value['date']}
+        elif 'number' in value:
+            node = {"__typename": "ProjectV2ItemFieldNumberValue", "number": value['number']}
+        else:
+            node = {"__typename": "ProjectV2ItemFieldTextValue", "text": value.get('text', '')}
+        item["field_values"][field_id] = dict(node, field=reference)
+        item["updatedAt"] = _now()
+
+    def add_project_v2_item(self, project_id: str, title: str = '', body: str = '',
+                            content: Optional[Dict] = None) -> Dict:
+        """Add a draft issue item (or an existing issue's content node) to a ProjectV2 board"""
+        project = self.nodes.get(project_id)
+        if not project or project["__typename"] != "ProjectV2":
+            raise GraphQLError(f"Could not resolve to a node with the global id of '{project_id}'", 'NOT_FOUND')
+        node_id = f"PVTI_{self._new_id()}"
+        item = self.nodes[node_id] = {
+            "__typename": "ProjectV2Item", "id": node_id, "type": "ISSUE" if content else "DRAFT_ISSUE",
+            "createdAt": _now(), "updatedAt": _now(), "isArchived": False, "field_values": {},
+            "content": content or {"__typename": "DraftIssue", "id": f"DI_{self._new_id()}",
+                                   "title": title, "body": body},
+            "project": project
+        }
+        item["fieldValues"] = lambda args, item=item: connection(list(item["field_values"].values()), args)
+        project["item_ids"].append(node_id)
+        project["updatedAt"] = _now()
+        return item
+
+    # -- request handling -------------------------------------------------
+
+    def handle(self, method: str, target: str, body: bytes, headers: Dict[str, str]) -> Reply:
+        """Answer one HTTP request: (status, JSON body, extra headers)"""
+        if self.latency:
+            time.sleep(self.latency)
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        query = dict(parse_qsl(url.query))
+        resource = 'graphql' if path == '/graphql' else 'search' if path.startswith('/search/') else 'core'
+
+        with self.lock:
+            self.stats['requests'] += 1
+            self.stats[f"{method} {resource}"] += 1
+            ordinal = self.stats['requests']
+
+            if not headers.get('Authorization'):
+                return self._count(401, {"message": "Requires authentication"}, {})
+
+            now = time.time()
+            if now >= self.window_reset:
+                self.used.clear()
+                self.window_reset = now + self.rate_limit_window
+            limit_headers = self._limit_headers(resource)
+            if self.used[resource] >= self.limits[resource]:
+                self.stats['rate_limited'] += 1
+                if resource == 'graphql':
+                    return self._count(200, {"errors": [{"type": "RATE_LIMITED",
+                                                         "message": "API rate limit exceeded"}]}, limit_headers)
+                return self._count(403, {"message": f"API rate limit exceeded for user {self.viewer}."},
+                                   limit_headers)
+
+            try:
+                payload = json.loads(body) if body else {}
+            except ValueError:
+                return self._count(400, {"message": "Problems parsing JSON"}, limit_headers)
+
+            if self.writes_per_second and self._is_write(method, resource, payload):
+                monotonic = time.monotonic()
+                while self.writes and monotonic - self.writes[0] > 1.0:
+                    self.writes.popleft()
+                if len(self.writes) >= self.writes_per_second:
+                    self.stats['secondary_limited'] += 1
+                    return self._count(403, {"message": "You have exceeded a secondary rate limit. "
+                                                        "Please wait a few minutes before you try again."},
+                                       dict(limit_headers, **{'Retry-After': '1'}))
+                self.writes.append(monotonic)
+
+            self.used[resource] += 1
+            limit_headers = self._limit_headers(resource)
+
+            if (self.error_every and ordinal % self.error_every == 0) or \
+                    (self.error_rate and self.random.random() < self.error_rate):
+                self.stats['injected_errors'] += 1
+                return self._count(self.error_status, {"message": "Server Error (injected)"}, limit_headers)
+
+            if resource == 'graphql' and method == 'POST' and isinstance(payload, dict):
+                status, data = 200, self.graphql(payload.get('query', ''), payload.get('variables'))
+                extra = {}
+            else:
+                status, data, extra = self.rest(method, path, query, payload, headers.get('Host', ''))
+                if method == 'GET' and status == 200:
+                    etag = f'"{hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()}"'
+                    extra = dict(extra, ETag=etag)
+                    if headers.get('If-None-Match') == etag:
+                        # Like GitHub, a conditional hit is not charged
+                        self.used[resource] -= 1
+                        self.stats['not_modified'] += 1
+                        return self._count(304, None, dict(self._limit_headers(resource), **extra))
+            return self._count(status, data, dict(limit_headers, **extra))
+
+    def _count(self, status: int, data, headers: Dict[str, str]) -> Reply:
+        self.stats[f"status {status}"] += 1
+        return status, data, headers
+
+    def _is_write(self, method: str, resource: str, payload) -> bool:
+        if resource == 'graphql':
+            query = payload.get('query', '') if isinstance(payload, dict) else ''
+            return query.lstrip().startswith('mutation')
+        return method in WRITE_METHODS
+
+    def _limit_headers(self, resource: str) -> Dict[str, str]:
+        used = self.used[resource]
+        return {
+            'X-RateLimit-Limit': str(self.limits[resource]),
+            'X-RateLimit-Remaining': str(max(0, self.limits[resource] - used)),
+            'X-RateLimit-Used': str(used),
+            'X-RateLimit-Reset': str(int(self.window_reset)),
+            'X-RateLimit-Resource': resource
+        }
+
+    # -- REST -------------------------------------------------------------
+
+    def rest(self, method: str, path: str, query: Dict, payload: Dict, host: str) -> Tuple[int, object, Dict]:
+        parts = path.strip('/').split('/')
+        route = (method, len(parts), parts[0] if parts else '')
+
+        if route == ('GET', 1, 'user'):
+            return 200, {"login": self.viewer, "id": 1, "type": "User"}, {}
+
+        if parts[0] == 'repos' and len(parts) >= 4:
+            owner, name, collection = parts[1], parts[2], parts[3]
+            repo = self.repo(owner, name)
+            if collection == 'projects' and len(parts) == 4:
+                if method == 'GET':
+                    projects = [self.projects[project_id] for project_id in repo["projects"]]
+                    return self._page(projects, path, query, host)
+                if method == 'POST':
+                    if not payload.get('name'):
+                        return 422, {"message": "Validation Failed", "errors": [{"field": "name"}]}, {}
+                    project = self.add_project(owner, name, payload['name'], payload.get('body', ''))
+                    return 201, self._public(project), {}
+            if collection == 'issues':
+                if len(parts) == 4 and method == 'POST':
+                    issue = self.add_issue(owner, name, payload.get('title', ''), payload.get('body', ''))
+                    return 201, issue, {}
+                issue = repo["issues"].get(int(parts[4])) if len(parts) >= 5 and parts[4].isdigit() else None
+                if issue is None:
+                    return 404, {"message": "Not Found"}, {}
+                if len(parts) == 5 and method == 'GET':
+                    return 200, issue, {}
+                if len(parts) == 5 and method == 'PATCH':
+                    for field in ('title', 'body', 'state', 'state_reason'):
+                        if field in payload:
+                            issue[field] = payload[field]
+                    issue["updated_at"] = _now()
+                    return 200, issue, {}
+                if len(parts) == 6 and parts[5] == 'comments' and method == 'POST':
+                    issue["comments"] += 1
+                    self.stats['comments'] += 1
+                    return 201, {"id": self._new_id(), "body": payload.get('body', ''),
+                                 "created_at": _now(), "user": {"login": self.viewer}}, {}
+
+        if parts[0] == 'projects':
+            if len(parts) == 3 and parts[2] == 'cards' and parts[1].isdigit():
+                project = self.projects.get(int(parts[1]))
+                if project is None:
+                    return 404, {"message": "Not Found"}, {}
+                if method == 'POST':
+                    card_id = self._new_id()
+                    card = self.cards[card_id] = {"id": card_id, "note": payload.get('note'),
+                                                  "project_id": project["id"], "archived": False,
+                                                  "created_at": _now(), "updated_at": _now()}
+                    project["cards"].append(card_id)
+                    return 201, card, {}
+                if method == 'GET':
+                    return self._page([self.cards[card_id] for card_id in project["cards"]], path, query, host)
+            if len(parts) == 3 and parts[1] == 'cards' and parts[2].isdigit():
+                card = self.cards.get(int(parts[2]))
+                if card is None:
+                    return 404, {"message": "Not Found"}, {}
+                if method == 'PATCH':
+                    card.update({key: payload[key] for key in ('note', 'archived') if key in payload})
+                    card["updated_at"] = _now()
+                    return 200, card, {}
+                if method == 'GET':
+                    return 200, card, {}
+            if len(parts) == 2 and parts[1].isdigit() and method == 'GET':
+                project = self.projects.get(int(parts[1]))
+                if project:
+                    return 200, self._public(project), {}
+
+        if route == ('GET', 2, 'search') and parts[1] == 'issues':
+            matches = self.search_issues(query.get('q', ''))
+            status, items, link = self._page(matches, path, query, host)
+            return status, {"total_count": len(matches), "incomplete_results": False, "items": items}, link
+
+        return 404, {"message": "Not Found", "documentation_url": "https://docs.github.com/rest"}, {}
+
+    @staticmethod
+    def _public(project: Dict) -> Dict:
+        return {key: value for key, value in project.items() if key != 'cards'}
+
+    def _page(self, items: List, path: str, query: Dict, host: str) -> Tuple[int, List, Dict]:
+        per_page = min(int(query.get('per_page', 30)), MAX_PER_PAGE)
+        page = max(1, int(query.get('page', 1)))
+        start = (page - 1) * per_page
+        headers = {}
+        if start + per_page < len(items):
+            next_query = urlencode(dict(query, page=page + 1, per_page=per_page))
+            headers['Link'] = f'<http://{host}{path}?{next_query}>; rel="next"'
+        return 200, items[start:start + per_page], headers
+
+    def search_issues(self, q: str) -> List[Dict]:
+        """Issues matching a search query (repo:, is:, in:title, created: and text terms)"""
+        repos, states, terms, since = [], set(), [], ''
+        for term in shlex.split(q):
+            qualifier, _, value = term.partition(':')
+            if qualifier == 'repo' and value:
+                repos.append(tuple(value.lower().split('/', 1)))
+            elif qualifier == 'is' and value in ('open', 'closed'):
+                states.add(value)
+            elif qualifier == 'created' and value.startswith('>='):
+                since = value[2:]
+            elif qualifier not in ('is', 'in', 'sort', 'type') or not value:
+                terms.append(term.lower())
+        matches = []
+        for key, repo in self.repos.items():
+            if repos and key not in repos:
+                continue
+            for issue in repo["issues"].values():
+                if states and issue["state"] not in states:
+                    continue
+                if since and issue["created_at"][:len(since)] < since:
+                    continue
+                if all(term in issue["title"].lower() for term in terms):
+                    matches.append(issue)
+        return sorted(matches, key=lambda issue: issue["created_at"])
+
+    # -- GraphQL ----------------------------------------------------------
+
+    def graphql(self, document: str, variables: Optional[Dict]) -> Dict:
+        try:
+            operation, selections = GraphQLParser(document, variables).document()
+        except GraphQLError as e:
+            return {"errors": [{"type": e.type, "message": str(e)}]}
+
+        if operation == 'mutation':
+            fields = [selection for selection in selections if isinstance(selection, Field)]
+            self.stats['mutations'] += len(fields)
+            if self.graphql_max_mutations and len(fields) > self.graphql_max_mutations:
+                return {"errors": [{"type": "MAX_NODE_LIMIT_EXCEEDED",
+                                    "message": f"This query requests {len(fields)} mutations, which "
+                                               f"exceeds the limit of {self.graphql_max_mutations}"}]}
+            # Like GitHub, an invalid input rejects the whole document before anything runs
+            errors = [error for field in fields for error in validate_input(field)]
+            if errors:
+                return {"errors": errors}
+            root = {
+                "createProjectV2": self._create_project_v2,
+                "addProjectV2ItemById": self._add_item,
+                "addProjectV2DraftIssue": self._add_draft_issue,
+                "updateProjectV2ItemFieldValue": self._update_field_value
+            }
+        else:
+            root = {
+                "viewer": lambda args: {"__typename": "User", "login": self.viewer, "id": f"U_{self.viewer}"},
+                "repository": lambda args: self.repo(args['owner'], args['name']),
+                "user": lambda args: {"__typename": "User", "login": args['login'], "id": f"U_{args['login']}"},
+                "organization": lambda args: None,
+                "node": lambda args: self.nodes.get(args['id']),
+                "nodes": lambda args: [self.nodes.get(node_id) for node_id in args.get('ids', [])],
+                "rateLimit": lambda args: self._rate_limit_object()
+            }
+
+        data, errors = {}, []
+        for selection in selections:
+            if isinstance(selection, Fragment):
+                continue
+            resolver = root.get(selection.name)
+            try:
+                if resolver is None:
+                    raise GraphQLError(f"Field '{selection.name}' doesn't exist on type "
+                                       f"'{'Mutation' if operation == 'mutation' else 'Query'}'",
+                                       'undefinedField')
+                data[selection.alias] = select(resolver(selection.args), selection.selections)
+            except GraphQLError as e:
+                data[selection.alias] = None
+                errors.append({"type": e.type, "path": [selection.alias], "message": str(e)})
+        result = {"data": data}
+        if errors:
+            result["errors"] = errors
+        return result
+
+    def _rate_limit_object(self) -> Dict:
+        limit = self.limits['graphql']
+        reset = datetime.fromtimestamp(self.window_reset, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        return {"limit": limit, "cost": 1, "used": self.used['graphql'],
+                "remaining": max(0, limit - self.used['graphql']), "resetAt": reset}
+
+    def _create_project_v2(self, args: Dict) -> Dict:
+        data = args['input']
+        return {"projectV2": self.add_project_v2(data['ownerId'], data['title'])}
+
+    def _add_item(self, args: Dict) -> Dict:
+        data = args['input']
+        content = self.nodes.get(data['contentId'])
+        if not content or content["__typename"] not in ('Issue', 'PullRequest'):
+            raise GraphQLError(f"Could not resolve to a node with the global id of '{data['contentId']}'",
+                               'NOT_FOUND')
+        return {"item": self.add_project_v2_item(data['projectId'], content=content)}
+
+    def _add_draft_issue(self, args: Dict) -> Dict:
+        data = args['input']
+        return {"projectItem": self.add_project_v2_item(data['projectId'], data['title'], data.get('body') or '')}
+
+    def _update_field_value(self, args: Dict) -> Dict:
+        data = args.get('input') or {}
+        item = self.nodes.get(data.get('itemId', ''))
+        if not item or item["__typename"] != "ProjectV2Item" or item["project"]["id"] != data.get('projectId'):
+            raise GraphQLError(f"Could not resolve to a node with the global id of '{data.get('itemId')}'",
+                               'NOT_FOUND')
+        self.set_field_value(item, data.get('fieldId'), data.get('value') or {})
+        return {"projectV2Item": item}
+
+
+# -- HTTP server --------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def _dispatch(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        status, data, headers = self.server.mock.handle(self.command, self.path, body, dict(self.headers))
+        # 304 Not Modified has no body
+        payload = json.dumps(data).encode() if status != 304 else b''
+        self.send_response(status)
+        if status != 304:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockGitHubServer:
+    """Runs a MockGitHub on a local port in a background thread
+
+    Use as a context manager; `url` is the value for GITHUB_API_URL or
+    GitHubClient(base_url=...), and `mock` exposes the data and stats.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, **options):
+        self.mock = MockGitHub(**options)
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.mock = self.mock
+        self.url = f"http://{host}:{self.httpd.server_address[1]}"
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'MockGitHubServer':
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> 'MockGitHubServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def sample_issue_body(i: int) -> str:
+    """A filled-in "New Mentorship Pair" issue body for seeding"""
+    return (f"## Mentorship Pair Information\n\n**Mentor**: Mentor {i}\n**Mentee**: Mentee {i}\n\n"
+            f"## Program Details\n\n**Track/Focus Area**: Machine Learning\n**Start Date**: 2025-01-15\n"
+            f"**End Date**: 2025-06-30\n\n## Goals\n- [ ] Learn fundamentals\n- [ ] Ship a project\n\n"
+            f"## Expected Deliverables\n- [ ] Development plan\n\n## Contact Information\n"
+            f"**Mentor Email**: mentor{i}@example.com\n**Mentee Email**: mentee{i}@example.com\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a local mock of the GitHub REST and GraphQL APIs')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on (0 picks a free port)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--rate-limit', type=int, default=5000, help='REST requests per window')
+    parser.add_argument('--search-rate-limit', type=int, default=30, help='Search requests per window')
+    parser.add_argument('--graphql-rate-limit', type=int, default=5000, help='GraphQL requests per window')
+    parser.add_argument('--rate-limit-window', type=float, default=3600.0, help='Seconds before budgets reset')
+    parser.add_argument('--writes-per-second', type=int, help='Secondary limit on writes and mutations')
+    parser.add_argument('--graphql-max-mutations', type=int, help='Reject mutation batches larger than this')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests that fail')
+    parser.add_argument('--error-every', type=int, default=0, help='Fail every Nth request')
+    parser.add_argument('--error-status', type=int, default=502, help='Status code of injected failures')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for --error-rate')
+    parser.add_argument('--owner', default='latinxinai', help='Owner of the seeded repository')
+    parser.add_argument('--repo', default='mentorship-2025', help='Name of the seeded repository')
+    parser.add_argument('--issues', type=int, default=0, help='Seed this many "New Mentorship Pair" issues')
+    args = parser.parse_args()
+
+    server = MockGitHubServer(args.host, args.port, latency=args.latency, rate_limit=args.rate_limit,
+                              search_rate_limit=args.search_rate_limit,
+                              graphql_rate_limit=args.graphql_rate_limit,
+                              rate_limit_window=args.rate_limit_window,
+                              writes_per_second=args.writes_per_second,
+                              graphql_max_mutations=args.graphql_max_mutations,
+                              error_rate=args.error_rate, error_every=args.error_every,
+                              error_status=args.error_status, seed=args.seed)
+    for i in range(1, args.issues + 1):
+        server.mock.add_issue(args.owner, args.repo, f"New Mentorship Pair: Mentor {i} ↔ Mentee {i}",
+                              sample_issue_body(i))
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    # CI jobs stop background servers with SIGTERM; shut down the same way as Ctrl-C
+    signal.signal(signal.SIGTERM, stop)
+    print(f"🧪 Mock GitHub API listening on {server.url}", flush=True)
+    print(f"   export GITHUB_API_URL={server.url}")
+    if args.issues:
+        print(f"📋 Seeded {args.issues} issues in {args.owner}/{args.repo}", flush=True)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"📊 Requests served: {dict(server.mock.stats)}")
+
+
+if __name__ == '__main__':
+    main()
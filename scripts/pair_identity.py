@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Pair Identity and Index
+
+Folder names and sync keys used to be derived from row numbers or display
+names, so the same pair could not be matched across runs and two pairs with
+the same names collided. Every pair now gets a canonical key: a hash of its
+normalized mentor and mentee emails (or names when no emails are known). The
+pair index maps that key to the pair's folder and project card, so sync,
+migration and folder generation find an existing pair with one dictionary
+lookup instead of scanning directories or the project.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from pair_model import Pair
+
+DEFAULT_INDEX_FILE = ".mentorship/pair_index.json"
+INDEX_VERSION = 1
+KEY_LENGTH = 16
+
+_SPACES_RE = re.compile(r'\s+')
+
+
+def normalize_identity(value: str) -> str:
+    """Lowercase an email or name and collapse whitespace"""
+    return _SPACES_RE.sub(' ', (value or '').strip().lower())
+
+
+def pair_identity(pair: Pair) -> str:
+    """The normalized 'mentor|mentee' string a pair key is hashed from"""
+    mentor = pair.contact_info.mentor_email or pair.mentor
+    mentee = pair.contact_info.mentee_email or pair.mentee
+    return f"{normalize_identity(mentor)}|{normalize_identity(mentee)}"
+
+
+def pair_key(pair: Pair) -> str:
+    """Canonical, stable key for a mentor-mentee pair"""
+    return hashlib.sha256(pair_identity(pair).encode('utf-8')).hexdigest()[:KEY_LENGTH]
+
+
+def find_duplicates(pairs: Iterable[Pair]) -> Dict[str, List[Pair]]:
+    """Group pairs that share a key; only keys seen more than once are returned"""
+    groups: Dict[str, List[Pair]] = {}
+    for pair in pairs:
+        groups.setdefault(pair_key(pair), []).append(pair)
+    return {key: group for key, group in groups.items() if len(group) > 1}
+
+
+class PairIndex:
+    """On-disk map of pair key -> folder and project card"""
+
+    def __init__(self, path: str = DEFAULT_INDEX_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict] = self._load()
+        self.by_folder = {entry['folder']: key for key, entry in self.entries.items() if entry.get('folder')}
+        self.dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != INDEX_VERSION:
+            print(f"⚠️  Ignoring pair index with unknown version: {self.path}")
+            return {}
+        return data.get('pairs', {})
+
+    def save(self):
+        """Atomically write the index if it changed"""
+        with self.lock:
+            if not self.dirty:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": INDEX_VERSION, "pairs": self.entries}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self.entries.get(key)
+
+    def folder_for(self, pair: Pair) -> Optional[str]:
+        entry = self.entries.get(pair_key(pair))
+        return entry.get('folder') if entry else None
+
+    def card_for(self, pair: Pair) -> Optional[int]:
+        entry = self.entries.get(pair_key(pair))
+        return entry.get('card_id') if entry else None
+
+    def record(self, pair: Pair, key: Optional[str] = None, **fields) -> str:
+        """Store fields (folder, card_id, ...) for a pair and return its key"""
+        key = key or pair_key(pair)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = {"identity": pair_identity(pair)}
+                self.dirty = True
+            old_folder = entry.get('folder')
+            for name, value in fields.items():
+                if value is not None and entry.get(name) != value:
+                    entry[name] = value
+                    self.dirty = True
+            if entry.get('folder') != old_folder:
+                self.by_folder.pop(old_folder, None)
+                self.by_folder[entry['folder']] = key
+        return key
+
+    def folder_owner(self, folder: str) -> Optional[str]:
+        """Key of the pair an indexed folder belongs to"""
+        return self.by_folder.get(folder)
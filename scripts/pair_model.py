@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Mentorship Pair Model
+
+The one representation of a mentor-mentee pair shared by every script. Pairs
+used to travel as free-form dicts, rebuilt slightly differently in each
+script and re-checked with `.get(..., default)` at every use. A Pair is
+validated once when it is built (from the issue parser, a pairings folder, a
+roster row or a JSON file) and then read through plain attributes.
+
+The classes use __slots__ rather than dataclasses so they stay compact (no
+per-instance __dict__) on the Python 3.9 runtime used by the workflows. The
+JSON form matches templates/pair_template.json.
+"""
+
+import json
+import sys
+from typing import Dict, IO, Iterable, Iterator, List, Optional
+
+from instrumentation import timed
+
+
+def _text(value, field: str) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+        return str(value).strip()
+    raise ValueError(f"{field} must be a string, got {type(value).__name__}")
+
+
+def _shared(value, field: str) -> str:
+    # Values repeated across a cohort (tracks, platforms, dates, statuses) are
+    # interned so thousands of pairs hold one copy instead of one each
+    return sys.intern(_text(value, field))
+
+
+def _text_list(value, field: str) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"{field} must be a list of strings, got {type(value).__name__}")
+    items = [_text(item, field) for item in value]
+    return [item for item in items if item]
+
+
+class _Record:
+    """Shared codec for the flat, string-valued info records"""
+
+    __slots__ = ()
+    SHARED = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, self._convert(name, fields.pop(name, None)))
+        if fields:
+            raise ValueError(f"Unknown {type(self).__name__} fields: {', '.join(sorted(fields))}")
+
+    def _convert(self, name: str, value) -> str:
+        return _shared(value, name) if name in self.SHARED else _text(value, name)
+
+    def update(self, data: Dict) -> '_Record':
+        for name in self.__slots__:
+            if name in data:
+                setattr(self, name, self._convert(name, data[name]))
+        return self
+
+    def to_dict(self) -> Dict[str, str]:
+        """Only the fields that are set"""
+        return {name: getattr(self, name) for name in self.__slots__ if getattr(self, name)}
+
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.to_dict().items())})"
+
+
+class ContactInfo(_Record):
+    """How to reach the pair"""
+
+    __slots__ = ('mentor_email', 'mentee_email', 'preferred_meeting_platform', 'timezone')
+    SHARED = ('preferred_meeting_platform', 'timezone')
+
+
+class ProgramInfo(_Record):
+    """Where the pair sits in the program"""
+
+    __slots__ = ('start_date', 'end_date', 'program_track', 'mentor_company', 'mentee_background')
+    SHARED = __slots__
+
+
+class Pair:
+    """A mentor-mentee pair"""
+
+    __slots__ = ('mentor', 'mentee', 'goals', 'progress', 'meetings', 'deliverables',
+                 'last_updated', 'contact_info', 'program_info', 'migration_source')
+
+    TEXT_FIELDS = ('mentor', 'mentee', 'migration_source')
+    SHARED_FIELDS = ('progress', 'last_updated')
+    LIST_FIELDS = ('goals', 'meetings', 'deliverables')
+
+    def __init__(self, mentor: str = '', mentee: str = '', goals: Optional[List[str]] = None,
+                 progress: str = '', meetings: Optional[List[str]] = None,
+                 deliverables: Optional[List[str]] = None, last_updated: str = '',
+                 contact_info: Optional[ContactInfo] = None, program_info: Optional[ProgramInfo] = None,
+                 migration_source: str = ''):
+        self.mentor = _text(mentor, 'mentor')
+        self.mentee = _text(mentee, 'mentee')
+        self.goals = _text_list(goals, 'goals')
+        self.progress = _shared(progress, 'progress')
+        self.meetings = _text_list(meetings, 'meetings')
+        self.deliverables = _text_list(deliverables, 'deliverables')
+        self.last_updated = _shared(last_updated, 'last_updated')
+        self.contact_info = contact_info or ContactInfo()
+        self.program_info = program_info or ProgramInfo()
+        self.migration_source = _text(migration_source, 'migration_source')
+
+    def update(self, data: Dict) -> 'Pair':
+        """Validate and apply fields from a dict (JSON, parser output or a roster row)
+
+        Nested info may be given as `contact_info` / `program_info` objects or
+        as flat keys such as `mentor_email` or `program_track`. Unknown keys
+        are ignored.
+        """
+        for name in self.TEXT_FIELDS:
+            if name in data:
+                setattr(self, name, _text(data[name], name))
+        for name in self.SHARED_FIELDS:
+            if name in data:
+                setattr(self, name, _shared(data[name], name))
+        for name in self.LIST_FIELDS:
+            if name in data:
+                setattr(self, name, _text_list(data[name], name))
+        for name, record in (('contact_info', self.contact_info), ('program_info', self.program_info)):
+            nested = data.get(name)
+            if nested is not None and not isinstance(nested, dict):
+                raise ValueError(f"{name} must be an object, got {type(nested).__name__}")
+            record.update(data)
+            if nested:
+                record.update(nested)
+        return self
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Pair':
+        if not isinstance(data, dict):
+            raise ValueError(f"A pair must be a JSON object, got {type(data).__name__}")
+        return cls().update(data)
+
+    def to_dict(self) -> Dict:
+        """JSON-ready dict in the pair_template.json layout, without empty nested fields"""
+        data = {
+            "mentor": self.mentor,
+            "mentee": self.mentee,
+            "goals": list(self.goals),
+            "progress": self.progress,
+            "meetings": list(self.meetings),
+            "deliverables": list(self.deliverables),
+            "last_updated": self.last_updated
+        }
+        contact_info = self.contact_info.to_dict()
+        if contact_info:
+            data["contact_info"] = contact_info
+        program_info = self.program_info.to_dict()
+        if program_info:
+            data["program_info"] = program_info
+        if self.migration_source:
+            data["migration_source"] = self.migration_source
+        return data
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, text: str) -> 'Pair':
+        return cls.from_dict(json.loads(text))
+
+    def copy(self, **changes) -> 'Pair':
+        """A copy with some top-level fields replaced"""
+        pair = Pair.from_dict(self.to_dict())
+        for name, value in changes.items():
+            setattr(pair, name, value)
+        return pair
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Pair) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"Pair(mentor={self.mentor!r}, mentee={self.mentee!r})"
+
+
+@timed('parse')
+def load_pairs(path: str) -> List[Pair]:
+    """Load pairs from a JSON file (one pair or a list) or a JSON Lines file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            return list(iter_jsonl(f))
+        data = json.load(f)
+    if isinstance(data, list):
+        return [Pair.from_dict(item) for item in data]
+    return [Pair.from_dict(data)]
+
+
+def iter_jsonl(f: IO[str]) -> Iterator[Pair]:
+    """Stream pairs from JSON Lines"""
+    for line in f:
+        if line.strip():
+            yield Pair.from_json(line)
+
+
+def write_jsonl(pairs: Iterable[Pair], f: IO[str]) -> int:
+    """Write pairs as JSON Lines and return how many were written"""
+    count = 0
+    for pair in pairs:
+        f.write(pair.to_json())
+        f.write('\n')
+        count += 1
+    return count
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Mentorship Markdown Field Parser
+
+A precompiled, single-pass tokenizer for the markdown used in mentorship
+issues and pairing notes. Each line is classified once (heading, list item,
+`**Label**: value`, `Label: value` or plain text) and routed to the field it
+belongs to, so a document is walked exactly once no matter how many fields
+are extracted, and no pattern can backtrack across lines. Whole bodies are
+scanned with a single finditer rather than split into lines first.
+"""
+
+import itertools
+import re
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+# One anchored, bounded pattern per line; alternatives are tried in order and
+# every non-blank line matches one (`text` is the fallback). MULTILINE lets
+# the same pattern walk a whole body with finditer, skipping blank lines. Empty
+# items and blank lines right after an item change nothing, so they are
+# consumed with it instead of costing a match each
+_LINE_RE = re.compile(r"""
+    ^[ \t]*
+    (?:
+        (?P<heading>\#{1,6})[ \t]+(?P<htext>[^\n]*?)[ \t\#]*$
+      | (?:[-+]|\*(?!\*))[ \t]*(?P<item>[^\n]*)$(?:\n[ \t]*[-+*]?[ \t]*$)*
+      | \*\*(?P<blabel>[^*\n]{1,80})\*\*[ \t]*:?[ \t]*(?P<bvalue>[^\n]*)$
+      | (?P<plabel>[A-Za-z][\w /&-]{0,40}?)[ \t]*:[ \t]*(?P<pvalue>[^\n]*)$
+      | (?P<text>[^\n]*\S[^\n]*)$
+    )
+""", re.VERBOSE | re.MULTILINE)
+_COMMENT_RE = re.compile(r'<!--.*?(?:-->|\Z)', re.DOTALL)
+_PAIR_TITLE_RE = re.compile(r'^[ \t]*\#[ \t]+Pair[ \t]+\d+[ \t]*:[ \t]*(?P<mentor>[^&\n]+?)[ \t]*&[ \t]*(?P<mentee>[^\n]+?)[ \t]*$',
+                            re.IGNORECASE)
+_CHECKBOX_RE = re.compile(r'^\[[ xX]\][ \t]*')
+_LABEL_NOISE_RE = re.compile(r'[^a-z0-9/& ]+')
+_SPACES_RE = re.compile(r'\s+')
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+
+FieldSpec = Dict[str, Tuple[Sequence[str], bool]]
+ParsedFields = Dict[str, Union[str, List[str]]]
+
+# field name -> (label aliases, is_list)
+ISSUE_FIELDS: FieldSpec = {
+    "mentor": (("mentor",), False),
+    "mentee": (("mentee",), False),
+    "mentor_email": (("mentor email",), False),
+    "mentee_email": (("mentee email",), False),
+    "goals": (("goal", "goals"), True),
+    "program_track": (("track", "focus", "area", "focus area", "track/focus area"), False),
+    "deliverables": (("deliverable", "deliverables", "expected deliverables"), True),
+    "start_date": (("start date",), False),
+    "end_date": (("end date",), False),
+}
+
+NOTES_FIELDS: FieldSpec = {
+    "goals": (("goal", "goals", "objective", "objectives"), True),
+    "progress": (("progress", "status"), False),
+    "meetings": (("meeting", "meetings", "session", "sessions"), True),
+    "deliverables": (("deliverable", "deliverables"), True),
+}
+
+
+def normalize_label(label: str) -> str:
+    """Lowercase a label and drop emoji, markup and punctuation around it"""
+    label = _LABEL_NOISE_RE.sub('', label.lower())
+    return _SPACES_RE.sub(' ', label).strip()
+
+
+def clean_item(text: str) -> str:
+    """Strip list markers and task checkboxes from a list item"""
+    text = text.strip().strip('- *').strip()
+    if text[:1] == '[':
+        text = _CHECKBOX_RE.sub('', text).strip()
+    return text
+
+
+def strip_comments(text: str) -> str:
+    """Remove HTML comments from a whole body, keeping the line breaks inside them"""
+    if '<!--' not in text:
+        return text
+    return _COMMENT_RE.sub(lambda match: '\n' * match.group().count('\n'), text)
+
+
+def iter_content_lines(lines: Iterable[str]) -> Iterable[str]:
+    """Yield non-blank lines with HTML comments (including multi-line ones) removed"""
+    in_comment = False
+    for line in lines:
+        if in_comment or '<!--' in line:
+            kept = []
+            rest = line
+            while rest:
+                if in_comment:
+                    end = rest.find('-->')
+                    if end < 0:
+                        rest = ''
+                        break
+                    rest = rest[end + 3:]
+                    in_comment = False
+                else:
+                    start = rest.find('<!--')
+                    if start < 0:
+                        kept.append(rest)
+                        break
+                    kept.append(rest[:start])
+                    rest = rest[start + 4:]
+                    in_comment = True
+            line = ''.join(kept)
+        if line.strip():
+            yield line.rstrip('\r\n')
+
+
+class FieldParser:
+    """Extracts labelled values and lists from markdown in a single pass"""
+
+    def __init__(self, fields: FieldSpec):
+        self.fields = fields
+        self.lookup: Dict[str, Tuple[str, bool]] = {}
+        for name, (aliases, is_list) in fields.items():
+            for alias in aliases:
+                self.lookup[normalize_label(alias)] = (name, is_list)
+
+    def parse(self, lines: Iterable[str]) -> ParsedFields:
+        """Parse an iterable of lines (a string's splitlines() or an open file)
+
+        The first occurrence of each field wins. List fields collect the list
+        items that follow their label; value fields take the inline value or,
+        if empty, the next line of content.
+        """
+        return self._parse(map(_LINE_RE.match, iter_content_lines(lines)))
+
+    def parse_text(self, text: str) -> ParsedFields:
+        """Parse a whole document held in a string, like parse(text.splitlines())"""
+        # Same line breaks as splitlines(), so \r\n and \r bodies split alike
+        text = strip_comments('\n'.join(text.splitlines()))
+        return self._parse(_LINE_RE.finditer(text))
+
+    def _parse(self, matches: Iterable[re.Match]) -> ParsedFields:
+        result: ParsedFields = {}
+        collecting = None  # list field currently receiving items
+        pending = None     # value field waiting for the next content line
+        lookup = self.lookup
+
+        for match in matches:
+            # The last group of each alternative tells which one matched
+            kind = match.lastgroup
+            if kind == 'item':
+                item = match.group('item')
+                item = clean_item(item) if item else ''
+                if collecting:
+                    if item:
+                        result[collecting].append(item)
+                elif pending:
+                    if item:
+                        result[pending] = item
+                    pending = None
+                continue
+
+            field = None
+            if kind != 'text':
+                if kind == 'htext':
+                    label, value = match.group('htext'), ''
+                elif kind == 'bvalue':
+                    label, value = match.group('blabel', 'bvalue')
+                else:
+                    label, value = match.group('plabel', 'pvalue')
+                # Most labels are plain words; only normalize the ones with markup or emoji
+                label = label.lower().strip()
+                field = lookup.get(label)
+                if field is None and (_LABEL_NOISE_RE.search(label) or '  ' in label):
+                    field = lookup.get(normalize_label(label))
+            if field is None:
+                # Any other content ends the current list
+                if pending and kind != 'htext':
+                    result[pending] = match.group().strip()
+                collecting = pending = None
+                continue
+
+            name, is_list = field
+            collecting = pending = None
+            if name in result:
+                continue
+            value = value.strip().lstrip(':').strip()
+            if is_list:
+                result[name] = [clean_item(value)] if value else []
+                collecting = name
+            elif value:
+                result[name] = value
+            else:
+                pending = name
+
+        return result
+
+
+ISSUE_PARSER = FieldParser(ISSUE_FIELDS)
+NOTES_PARSER = FieldParser(NOTES_FIELDS)
+
+
+def parse_issue_body(body: str) -> ParsedFields:
+    """Parse the fields of a "New Mentorship Pair" issue body
+
+    Email fields keep only the address, so `<jane@example.com>` or a mailto
+    link gives the same pair key as the roster's bare address.
+    """
+    fields = ISSUE_PARSER.parse_text(body)
+    for name in ('mentor_email', 'mentee_email'):
+        if name in fields:
+            email = _EMAIL_RE.search(fields[name])
+            if email:
+                fields[name] = email.group()
+            else:
+                del fields[name]
+    return fields
+
+
+def parse_notes(lines: Iterable[str]) -> ParsedFields:
+    """Parse pairing notes or a pair README, streaming the lines once
+
+    A leading `# Pair N: mentor & mentee` title (the create_pairs.py README
+    layout) fills in the mentor and mentee.
+    """
+    lines = iter_content_lines(lines)
+    first = next(lines, None)
+    if first is None:
+        return {}
+
+    result: ParsedFields = {}
+    title = _PAIR_TITLE_RE.match(first)
+    if title:
+        result["mentor"] = title.group('mentor')
+        result["mentee"] = title.group('mentee')
+    else:
+        lines = itertools.chain((first,), lines)
+    result.update(NOTES_PARSER.parse(lines))
+    return result
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Pair Store
+
+An indexed SQLite database of every pair the scripts have seen: the people,
+the pair's program details, its meetings and deliverables, and a history of
+status changes. Before it, answering "which ML pairs are still Not Started?"
+meant re-reading project_cards.csv or parsing every pairings/*/README.md.
+create_pairs.py, the migrator and the issue processor write to it in bulk
+(one executemany per table per batch); the query methods below and the
+command line read from it through the indexes on mentor, mentee, track and
+status.
+
+Writes merge rather than replace: an empty field or list from one source
+(a roster row has no meetings) never erases what another source recorded.
+Rows are only rewritten when a value changes, so re-adding the same pairs
+leaves the database file untouched. The scripts only write to the store
+when given --store-file.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from instrumentation import timed
+from pair_identity import PairIndex, normalize_identity, pair_key
+from pair_model import ContactInfo, Pair, ProgramInfo
+
+DEFAULT_STORE_FILE = ".mentorship/pairs.db"
+SCHEMA_VERSION = 1
+# Stay under SQLite's default limit of 999 bound parameters per statement
+KEYS_PER_QUERY = 500
+
+PROGRAM_COLUMNS = ProgramInfo.__slots__
+CONTACT_COLUMNS = ('preferred_meeting_platform', 'timezone')
+PAIR_COLUMNS = ('key', 'mentor', 'mentee', 'status', 'goals', 'last_updated', 'migration_source') \
+    + PROGRAM_COLUMNS + CONTACT_COLUMNS + ('folder', 'card_id', 'source', 'updated_at')
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS people (
+    identity TEXT PRIMARY KEY,
+    name TEXT NOT NULL DEFAULT '',
+    email TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS people_name ON people (name COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS pairs (
+    key TEXT PRIMARY KEY,
+    mentor TEXT NOT NULL REFERENCES people (identity),
+    mentee TEXT NOT NULL REFERENCES people (identity),
+    status TEXT NOT NULL DEFAULT '',
+    goals TEXT NOT NULL DEFAULT '[]',
+    last_updated TEXT NOT NULL DEFAULT '',
+    migration_source TEXT NOT NULL DEFAULT '',
+    {', '.join(f"{name} TEXT NOT NULL DEFAULT ''" for name in PROGRAM_COLUMNS + CONTACT_COLUMNS)},
+    folder TEXT,
+    card_id INTEGER,
+    source TEXT NOT NULL DEFAULT '',
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pairs_mentor ON pairs (mentor);
+CREATE INDEX IF NOT EXISTS pairs_mentee ON pairs (mentee);
+CREATE INDEX IF NOT EXISTS pairs_track ON pairs (program_track COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS pairs_status ON pairs (status COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS meetings (
+    pair_key TEXT NOT NULL REFERENCES pairs (key),
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (pair_key, position)
+);
+CREATE TABLE IF NOT EXISTS deliverables (
+    pair_key TEXT NOT NULL REFERENCES pairs (key),
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (pair_key, position)
+);
+
+CREATE TABLE IF NOT EXISTS status_history (
+    pair_key TEXT NOT NULL REFERENCES pairs (key),
+    status TEXT NOT NULL,
+    changed_at TEXT NOT NULL,
+    source TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS status_history_pair ON status_history (pair_key);
+
+-- History is kept by the database, so bulk upserts need no read-before-write
+CREATE TRIGGER IF NOT EXISTS pairs_status_new AFTER INSERT ON pairs
+BEGIN
+    INSERT INTO status_history VALUES (NEW.key, NEW.status, NEW.updated_at, NEW.source);
+END;
+CREATE TRIGGER IF NOT EXISTS pairs_status_changed AFTER UPDATE OF status ON pairs
+WHEN OLD.status IS NOT NEW.status
+BEGIN
+    INSERT INTO status_history VALUES (NEW.key, NEW.status, NEW.updated_at, NEW.source);
+END;
+"""
+
+# A value from a later source only replaces a stored one when it is set. The
+# people a key was first stored with stay: the key is derived from them
+_MERGED = [("goals", "CASE WHEN excluded.goals = '[]' THEN goals ELSE excluded.goals END")] \
+    + [(name, f"COALESCE(NULLIF(excluded.{name}, ''), {name})") for name in PAIR_COLUMNS
+       if name not in ('key', 'mentor', 'mentee', 'goals', 'source', 'updated_at', 'folder', 'card_id')] \
+    + [(name, f"COALESCE(excluded.{name}, {name})") for name in ('folder', 'card_id')]
+# source and updated_at only move when a merged value actually changes
+UPSERT_PAIR = f"""
+INSERT INTO pairs ({', '.join(PAIR_COLUMNS)}) VALUES ({', '.join('?' for _ in PAIR_COLUMNS)})
+ON CONFLICT (key) DO UPDATE SET
+    {', '.join(f"{name} = {value}" for name, value in _MERGED)},
+    source = excluded.source,
+    updated_at = excluded.updated_at
+WHERE {' OR '.join(f"{name} IS NOT {value}" for name, value in _MERGED)}
+"""
+UPSERT_PERSON = """
+INSERT INTO people (identity, name, email) VALUES (?, ?, ?)
+ON CONFLICT (identity) DO UPDATE SET
+    name = COALESCE(NULLIF(excluded.name, ''), name),
+    email = COALESCE(NULLIF(excluded.email, ''), email)
+WHERE name IS NOT COALESCE(NULLIF(excluded.name, ''), name)
+    OR email IS NOT COALESCE(NULLIF(excluded.email, ''), email)
+"""
+# List rows are upserted by position and the tail past the new length dropped,
+# so an unchanged list writes nothing
+UPSERT_LIST_ITEM = """
+INSERT INTO {table} (pair_key, position, text) VALUES (?, ?, ?)
+ON CONFLICT (pair_key, position) DO UPDATE SET text = excluded.text
+WHERE text IS NOT excluded.text
+"""
+SELECT_PAIRS = f"""
+SELECT p.{', p.'.join(PAIR_COLUMNS)}, mentor.name, mentor.email, mentee.name, mentee.email
+FROM pairs p
+JOIN people mentor ON mentor.identity = p.mentor
+JOIN people mentee ON mentee.identity = p.mentee
+"""
+
+
+def _person(name: str, email: str) -> Tuple[str, str, str]:
+    """People rows are keyed like pair identities: by email, or by name when there is none"""
+    return normalize_identity(email or name), name, email
+
+
+class PairStore:
+    """SQLite-backed store of pairs, people, meetings, deliverables and status history"""
+
+    def __init__(self, path: str = DEFAULT_STORE_FILE):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # The issue processor writes from its worker threads; the lock serializes them
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA foreign_keys = ON")
+            self.connection.execute("PRAGMA synchronous = NORMAL")
+            version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                raise ValueError(f"{path} has schema version {version}, expected {SCHEMA_VERSION}")
+            if version == 0:
+                self.connection.executescript(SCHEMA)
+                self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    def __enter__(self) -> 'PairStore':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # -- writing ----------------------------------------------------------
+
+    @timed('write')
+    def add_pairs(self, pairs: Iterable[Pair], source: str = '', index: Optional[PairIndex] = None) -> int:
+        """Insert or merge pairs in one transaction and return how many were given
+
+        `source` is recorded with each status change (e.g. 'roster',
+        'pairings', 'issue #12'). When an index is given, the pair's folder
+        and project card are copied from it, and a pair scanned from an
+        indexed folder is stored under the key of the pair that owns it.
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        people, rows, meetings, deliverables = {}, [], [], []
+        for pair in pairs:
+            key = pair_key(pair)
+            if index and pair.migration_source:
+                # Folder notes rarely carry emails; the index knows whose folder it is
+                key = index.folder_owner(pair.migration_source) or key
+            contact, program = pair.contact_info, pair.program_info
+            mentor = _person(pair.mentor, contact.mentor_email)
+            mentee = _person(pair.mentee, contact.mentee_email)
+            people[mentor[0]] = mentor
+            people[mentee[0]] = mentee
+            entry = (index.get(key) if index else None) or {}
+            rows.append((key, mentor[0], mentee[0], pair.progress, json.dumps(pair.goals, ensure_ascii=False),
+                         pair.last_updated, pair.migration_source)
+                        + tuple(getattr(program, name) for name in PROGRAM_COLUMNS)
+                        + tuple(getattr(contact, name) for name in CONTACT_COLUMNS)
+                        + (entry.get('folder'), entry.get('card_id'), source, now))
+            if pair.meetings:
+                meetings.append((key, pair.meetings))
+            if pair.deliverables:
+                deliverables.append((key, pair.deliverables))
+        if not rows:
+            return 0
+
+        with self.lock, self.connection:
+            execute = self.connection.executemany
+            execute(UPSERT_PERSON, people.values())
+            execute(UPSERT_PAIR, rows)
+            for table, lists in (('meetings', meetings), ('deliverables', deliverables)):
+                execute(f"DELETE FROM {table} WHERE pair_key = ? AND position >= ?",
+                        [(key, len(texts)) for key, texts in lists])
+                execute(UPSERT_LIST_ITEM.format(table=table),
+                        [(key, position, text) for key, texts in lists for position, text in enumerate(texts)])
+        return len(rows)
+
+    def sync_locations(self, index: PairIndex) -> int:
+        """Copy folders and card ids from the pair index onto stored pairs"""
+        rows = [(entry.get('folder'), entry.get('card_id'), key) for key, entry in index.entries.items()]
+        with self.lock, self.connection:
+            cursor = self.connection.executemany(
+                "UPDATE pairs SET folder = COALESCE(?, folder), card_id = COALESCE(?, card_id) WHERE key = ?", rows)
+        return cursor.rowcount
+
+    # -- reading ----------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Pair]:
+        pairs = self._select("WHERE p.key = ?", (key,))
+        return pairs[0] if pairs else None
+
+    def find(self, mentor: Optional[str] = None, mentee: Optional[str] = None, track: Optional[str] = None,
+             status: Optional[str] = None, limit: Optional[int] = None) -> List[Pair]:
+        """Pairs matching every given filter; people match by email or name, text ignores case"""
+        clauses, params = [], []
+        for column, person in (('mentor', mentor), ('mentee', mentee)):
+            if person:
+                clauses.append(f"p.{column} IN (SELECT identity FROM people "
+                               f"WHERE identity = ? OR name = ? COLLATE NOCASE)")
+                params += [normalize_identity(person), person.strip()]
+        if track:
+            clauses.append("p.program_track = ? COLLATE NOCASE")
+            params.append(track)
+        if status:
+            clauses.append("p.status = ? COLLATE NOCASE")
+            params.append(status)
+        sql = ("WHERE " + " AND ".join(clauses) if clauses else "") + " ORDER BY p.key"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return self._select(sql, params)
+
+    def count(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM pairs").fetchone()[0]
+
+    def status_counts(self, track: Optional[str] = None) -> Dict[str, int]:
+        """Number of pairs per status, optionally within one track"""
+        sql, params = "SELECT status, COUNT(*) FROM pairs", ()
+        if track:
+            sql, params = sql + " WHERE program_track = ? COLLATE NOCASE", (track,)
+        with self.lock:
+            return dict(self.connection.execute(sql + " GROUP BY status ORDER BY COUNT(*) DESC", params))
+
+    def history(self, key: str) -> List[Tuple[str, str, str]]:
+        """(status, changed_at, source) for every status a pair has had, oldest first"""
+        with self.lock:
+            return self.connection.execute(
+                "SELECT status, changed_at, source FROM status_history WHERE pair_key = ? ORDER BY rowid",
+                (key,)).fetchall()
+
+    def location(self, key: str) -> Dict:
+        """The folder and project card recorded for a pair"""
+        with self.lock:
+            row = self.connection.execute("SELECT folder, card_id FROM pairs WHERE key = ?", (key,)).fetchone()
+        return {"folder": row[0], "card_id": row[1]} if row else {}
+
+    def _select(self, where: str, params) -> List[Pair]:
+        with self.lock:
+            rows = self.connection.execute(SELECT_PAIRS + where, params).fetchall()
+            keys = [row[0] for row in rows]
+            lists = {'meetings': defaultdict(list), 'deliverables': defaultdict(list)}
+            for table, found in lists.items():
+                for start in range(0, len(keys), KEYS_PER_QUERY):
+                    chunk = keys[start:start + KEYS_PER_QUERY]
+                    for key, text in self.connection.execute(
+                            f"SELECT pair_key, text FROM {table} WHERE pair_key IN "
+                            f"({', '.join('?' for _ in chunk)}) ORDER BY pair_key, position", chunk):
+                        found[key].append(text)
+        return [self._pair(row, lists['meetings'][row[0]], lists['deliverables'][row[0]]) for row in rows]
+
+    @staticmethod
+    def _pair(row: tuple, meetings: List[str], deliverables: List[str]) -> Pair:
+        values = dict(zip(PAIR_COLUMNS, row))
+        mentor_name, mentor_email, mentee_name, mentee_email = row[len(PAIR_COLUMNS):]
+        contact_info = ContactInfo(mentor_email=mentor_email, mentee_email=mentee_email,
+                                   **{name: values[name] for name in CONTACT_COLUMNS})
+        program_info = ProgramInfo(**{name: values[name] for name in PROGRAM_COLUMNS})
+        return Pair(mentor_name, mentee_name, goals=json.loads(values['goals']), progress=values['status'],
+                    meetings=meetings, deliverables=deliverables, last_updated=values['last_updated'],
+                    contact_info=contact_info, program_info=program_info,
+                    migration_source=values['migration_source'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the local pair store')
+    parser.add_argument('--store-file', default=DEFAULT_STORE_FILE, help='SQLite pair store')
+    parser.add_argument('--mentor', help='Mentor email or name')
+    parser.add_argument('--mentee', help='Mentee email or name')
+    parser.add_argument('--track', help='Program track')
+    parser.add_argument('--status', help='Pair status (progress)')
+    parser.add_argument('--limit', type=int, help='Show at most this many pairs')
+    parser.add_argument('--counts', action='store_true', help='Print the number of pairs per status')
+    parser.add_argument('--history', metavar='KEY', help='Print the status history of a pair key')
+    parser.add_argument('--json', action='store_true', help='Print matching pairs as JSON Lines')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.store_file):
+        print(f"❌ No pair store at {args.store_file}; run create_pairs.py or a migration first")
+        return
+
+    with PairStore(args.store_file) as store:
+        if args.counts:
+            counts = store.status_counts(args.track)
+            print(f"📊 {sum(counts.values())} pairs" + (f" in {args.track}" if args.track else ""))
+            for status, count in counts.items():
+                print(f"- {status or '(none)'}: {count}")
+            return
+        if args.history:
+            for status, changed_at, source in store.history(args.history):
+                print(f"- {changed_at} {status or '(none)'} ({source or 'unknown source'})")
+            return
+        pairs = store.find(args.mentor, args.mentee, args.track, args.status, args.limit)
+        for pair in pairs:
+            if args.json:
+                print(pair.to_json())
+            else:
+                print(f"- {pair_key(pair)} {pair.mentor} ↔ {pair.mentee}: {pair.progress or '(none)'}")
+        if not args.json:
+            print(f"📋 {len(pairs)} pairs")
+
+
+if __name__ == '__main__':
+    main()
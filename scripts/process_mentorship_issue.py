@@ -7,192 +7,190 @@ and automatically creates project cards and folder structures.
 """
 
 import os
-import re
 import json
-import requests
 from datetime import datetime
 from typing import Dict, List, Optional
 import argparse
+import requests
+from instrumentation import timed
 from manage_mentorship_projects import MentorshipProjectManager
+from pair_model import Pair
+from pair_parser import parse_issue_body
+from pair_store import DEFAULT_STORE_FILE, PairStore
+from template_engine import render
 
 
 class MentorshipIssueProcessor:
     """Processes GitHub issues for mentorship pair creation"""
     
-    def __init__(self, owner: str, repo: str, token: str):
+    def __init__(self, owner: str, repo: str, token: str, store: Optional[PairStore] = None):
         self.owner = owner
         self.repo = repo
         self.token = token
-        self.headers = {
-            'Authorization': f'Bearer {token}',
-            'Accept': 'application/vnd.github+json',
-            'X-GitHub-Api-Version': '2022-11-28'
-        }
-        self.base_url = 'https://api.github.com'
         self.manager = MentorshipProjectManager(owner, repo, token)
+        self.client = self.manager.client
+        self.base_url = self.client.base_url
+        self.store = store
     
     def get_issue(self, issue_number: int) -> Dict:
         """Fetch issue details from GitHub API"""
         url = f"{self.base_url}/repos/{self.owner}/{self.repo}/issues/{issue_number}"
         
-        response = requests.get(url, headers=self.headers)
+        response = self.client.get(url)
         if response.status_code == 200:
             return response.json()
         else:
             print(f"❌ Failed to fetch issue #{issue_number}: {response.status_code}")
             return {}
     
-    def parse_mentorship_issue(self, issue_body: str) -> Optional[Dict]:
+    def search_mentorship_issues(self, since: Optional[str] = None) -> List[Dict]:
+        """Open "New Mentorship Pair" issues, optionally created on/after a date
+
+        Every page is read before returning: closing an issue shifts the later
+        pages of the is:open search, so processing while paging skips issues.
+        """
+        query = f'repo:{self.owner}/{self.repo} is:issue is:open in:title "New Mentorship Pair"'
+        if since:
+            query += f" created:>={since}"
+        
+        url = f"{self.base_url}/search/issues"
+        params = {"q": query, "sort": "created", "order": "asc"}
+        issues = []
+        try:
+            issues.extend(self.client.paginate(url, params, items_key='items'))
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else 'error'
+            print(f"❌ Failed to search issues: {status}")
+        return issues
+    
+    @timed('parse')
+    def parse_mentorship_issue(self, issue_body: str) -> Optional[Pair]:
         """Parse mentorship pair information from issue body"""
         if not issue_body:
             return None
         
-        pair_data = {
-            "mentor": "",
-            "mentee": "",
-            "goals": [],
-            "progress": "New pair from issue",
-            "meetings": [],
-            "deliverables": [],
-            "last_updated": datetime.now().isoformat()
-        }
+        pair = Pair(progress="New pair from issue", last_updated=datetime.now().isoformat())
         
-        # Parse mentor information
-        mentor_match = re.search(r'(?:\*\*mentor\*\*|mentor:)\s*(.+)', issue_body, re.IGNORECASE)
-        if mentor_match:
-            pair_data["mentor"] = mentor_match.group(1).strip()
-        
-        # Parse mentee information  
-        mentee_match = re.search(r'(?:\*\*mentee\*\*|mentee:)\s*(.+)', issue_body, re.IGNORECASE)
-        if mentee_match:
-            pair_data["mentee"] = mentee_match.group(1).strip()
-        
-        # Parse goals
-        goals_pattern = r'(?:\*\*goals?\*\*|goals?:)\s*\n((?:[-*]\s*.+\n?)+)'
-        goals_match = re.search(goals_pattern, issue_body, re.IGNORECASE)
-        if goals_match:
-            goals_text = goals_match.group(1)
-            goals = [line.strip('- *').strip() for line in goals_text.split('\n') if line.strip()]
-            pair_data["goals"] = [goal for goal in goals if goal]
-        
-        # Parse program track/focus area
-        track_match = re.search(r'(?:\*\*(?:track|focus|area)\*\*|(?:track|focus|area):)\s*(.+)', issue_body, re.IGNORECASE)
-        if track_match:
-            pair_data["program_track"] = track_match.group(1).strip()
-        
-        # Parse expected deliverables
-        deliverables_pattern = r'(?:\*\*deliverables?\*\*|deliverables?:)\s*\n((?:[-*]\s*.+\n?)+)'
-        deliverables_match = re.search(deliverables_pattern, issue_body, re.IGNORECASE)
-        if deliverables_match:
-            deliverables_text = deliverables_match.group(1)
-            deliverables = [line.strip('- *').strip() for line in deliverables_text.split('\n') if line.strip()]
-            pair_data["deliverables"] = [deliverable for deliverable in deliverables if deliverable]
-        
-        # Parse timeline/dates
-        start_date_match = re.search(r'(?:\*\*start\s*date\*\*|start\s*date:)\s*(.+)', issue_body, re.IGNORECASE)
-        if start_date_match:
-            pair_data["start_date"] = start_date_match.group(1).strip()
-        
-        end_date_match = re.search(r'(?:\*\*end\s*date\*\*|end\s*date:)\s*(.+)', issue_body, re.IGNORECASE)
-        if end_date_match:
-            pair_data["end_date"] = end_date_match.group(1).strip()
+        # Walk the body once, collecting every known field
+        pair.update(parse_issue_body(issue_body))
         
         # Validate we have minimum required information
-        if not pair_data["mentor"] or not pair_data["mentee"]:
+        if not pair.mentor or not pair.mentee:
             print("⚠️  Missing mentor or mentee information in issue")
             return None
         
-        return pair_data
+        return pair
     
     def find_mentorship_project(self) -> Optional[int]:
         """Find existing mentorship project or return None"""
-        projects = self.manager.list_projects()
-        
-        for project in projects:
-            if 'mentorship' in project['name'].lower():
-                return project['id']
-        
-        return None
+        return self.manager.find_mentorship_project()
     
-    def process_issue(self, issue_number: int) -> bool:
-        """Process a mentorship issue and create project card"""
+    def process_issue(self, issue_number: int, issue: Optional[Dict] = None) -> bool:
+        """Process a mentorship issue and create project card; pass `issue` to skip fetching it"""
         # Fetch issue
-        issue = self.get_issue(issue_number)
+        if issue is None:
+            issue = self.get_issue(issue_number)
         if not issue:
             return False
         
-        # Check if it's a mentorship-related issue
-        title = issue.get('title', '').lower()
-        if 'mentorship' not in title and 'mentor' not in title:
-            print(f"ℹ️  Issue #{issue_number} doesn't appear to be mentorship-related")
+        # Check and parse the issue
+        pair = self.extract_pair(issue_number, issue)
+        if not pair:
             return False
         
-        # Parse issue body
-        pair_data = self.parse_mentorship_issue(issue.get('body', ''))
-        if not pair_data:
-            print(f"❌ Could not parse mentorship information from issue #{issue_number}")
-            return False
-        
-        print(f"✅ Parsed mentorship pair: {pair_data['mentor']} ↔ {pair_data['mentee']}")
-        
         # Find or create project
-        project_id = self.find_mentorship_project()
+        project_id = self.ensure_project(self.find_mentorship_project())
         if not project_id:
-            print("📋 Creating new mentorship project...")
-            result = self.manager.create_mentorship_project("Mentorship 2025")
-            if result:
-                project_id = result.get('id')
-            else:
-                print("❌ Failed to create project")
-                return False
+            return False
         
         # Create project card
-        card_result = self.manager.create_mentorship_card(project_id, pair_data)
+        card_result = self.create_card(project_id, pair)
         if not card_result:
-            print("❌ Failed to create project card")
             return False
         
         # Generate folder structure
-        try:
-            folder_path = self.manager.generate_pair_folders(pair_data)
-            print(f"📁 Generated folder structure: {folder_path}")
-        except Exception as e:
-            print(f"⚠️  Failed to generate folders: {e}")
+        self.generate_folders(pair)
+        self.store_pair(issue_number, pair)
         
         # Add comment to issue
-        self.add_processing_comment(issue_number, pair_data, project_id, card_result.get('id'))
+        self.add_processing_comment(issue_number, pair, project_id, card_result.get('id'))
         
         # Close the issue if it was successfully processed
         self.close_issue(issue_number)
         
         return True
     
-    def add_processing_comment(self, issue_number: int, pair_data: Dict, project_id: int, card_id: int):
+    def extract_pair(self, issue_number: int, issue: Dict) -> Optional[Pair]:
+        """Check an issue is mentorship-related and parse its pair data"""
+        title = issue.get('title', '').lower()
+        if 'mentorship' not in title and 'mentor' not in title:
+            print(f"ℹ️  Issue #{issue_number} doesn't appear to be mentorship-related")
+            return None
+        
+        pair = self.parse_mentorship_issue(issue.get('body', ''))
+        if not pair:
+            print(f"❌ Could not parse mentorship information from issue #{issue_number}")
+            return None
+        
+        print(f"✅ Parsed mentorship pair: {pair.mentor} ↔ {pair.mentee}")
+        return pair
+    
+    def ensure_project(self, project_id: Optional[int]) -> Optional[int]:
+        """Return the given project id, creating the mentorship project if there is none"""
+        if project_id:
+            return project_id
+        
+        print("📋 Creating new mentorship project...")
+        result = self.manager.create_mentorship_project("Mentorship 2025")
+        if not result:
+            print("❌ Failed to create project")
+            return None
+        
+        project_id = result.get('id')
+        self.manager.remember_project(project_id)
+        return project_id
+    
+    def create_card(self, project_id: int, pair: Pair) -> Dict:
+        """Create the project card for a parsed pair, or update it if the pair already has one"""
+        card_id = self.manager.pair_index.card_for(pair)
+        if card_id:
+            card_result = self.manager.update_card(card_id, pair)
+            if card_result:
+                return card_result
+        card_result = self.manager.create_mentorship_card(project_id, pair)
+        if not card_result:
+            print("❌ Failed to create project card")
+            # The cached project may have been deleted; resolve it again next run
+            self.manager.forget_project()
+        return card_result
+    
+    def generate_folders(self, pair: Pair):
+        """Generate the pair's folder structure, reporting but not failing on errors"""
+        try:
+            folder_path = self.manager.generate_pair_folders(pair)
+            print(f"📁 Generated folder structure: {folder_path}")
+        except Exception as e:
+            print(f"⚠️  Failed to generate folders: {e}")
+    
+    def store_pair(self, issue_number: int, pair: Pair):
+        """Add the processed pair, with its folder and card, to the pair store"""
+        if self.store:
+            self.store.add_pairs([pair], f"issue #{issue_number}", self.manager.pair_index)
+    
+    def add_processing_comment(self, issue_number: int, pair: Pair, project_id: int, card_id: int):
         """Add a comment to the issue indicating successful processing"""
         url = f"{self.base_url}/repos/{self.owner}/{self.repo}/issues/{issue_number}/comments"
         
-        comment_body = f"""✅ **Mentorship Pair Successfully Processed**
-
-**Mentor**: {pair_data.get('mentor', 'Unknown')}
-**Mentee**: {pair_data.get('mentee', 'Unknown')}
-
-📋 **Project Card Created**: [View in Project](https://github.com/{self.owner}/{self.repo}/projects)
-🎯 **Goals**: {len(pair_data.get('goals', []))} goals identified
-📁 **Folder Structure**: Generated automatically
-
-## Next Steps
-1. Check the project card for tracking progress
-2. Review the generated folder structure in the repository
-3. Schedule initial mentor-mentee meeting
-4. Update project card with meeting notes and progress
-
----
-*This pair was automatically processed from this issue.*
-"""
+        comment_body = render('issue_comment.md',
+                              mentor=pair.mentor,
+                              mentee=pair.mentee,
+                              owner=self.owner,
+                              repo=self.repo,
+                              goal_count=len(pair.goals))
         
         data = {"body": comment_body}
         
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self.client.post(url, json=data)
         if response.status_code == 201:
             print(f"💬 Added processing comment to issue #{issue_number}")
         else:
@@ -207,21 +205,56 @@ class MentorshipIssueProcessor:
             "state_reason": "completed"
         }
         
-        response = requests.patch(url, headers=self.headers, json=data)
+        response = self.client.patch(url, json=data)
         if response.status_code == 200:
             print(f"🔒 Closed issue #{issue_number}")
         else:
             print(f"⚠️  Failed to close issue: {response.status_code}")
 
 
+def load_event_issue(event_path: str, issue_number: Optional[int] = None) -> Optional[Dict]:
+    """The issue from a GitHub Actions event payload (GITHUB_EVENT_PATH), if it has one
+
+    Returns None when the event carries no issue, or a different one than
+    `issue_number`, so the caller can fetch it from the API instead.
+    """
+    try:
+        with open(event_path, 'r', encoding='utf-8') as f:
+            event = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Could not read event payload {event_path}: {e}")
+        return None
+    issue = event.get('issue') if isinstance(event, dict) else None
+    if not isinstance(issue, dict) or not isinstance(issue.get('number'), int) or 'body' not in issue:
+        return None
+    if issue_number is not None and issue['number'] != issue_number:
+        return None
+    return issue
+
+
 def main():
     parser = argparse.ArgumentParser(description='Process mentorship issues')
     parser.add_argument('--owner', required=True, help='GitHub repository owner')
     parser.add_argument('--repo', required=True, help='GitHub repository name')
     parser.add_argument('--token', help='GitHub token (or set GITHUB_TOKEN env var)')
-    parser.add_argument('--issue-number', type=int, required=True, help='Issue number to process')
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--issue-number', type=int, help='Issue number to process')
+    target.add_argument('--all-open', action='store_true', help='Process every open mentorship issue')
+    target.add_argument('--since', help='Process open mentorship issues created on/after YYYY-MM-DD')
+    parser.add_argument('--event-path',
+                        help='GitHub Actions event payload (e.g. "$GITHUB_EVENT_PATH") to read the issue from '
+                             'instead of fetching it; the API is used if it has no matching issue')
+    parser.add_argument('--concurrency', type=int, default=4,
+                        help='Issues processed in parallel with --all-open/--since (default: 4)')
+    parser.add_argument('--refresh-cache', action='store_true', help='Ignore and rebuild cached project IDs')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Run independent API calls concurrently')
+    parser.add_argument('--store-file',
+                        help=f'SQLite pair store to add processed pairs to, e.g. {DEFAULT_STORE_FILE} (default: none)')
     
     args = parser.parse_args()
+    if not (args.issue_number or args.all_open or args.since or args.event_path):
+        parser.error('one of --issue-number, --all-open, --since or --event-path is required')
     
     # Get token from argument or environment
     token = args.token or os.getenv('GITHUB_TOKEN')
@@ -229,9 +262,32 @@ def main():
         print("❌ GitHub token required. Use --token argument or set GITHUB_TOKEN environment variable")
         return
     
-    processor = MentorshipIssueProcessor(args.owner, args.repo, token)
+    store = PairStore(args.store_file) if args.store_file else None
+    processor = MentorshipIssueProcessor(args.owner, args.repo, token, store)
+    if args.refresh_cache:
+        processor.manager.id_cache.invalidate()
+    
+    if args.all_open or args.since:
+        from async_issue_processor import process_backlog
+        process_backlog(processor, args.since, args.concurrency)
+        processor.manager.pair_index.save()
+        return
     
-    success = processor.process_issue(args.issue_number)
+    # The event payload already holds the issue; only fetch it when it doesn't
+    issue = load_event_issue(args.event_path, args.issue_number) if args.event_path else None
+    if issue:
+        args.issue_number = issue['number']
+        print(f"📥 Using issue #{args.issue_number} from the event payload")
+    elif not args.issue_number:
+        print(f"❌ No issue found in event payload {args.event_path}")
+        return
+    
+    if args.use_async:
+        from async_issue_processor import process_issue_async
+        success = process_issue_async(processor, args.issue_number, issue)
+    else:
+        success = processor.process_issue(args.issue_number, issue)
+    processor.manager.pair_index.save()
     if success:
         print(f"✅ Successfully processed issue #{args.issue_number}")
     else:
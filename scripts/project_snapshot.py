@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+ProjectV2 Board Snapshot
+
+A local mirror of a ProjectV2 board: every item with its title and field
+values, kept in .mentorship/project_snapshot.json. The first pull reads the
+whole board in one paginated GraphQL query. Later pulls first list only item
+ids and `updatedAt` stamps, then re-read just the new or changed items with
+`nodes(ids: [...])`. Reports ("which pairs are still Not Started?") and diffs
+against local pair data are answered from the file without touching the API.
+"""
+
+import json
+import os
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+import requests
+
+from github_client import get_client
+from instrumentation import timed
+from pair_identity import pair_key
+from pair_model import Pair
+
+DEFAULT_SNAPSHOT_FILE = ".mentorship/project_snapshot.json"
+SNAPSHOT_VERSION = 1
+NODES_PER_QUERY = 100
+# Stamps have one-second resolution, so items changed around the previous
+# pull (or under a skewed clock) are re-read once more to be safe
+SETTLE_SECONDS = 300
+ITEM_TITLE_SEPARATOR = ' → '
+
+ITEM_FIELDS = """
+      id
+      type
+      updatedAt
+      isArchived
+      content {
+        ... on DraftIssue { title }
+        ... on Issue { title number }
+        ... on PullRequest { title number }
+      }
+      fieldValues(first: 50) {
+        nodes {
+          ... on ProjectV2ItemFieldTextValue { text field { ... on ProjectV2FieldCommon { name } } }
+          ... on ProjectV2ItemFieldSingleSelectValue { name field { ... on ProjectV2FieldCommon { name } } }
+          ... on ProjectV2ItemFieldDateValue { date field { ... on ProjectV2FieldCommon { name } } }
+          ... on ProjectV2ItemFieldNumberValue { number field { ... on ProjectV2FieldCommon { name } } }
+        }
+      }
+"""
+
+FULL_QUERY = """
+query($project: ID!, $cursor: String) {
+  node(id: $project) {
+    ... on ProjectV2 {
+      items(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes {%s}
+      }
+    }
+  }
+}
+""" % ITEM_FIELDS
+
+STAMPS_QUERY = """
+query($project: ID!, $cursor: String) {
+  node(id: $project) {
+    ... on ProjectV2 {
+      items(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { id updatedAt }
+      }
+    }
+  }
+}
+"""
+
+NODES_QUERY = """
+query($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on ProjectV2Item {%s}
+  }
+}
+""" % ITEM_FIELDS
+
+PROJECT_QUERY = """
+query($project: ID!) {
+  node(id: $project) {
+    ... on ProjectV2 { id title number updatedAt }
+  }
+}
+"""
+
+
+def item_title(pair: Pair) -> str:
+    """Title of a pair's board item: 'mentor email → mentee email'"""
+    return f"{pair.contact_info.mentor_email}{ITEM_TITLE_SEPARATOR}{pair.contact_info.mentee_email}"
+
+
+def item_pair_key(title: str) -> Optional[str]:
+    """Pair key for an item titled 'mentor → mentee', or None for other items"""
+    if ITEM_TITLE_SEPARATOR.strip() not in title:
+        return None
+    mentor, mentee = (part.strip() for part in title.split(ITEM_TITLE_SEPARATOR.strip(), 1))
+    # Names and emails normalize the same way, so this matches pair_key() of the full pair
+    return pair_key(Pair(mentor, mentee))
+
+
+def _item_record(node: Dict) -> Dict:
+    """Flatten an item node to {id, type, title, updatedAt, archived, fields}"""
+    content = node.get('content') or {}
+    fields = {}
+    for value in (node.get('fieldValues') or {}).get('nodes', []):
+        name = ((value or {}).get('field') or {}).get('name')
+        if not name:
+            continue
+        for key in ('text', 'name', 'date', 'number'):
+            if key in value:
+                fields[name] = value[key]
+                break
+    return {
+        "id": node['id'],
+        "type": node.get('type'),
+        "title": content.get('title', ''),
+        "number": content.get('number'),
+        "updatedAt": node.get('updatedAt', ''),
+        "archived": bool(node.get('isArchived')),
+        "fields": fields
+    }
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class ProjectSnapshot:
+    """On-disk mirror of one ProjectV2 board's items and field values"""
+
+    def __init__(self, path: str = DEFAULT_SNAPSHOT_FILE):
+        self.path = path
+        self.data = self.load()
+
+    def load(self) -> Dict:
+        """Load the snapshot file, or start with an empty snapshot"""
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == SNAPSHOT_VERSION:
+                return data
+            print(f"⚠️  Ignoring project snapshot with unknown version: {self.path}")
+        return {"version": SNAPSHOT_VERSION, "project": None, "pulled_at": None, "items": {}}
+
+    @timed('write')
+    def save(self):
+        """Atomically write the snapshot file"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_file = f"{self.path}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, self.path)
+
+    @property
+    def project(self) -> Optional[Dict]:
+        return self.data['project']
+
+    @property
+    def items(self) -> Dict[str, Dict]:
+        return self.data['items']
+
+    # -- pulling ----------------------------------------------------------
+
+    def pull(self, project_id: str, token: str, owner: str = '', repo: str = '') -> Dict:
+        """Bring the snapshot up to date with the board; returns what changed
+
+        Raises requests.HTTPError if the board cannot be read.
+        """
+        client = get_client(token)
+        pulled_at = _now()
+        project = self._query(client, PROJECT_QUERY, {"project": project_id}).get('node')
+        if not project:
+            raise requests.HTTPError(f"ProjectV2 {project_id} not found")
+
+        if not self.project or self.project['id'] != project_id:
+            # First pull of this board: everything in one paginated query
+            items = {}
+            for node in client.paginate_graphql(FULL_QUERY, {"project": project_id}, ("node", "items")):
+                items[node['id']] = _item_record(node)
+            stats = {"fetched": len(items), "removed": 0, "unchanged": 0}
+        else:
+            items = dict(self.items)
+            stamps = {node['id']: node['updatedAt'] for node in
+                      client.paginate_graphql(STAMPS_QUERY, {"project": project_id}, ("node", "items"))}
+            settled = (datetime.strptime(self.data['pulled_at'], '%Y-%m-%dT%H:%M:%SZ')
+                       - timedelta(seconds=SETTLE_SECONDS)).strftime('%Y-%m-%dT%H:%M:%SZ')
+            changed = [item_id for item_id, updated in stamps.items()
+                       if item_id not in items or items[item_id]['updatedAt'] != updated or updated >= settled]
+            removed = [item_id for item_id in items if item_id not in stamps]
+            for item_id in removed:
+                del items[item_id]
+            for start in range(0, len(changed), NODES_PER_QUERY):
+                chunk = changed[start:start + NODES_PER_QUERY]
+                nodes = self._query(client, NODES_QUERY, {"ids": chunk}).get('nodes') or []
+                for item_id, node in zip(chunk, nodes):
+                    if node:
+                        items[item_id] = _item_record(node)
+                    else:
+                        # Deleted between the two queries
+                        items.pop(item_id, None)
+            stats = {"fetched": len(changed), "removed": len(removed), "unchanged": len(stamps) - len(changed)}
+
+        self.data['project'] = {"id": project['id'], "title": project.get('title', ''),
+                                "number": project.get('number'), "owner": owner, "repo": repo}
+        self.data['pulled_at'] = pulled_at
+        self.data['items'] = items
+        return stats
+
+    @staticmethod
+    def _query(client, query: str, variables: Dict) -> Dict:
+        response = client.graphql(query, variables)
+        response.raise_for_status()
+        result = response.json()
+        if result.get('errors') and not result.get('data'):
+            raise requests.HTTPError(f"GraphQL errors: {result['errors']}", response=response)
+        return result.get('data') or {}
+
+    # -- questions answered from the snapshot -----------------------------
+
+    def find_project(self, owner: str, repo: str, title: str) -> Optional[str]:
+        """The snapshot's board id if it is owner/repo's board titled `title`"""
+        project = self.project
+        if project and project['owner'] == owner and project['repo'] == repo and \
+                title.lower() in project['title'].lower():
+            return project['id']
+        return None
+
+    def field_counts(self, field: str = 'Status') -> Counter:
+        """Number of active items per value of a field ('(none)' when unset)"""
+        return Counter(item['fields'].get(field, '(none)') for item in self.items.values() if not item['archived'])
+
+    def items_where(self, field: str, value: str) -> List[Dict]:
+        """Active items whose field has the given value ('(none)' for unset), by title"""
+        matches = [item for item in self.items.values()
+                   if not item['archived'] and str(item['fields'].get(field, '(none)')) == value]
+        return sorted(matches, key=lambda item: item['title'])
+
+    def diff(self, pairs: Iterable[Pair]) -> Dict[str, List]:
+        """Compare local pairs with the board: pairs without an item, items without a pair"""
+        on_board = {}
+        for item in self.items.values():
+            key = item_pair_key(item['title'])
+            if key and not item['archived']:
+                on_board[key] = item
+        local = {pair_key(pair): pair for pair in pairs}
+        return {
+            "missing": [pair for key, pair in local.items() if key not in on_board],
+            "extra": sorted((item for key, item in on_board.items() if key not in local),
+                            key=lambda item: item['title']),
+            "matched": [key for key in local if key in on_board]
+        }
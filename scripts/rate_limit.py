@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+GitHub Rate-Limit Scheduler
+
+Paces REST and GraphQL calls with token buckets sized to GitHub's documented
+secondary limits, tracks the primary budget reported in `X-RateLimit-*`
+headers and the GraphQL `rateLimit { cost remaining resetAt }` object, and
+decides when and how long to wait before retrying a rate-limited request.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+import requests
+
+# GitHub secondary limits: 900 points/minute for REST (reads cost 1 point,
+# writes 5) and 80 content-creating requests per minute.
+POINTS_PER_MINUTE = 900
+WRITES_PER_MINUTE = 80
+READ_COST = 1
+WRITE_COST = 5
+
+READ_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+RETRYABLE_SERVER_ERRORS = {502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers reserve tokens and sleep off any deficit"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self, cost: float = 1.0) -> float:
+        """Take `cost` tokens and return how long the caller must wait first"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= cost
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateLimitScheduler:
+    """Shared pacing, budget tracking and retry policy for GitHub requests"""
+
+    def __init__(self, points_per_minute: float = POINTS_PER_MINUTE,
+                 writes_per_minute: float = WRITES_PER_MINUTE,
+                 max_retries: int = 5, base_delay: float = 2.0, max_delay: float = 120.0,
+                 burst_seconds: float = 7.5):
+        # Buckets start full and allow `burst_seconds` worth of requests at once
+        self.points = TokenBucket(points_per_minute / 60, max(WRITE_COST, points_per_minute / 60 * burst_seconds))
+        self.writes = TokenBucket(writes_per_minute / 60, max(1.0, writes_per_minute / 60 * burst_seconds))
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        # Primary budget per resource ("core", "graphql", "search", ...)
+        self.budget: Dict[str, Dict[str, float]] = {}
+        self.lock = threading.Lock()
+
+    # -- pacing ---------------------------------------------------------
+
+    def acquire(self, method: str, resource: str = 'core', mutation: bool = False):
+        """Block until a request of this kind may be sent"""
+        write = mutation or (resource != 'graphql' and method.upper() not in READ_METHODS)
+        wait = self.points.reserve(WRITE_COST if write else READ_COST)
+        if write:
+            wait = max(wait, self.writes.reserve(1))
+        wait = max(wait, self._budget_wait(resource))
+        if wait > 0:
+            time.sleep(wait)
+
+    def _budget_wait(self, resource: str) -> float:
+        with self.lock:
+            budget = self.budget.get(resource)
+            if not budget or budget['remaining'] > 0:
+                return 0.0
+            return max(0.0, budget['reset'] - time.time())
+
+    # -- budget tracking ------------------------------------------------
+
+    def observe(self, response: requests.Response):
+        """Record the primary budget reported by a response"""
+        headers = response.headers
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        resource = headers.get('X-RateLimit-Resource', 'core')
+        with self.lock:
+            self.budget[resource] = {'remaining': float(remaining), 'reset': float(reset)}
+
+    def observe_graphql(self, rate_limit: Dict):
+        """Record a GraphQL `rateLimit { cost remaining resetAt }` object"""
+        if not rate_limit or 'remaining' not in rate_limit:
+            return
+        reset = time.time() + 3600
+        if rate_limit.get('resetAt'):
+            reset = datetime.fromisoformat(rate_limit['resetAt'].replace('Z', '+00:00')).timestamp()
+        with self.lock:
+            self.budget['graphql'] = {'remaining': float(rate_limit['remaining']), 'reset': reset}
+
+    # -- retries --------------------------------------------------------
+
+    def should_retry(self, method: str, response: requests.Response) -> bool:
+        """Whether the response is a rate limit (or transient error) worth retrying"""
+        status = response.status_code
+        if status == 429:
+            return True
+        if status == 403:
+            if 'Retry-After' in response.headers or response.headers.get('X-RateLimit-Remaining') == '0':
+                return True
+            return b'rate limit' in response.content.lower()
+        if status == 200 and b'"RATE_LIMITED"' in response.content:
+            # GraphQL reports primary limit exhaustion as a 200 with an error
+            return True
+        # Only replay idempotent requests on server errors so cards are never duplicated
+        return status in RETRYABLE_SERVER_ERRORS and method.upper() in READ_METHODS
+
+    def retry_delay(self, response: Optional[requests.Response], attempt: int) -> float:
+        """Seconds to wait before retry number `attempt` (0-based)"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    pass
+            if response.headers.get('X-RateLimit-Remaining') == '0' and response.headers.get('X-RateLimit-Reset'):
+                return max(0.0, float(response.headers['X-RateLimit-Reset']) - time.time()) + 1
+        return self.backoff(attempt)
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(ceiling / 2, ceiling)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Incremental Pair Sync
+
+Keeps GitHub Project cards in step with local pair data without re-creating
+every card on each run. A state file maps each pair to its card id and a hash
+of the rendered card content; a sync only creates cards for new pairs and
+updates cards whose content changed, so its cost scales with the number of
+changes rather than the size of the cohort.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from instrumentation import timed
+from manage_mentorship_projects import MentorshipProjectManager
+from pair_identity import pair_key
+from pair_model import Pair
+
+DEFAULT_STATE_FILE = ".mentorship/sync_state.json"
+STATE_VERSION = 2
+SAVE_EVERY = 25
+
+
+class PairSyncEngine:
+    """Creates or updates only the project cards whose pair content changed"""
+
+    def __init__(self, manager: MentorshipProjectManager, state_file: str = DEFAULT_STATE_FILE):
+        self.manager = manager
+        self.state_file = state_file
+        self.state = self.load_state()
+
+    def load_state(self) -> Dict:
+        """Load the sync state file, or start with an empty state"""
+        if os.path.exists(self.state_file):
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') == STATE_VERSION:
+                return state
+            if state.get('version') == 1:
+                # Version 1 keyed pairs by 'mentor|mentee'; rekey to canonical pair keys
+                state['pairs'] = {
+                    pair_key(Pair(*key.split('|', 1))): entry
+                    for key, entry in state['pairs'].items()
+                }
+                state['version'] = STATE_VERSION
+                return state
+            print(f"⚠️  Ignoring sync state with unknown version: {self.state_file}")
+        return {"version": STATE_VERSION, "project_id": None, "pairs": {}}
+
+    @timed('write')
+    def save_state(self):
+        """Atomically write the sync state file"""
+        directory = os.path.dirname(self.state_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, self.state_file)
+
+    @staticmethod
+    def pair_key(pair: Pair) -> str:
+        """Key identifying a pair across runs"""
+        return pair_key(pair)
+
+    def content_hash(self, pair: Pair) -> str:
+        """Hash of the card content, ignoring the volatile last-updated stamp"""
+        content = self.manager._format_card_content(pair, last_updated='')
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def plan(self, pairs: List[Pair]) -> Tuple[List[Tuple[str, Pair, str]], List[Tuple[str, Pair, str]], int]:
+        """Split pairs into (new, changed, unchanged count) against the stored state"""
+        known = self.state['pairs']
+        new, changed, unchanged = [], [], 0
+        seen = set()
+
+        for pair in pairs:
+            key = self.pair_key(pair)
+            if key in seen:
+                continue
+            seen.add(key)
+            digest = self.content_hash(pair)
+            entry = known.get(key)
+            if not entry:
+                # A card made elsewhere (e.g. from an issue) is updated rather than duplicated
+                card_id = self.manager.pair_index.card_for(pair)
+                if card_id:
+                    known[key] = {"card_id": card_id, "hash": None}
+                    changed.append((key, pair, digest))
+                else:
+                    new.append((key, pair, digest))
+            elif entry.get('hash') != digest:
+                changed.append((key, pair, digest))
+            else:
+                unchanged += 1
+
+        return new, changed, unchanged
+
+    def sync(self, project_id: int, pairs: List[Pair], concurrency: int = 1) -> Dict:
+        """Push new and changed pairs to the project and persist the new state"""
+        if self.state.get('project_id') not in (None, project_id):
+            print(f"⚠️  Sync state belongs to project {self.state['project_id']}; starting fresh for {project_id}")
+            self.state['pairs'] = {}
+        self.state['project_id'] = project_id
+
+        new, changed, unchanged = self.plan(pairs)
+        print(f"🔄 Sync plan: {len(new)} new, {len(changed)} changed, {unchanged} unchanged")
+
+        def push(item: Tuple[str, Pair, str]) -> Tuple[str, Pair, str, Dict]:
+            key, pair, digest = item
+            entry = self.state['pairs'].get(key)
+            if entry:
+                result = self.manager.update_card(entry['card_id'], pair)
+            else:
+                result = self.manager.create_mentorship_card(project_id, pair)
+            return key, pair, digest, result
+
+        summary = {"created": 0, "updated": 0, "unchanged": unchanged, "failed": 0}
+        self.manager.client.ensure_pool_size(concurrency)
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            for key, pair, digest, result in executor.map(push, new + changed):
+                if not result:
+                    summary["failed"] += 1
+                    continue
+                entry = self.state['pairs'].get(key)
+                summary["updated" if entry else "created"] += 1
+                card_id = result.get('id') or entry['card_id']
+                self.state['pairs'][key] = {"card_id": card_id, "hash": digest}
+                # Checkpoint so an interrupted run never re-creates cards it already made
+                if (summary["created"] + summary["updated"]) % SAVE_EVERY == 0:
+                    self.save_state()
+
+        self.save_state()
+        self.manager.pair_index.save()
+
+        print(f"✅ Sync complete: {summary['created']} created, {summary['updated']} updated, "
+              f"{summary['unchanged']} unchanged, {summary['failed']} failed")
+        return summary
+
+    def known_project_id(self) -> Optional[int]:
+        """Project id recorded by the last sync, if any"""
+        return self.state.get('project_id')
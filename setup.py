@@ -45,8 +45,10 @@ def check_github_token():
         'Accept': 'application/vnd.github+json'
     }
     
+    api_url = os.getenv('GITHUB_API_URL', 'https://api.github.com').rstrip('/')
+    
     try:
-        response = requests.get('https://api.github.com/user', headers=headers)
+        response = requests.get(f'{api_url}/user', headers=headers)
         if response.status_code == 200:
             user_info = response.json()
             print(f"✅ GitHub token valid - authenticated as {user_info.get('login')}")
@@ -63,7 +65,8 @@ def test_scripts():
     scripts = [
         'scripts/manage_mentorship_projects.py',
         'scripts/migrate_pairings_to_projects.py', 
-        'scripts/process_mentorship_issue.py'
+        'scripts/process_mentorship_issue.py',
+        'scripts/mock_github_server.py'
     ]
     
     print("🔍 Testing script compilation...")
@@ -78,11 +81,26 @@ def test_scripts():
     return True
 
 def create_demo_project():
-    """Create a demo project to test functionality"""
+    """Create a demo project and card against the local mock GitHub API"""
     print("🎯 Creating demo project...")
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+    from github_client import get_client
+    from manage_mentorship_projects import MentorshipProjectManager
+    from mock_github_server import MockGitHubServer
+    from pair_model import load_pairs
+    
+    # No token or network needed: the scripts run unchanged against a local stand-in
+    with MockGitHubServer() as server:
+        get_client('mock-demo-token', base_url=server.url)
+        manager = MentorshipProjectManager('demo', 'demo', 'mock-demo-token')
+        project = manager.create_mentorship_project("Mentorship Demo")
+        card = manager.create_mentorship_card(project.get('id'), load_pairs('templates/pair_template.json')[0]) \
+            if project else {}
     
-    # This would normally call the GitHub API, but for demo we'll just simulate
-    print("  📋 Demo project creation simulated")
+    if not card:
+        print("  ❌ Demo project creation failed")
+        return False
+    print(f"  📋 Demo project {project['id']} with card {card['id']} created on the mock GitHub API")
     print("  📁 Demo folder structure can be generated with: make demo-folders")
     print("  📝 Demo migration can be tested with: make migrate-demo")
     
@@ -128,12 +146,12 @@ def main():
         sys.exit(1)
     
     # Check GitHub token (optional)
-    has_token = check_github_token()
+    if not check_github_token():
+        print("⚠️  Skipping live GitHub API checks (no token)")
     
-    if has_token:
-        create_demo_project()
-    else:
-        print("⚠️  Skipping GitHub API tests (no token)")
+    # Exercised against the local mock API, so it runs with or without a token
+    if not create_demo_project():
+        sys.exit(1)
     
     print("\n✅ Setup completed successfully!")
     show_next_steps()